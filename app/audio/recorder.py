@@ -6,16 +6,26 @@ from core import AUDIO_DIR, ensure_directories
 
 
 class AudioRecorder:
-    """Captures audio from microphone and saves to file."""
+    """Captures audio from microphone and saves to file.
 
-    def __init__(self, sample_rate=16000, channels=1, dtype="int16"):
+    With ``idle_release`` the input stream outlives a recording by that many
+    seconds (forever if None), so the next ``start()`` only flips the flag
+    the callback checks instead of opening the device again. The default of
+    0 closes it as soon as recording stops.
+    """
+
+    def __init__(self, sample_rate=16000, channels=1, dtype="int16", idle_release=0):
         self.sample_rate = sample_rate
         self.channels = channels
         self.dtype = dtype
+        self.idle_release = idle_release
         self._is_recording = False
         self._audio_buffer = []
         self._stream = None
         self._lock = threading.Lock()
+        # Guards opening and closing the stream; the callback never takes it.
+        self._stream_lock = threading.Lock()
+        self._release_timer = None
         self._sd = None
 
     def _get_sounddevice(self):
@@ -39,16 +49,19 @@ class AudioRecorder:
 
         ensure_directories()
         self._audio_buffer = []
-        self._is_recording = True
-
-        sd = self._get_sounddevice()
-        self._stream = sd.InputStream(
-            samplerate=self.sample_rate,
-            channels=self.channels,
-            dtype=self.dtype,
-            callback=self._audio_callback,
-        )
-        self._stream.start()
+
+        with self._stream_lock:
+            self._cancel_release()
+            if self._stream is None:
+                sd = self._get_sounddevice()
+                self._stream = sd.InputStream(
+                    samplerate=self.sample_rate,
+                    channels=self.channels,
+                    dtype=self.dtype,
+                    callback=self._audio_callback,
+                )
+                self._stream.start()
+            self._is_recording = True
         return True
 
     def stop(self) -> Path | None:
@@ -58,10 +71,15 @@ class AudioRecorder:
 
         self._is_recording = False
 
-        if self._stream:
-            self._stream.stop()
-            self._stream.close()
-            self._stream = None
+        with self._stream_lock:
+            if self.idle_release == 0:
+                self._close_stream()
+            elif self.idle_release is not None:
+                self._release_timer = threading.Timer(
+                    self.idle_release, self._release_idle
+                )
+                self._release_timer.daemon = True
+                self._release_timer.start()
 
         if not self._audio_buffer:
             return None
@@ -88,3 +106,30 @@ class AudioRecorder:
     def is_recording(self) -> bool:
         """Check if currently recording."""
         return self._is_recording
+
+    def close(self):
+        """Release the microphone (stopping any recording first)."""
+        self.stop()
+        with self._stream_lock:
+            self._cancel_release()
+            self._close_stream()
+
+    def _close_stream(self):
+        if self._stream:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+
+    def _cancel_release(self):
+        if self._release_timer is not None:
+            self._release_timer.cancel()
+            self._release_timer = None
+
+    def _release_idle(self):
+        """Close the warm stream once nobody has recorded for idle_release."""
+        with self._stream_lock:
+            # A recording since this timer was set replaced or cleared it.
+            if threading.current_thread() is not self._release_timer:
+                return
+            self._release_timer = None
+            self._close_stream()
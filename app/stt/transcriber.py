@@ -1,6 +1,8 @@
 from pathlib import Path
 from typing import Optional
 import sys
+import threading
+import weakref
 
 from core import WHISPER_MODEL
 
@@ -16,6 +18,63 @@ def get_model_path():
     return WHISPER_MODEL
 
 
+# Whisper models loaded in this process, by (model, device, compute type).
+# A Transcriber is created for every recording; the model it loads stays
+# here after it is gone, so the next recording does not read it from disk
+# again. unload_models() frees models nothing is using.
+_models = {}
+_models_lock = threading.Lock()
+
+
+def acquire_model(model_size: str, compute_type: str = "int8"):
+    """Get a shared Whisper model as ``(key, model)``, loading it once."""
+    key = (str(model_size), "cpu", compute_type)
+    with _models_lock:
+        entry = _models.setdefault(
+            key, {"model": None, "refs": 0, "lock": threading.Lock()}
+        )
+        entry["refs"] += 1
+
+    try:
+        with entry["lock"]:
+            if entry["model"] is None:
+                from faster_whisper import WhisperModel
+
+                entry["model"] = WhisperModel(
+                    key[0], device=key[1], compute_type=key[2]
+                )
+    except BaseException:
+        release_model(key, unload=True)
+        raise
+    return key, entry["model"]
+
+
+def release_model(key: tuple, unload: bool = False):
+    """Give up a reference from ``acquire_model``, dropping the model if
+    ``unload`` and nothing else uses it."""
+    with _models_lock:
+        entry = _models.get(key)
+        if entry is None:
+            return
+        if entry["refs"] > 0:
+            entry["refs"] -= 1
+        if unload and not entry["refs"]:
+            del _models[key]
+
+
+def unload_models() -> int:
+    """Drop every loaded model no Transcriber uses. Returns how many."""
+    with _models_lock:
+        idle = [
+            key
+            for key, entry in _models.items()
+            if not entry["refs"] and entry["model"] is not None
+        ]
+        for key in idle:
+            del _models[key]
+    return len(idle)
+
+
 class Transcriber:
     """Handles speech-to-text transcription using faster-whisper."""
 
@@ -24,17 +83,25 @@ class Transcriber:
             model_size = get_model_path()
         self.model_size = model_size
         self._model = None
+        self._release = None
 
     def _get_model(self):
-        """Lazy load the Whisper model."""
+        """Lazy load the Whisper model from the shared registry."""
         if self._model is None:
-            from faster_whisper import WhisperModel
-
-            self._model = WhisperModel(
-                self.model_size, device="cpu", compute_type="int8"
-            )
+            key, model = acquire_model(self.model_size)
+            self._release = weakref.finalize(self, release_model, key)
+            self._model = model
         return self._model
 
+    def unload(self):
+        """Release the model, unloading it if no other Transcriber uses it."""
+        detached = self._release.detach() if self._release is not None else None
+        if detached is not None:
+            _, _, args, _ = detached
+            release_model(*args, unload=True)
+        self._release = None
+        self._model = None
+
     def transcribe(self, audio_path: str) -> str:
         """
         Transcribe audio file to text.
@@ -25,9 +25,9 @@ class TrayIcon:
     def __init__(self, on_audio_ready: Callable[[str], None] = None):
         self.on_audio_ready = on_audio_ready
         self.state = TrayState.IDLE
-        self.recorder = AudioRecorder()
-        self.hotkey = HotkeyManager()
         self.config = get_config()
+        self.recorder = AudioRecorder(idle_release=self.config.mic_idle_release_seconds)
+        self.hotkey = HotkeyManager()
         self._icon = None
         self._thread = None
         self._pystray = None
@@ -144,7 +144,6 @@ class TrayIcon:
     def stop(self):
         """Stop the tray icon and cleanup."""
         self.hotkey.unregister()
-        if self.recorder.is_recording():
-            self.recorder.stop()
+        self.recorder.close()
         if self._icon:
             self._icon.stop()
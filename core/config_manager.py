@@ -10,6 +10,7 @@ DEFAULT_CONFIG = {
     "llm_enabled": True,
     "daily_summary_hour": 17,
     "daily_summary_minute": 0,
+    "mic_idle_release_seconds": 60,
 }
 
 
@@ -72,6 +73,11 @@ class ConfigManager:
         """Get daily summary minute."""
         return self.get("daily_summary_minute", 0)
 
+    @property
+    def mic_idle_release_seconds(self) -> Optional[float]:
+        """Seconds the mic stays open after a recording (None: until exit)."""
+        return self.get("mic_idle_release_seconds", 60)
+
 
 def get_config() -> ConfigManager:
     """Get the global config manager instance."""
@@ -1,8 +1,8 @@
 from typing import Optional
-import httpx
 
 OLLAMA_HOST = "http://localhost:11434"
 OLLAMA_MODEL = "granite4:3b"
+OLLAMA_KEEP_ALIVE = "30m"
 
 
 class LLMClient:
@@ -16,6 +16,8 @@ class LLMClient:
     def _get_client(self):
         """Get or create HTTP client."""
         if self._client is None:
+            import httpx
+
             self._client = httpx.Client(timeout=120.0)
         return self._client
 
@@ -38,6 +40,24 @@ class LLMClient:
         result = response.json()
         return result.get("response", "")
 
+    def warmup(self, keep_alive: str = OLLAMA_KEEP_ALIVE) -> None:
+        """Load the model into memory without generating anything.
+
+        Ollama treats a request with an empty prompt as a load request and
+        keeps the model resident for ``keep_alive``.
+        """
+        client = self._get_client()
+
+        payload = {
+            "model": self.model,
+            "prompt": "",
+            "stream": False,
+            "keep_alive": keep_alive,
+        }
+
+        response = client.post(f"{self.host}/api/generate", json=payload)
+        response.raise_for_status()
+
     async def query_async(
         self, prompt: str, system_prompt: Optional[str] = None
     ) -> str:
@@ -0,0 +1,149 @@
+"""
+Lossless FLAC archiving of finished recordings.
+
+Recordings are written as raw WAV so capture stays cheap and crash-safe;
+once a file has been transcribed it is re-encoded to FLAC, about a third
+of the WAV's size for speech, and the WAV is removed. Encoding uses PyAV,
+which faster-whisper already depends on and which also decodes FLAC, so
+archived files can be transcribed again as they are.
+"""
+
+import os
+import queue
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+# FLAC levels run 0 (fastest) to 8 (smallest); 5 is libFLAC's own default.
+# scripts/bench_archive.py on 7.5 minutes of 16 kHz mono speech with PyAV
+# 18.1 (one Xeon core): level 0 kept 38.4% of the WAV bytes, 2 kept 36.2%,
+# 5 kept 33.2% and 8 kept 33.0%. Every level took 50-110 ms of CPU per
+# minute of audio, and run-to-run noise was larger than the gaps between
+# levels, so 8 saves almost nothing over 5 and 0 buys no measurable speed.
+FLAC_COMPRESSION_LEVEL = 5
+
+
+def encode_flac(
+    wav_path,
+    compression_level: int = FLAC_COMPRESSION_LEVEL,
+    output=None,
+    remove_source: bool = True,
+) -> Path:
+    """Encode a WAV file to FLAC and return the new path.
+
+    The FLAC is written beside the source under a temporary name and renamed
+    into place when complete, so an interrupted encode never leaves a
+    truncated archive and never loses the WAV.
+    """
+    import av
+
+    wav_path = Path(wav_path)
+    output = Path(output) if output else wav_path.with_suffix(".flac")
+    partial = output.with_name(output.name + ".part")
+
+    try:
+        with av.open(str(wav_path)) as source:
+            in_stream = source.streams.audio[0]
+            with av.open(str(partial), "w", format="flac") as target:
+                out_stream = target.add_stream(
+                    "flac",
+                    rate=in_stream.rate,
+                    layout=in_stream.layout.name,
+                    format=in_stream.format.name,
+                    options={"compression_level": str(compression_level)},
+                )
+                for frame in source.decode(in_stream):
+                    frame.pts = None
+                    target.mux(out_stream.encode(frame))
+                target.mux(out_stream.encode(None))
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+
+    os.replace(partial, output)
+    if remove_source and output != wav_path:
+        wav_path.unlink(missing_ok=True)
+    return output
+
+
+def archive_recording(audio_path) -> Path | None:
+    """Compress a transcribed WAV recording; returns None if it was left as is."""
+    audio_path = Path(audio_path)
+    if audio_path.suffix.lower() != ".wav" or not audio_path.exists():
+        return None
+
+    try:
+        return encode_flac(audio_path)
+    except ImportError:
+        # No PyAV: keep the WAV rather than fail the transcription.
+        return None
+
+
+def spawn_archive_process(audio_path) -> None:
+    """Archive a recording from a detached ``--archive`` process.
+
+    One-shot CLI commands exit as soon as they print their result, which
+    would kill an encoder thread; a separate process outlives them.
+    """
+    from ..utils.import_profile import engine_entry
+
+    entry, cwd = engine_entry()
+    kwargs = {}
+    if sys.platform == "win32":
+        kwargs["creationflags"] = (
+            subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+        )
+    else:
+        kwargs["start_new_session"] = True
+
+    subprocess.Popen(
+        [sys.executable, *entry, "--archive", str(audio_path)],
+        cwd=cwd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        **kwargs,
+    )
+
+
+class ArchiveEncoder:
+    """Encodes recordings to FLAC one at a time on a background thread.
+
+    Used by the daemon, which lives long enough to finish the queue, and by
+    batch transcription, which closes it before exiting.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="archive-encoder", daemon=True
+        )
+        self._thread.start()
+        self.archived = []
+        self.errors = []
+
+    def _run(self) -> None:
+        while True:
+            audio_path = self._queue.get()
+            if audio_path is None:
+                return
+            try:
+                archived = archive_recording(audio_path)
+            except Exception as e:
+                self.errors.append((str(audio_path), str(e)))
+            else:
+                if archived:
+                    self.archived.append(archived)
+
+    def submit(self, audio_path) -> None:
+        """Queue a transcribed recording for compression."""
+        self._queue.put(Path(audio_path))
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def close(self, timeout: float | None = None) -> None:
+        """Finish queued encodes and stop the thread."""
+        self._queue.put(None)
+        self._thread.join(timeout)
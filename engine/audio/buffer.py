@@ -0,0 +1,102 @@
+import numpy as np
+
+
+class SampleBuffer:
+    """Preallocated sample storage that grows geometrically.
+
+    Blocks are copied straight into one array, so reading the recording back
+    is a slice of that array rather than a concatenation of chunk copies.
+    """
+
+    def __init__(self, channels: int = 1, dtype="int16", initial_frames: int = 0):
+        self.channels = channels
+        self.dtype = np.dtype(dtype)
+        self._data = np.empty((max(initial_frames, 1), channels), dtype=self.dtype)
+        self._frames = 0
+
+    def __len__(self) -> int:
+        return self._frames
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    def _reserve(self, frames: int) -> None:
+        """Make room for ``frames`` in total, at least doubling when growing."""
+        if frames <= len(self._data):
+            return
+
+        grown = np.empty(
+            (max(frames, 2 * len(self._data)), self.channels), dtype=self.dtype
+        )
+        grown[: self._frames] = self._data[: self._frames]
+        self._data = grown
+
+    def append(self, block: np.ndarray) -> None:
+        """Copy a ``(frames, channels)`` block onto the end of the buffer."""
+        frames = len(block)
+        self._reserve(self._frames + frames)
+        self._data[self._frames : self._frames + frames] = block
+        self._frames += frames
+
+    def view(self, start: int = 0, stop: int | None = None) -> np.ndarray:
+        """Get the recorded frames without copying them."""
+        if stop is None:
+            stop = self._frames
+        return self._data[start:stop]
+
+    def clear(self) -> None:
+        """Forget the recorded frames but keep the allocation."""
+        self._frames = 0
+
+    def discard(self, frames: int) -> None:
+        """Forget the oldest ``frames`` frames, moving the rest to the front."""
+        frames = min(frames, self._frames)
+        remaining = self._frames - frames
+        self._data[:remaining] = self._data[frames : self._frames]
+        self._frames = remaining
+
+
+class RingBuffer:
+    """Fixed-size circular store that keeps only the most recent frames."""
+
+    def __init__(self, frames: int, channels: int = 1, dtype="int16"):
+        self.channels = channels
+        self.dtype = np.dtype(dtype)
+        self._data = np.zeros((max(frames, 1), channels), dtype=self.dtype)
+        self._pos = 0
+        self._frames = 0
+
+    def __len__(self) -> int:
+        return self._frames
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    def write(self, block: np.ndarray) -> None:
+        """Copy a block in, overwriting the oldest frames once full."""
+        capacity = len(self._data)
+        block = block[-capacity:]
+        frames = len(block)
+        end = self._pos + frames
+
+        if end <= capacity:
+            self._data[self._pos : end] = block
+        else:
+            split = capacity - self._pos
+            self._data[self._pos :] = block[:split]
+            self._data[: frames - split] = block[split:]
+
+        self._pos = end % capacity
+        self._frames = min(self._frames + frames, capacity)
+
+    def parts(self) -> tuple[np.ndarray, ...]:
+        """The stored frames, oldest first, as at most two views (no copy)."""
+        if self._frames < len(self._data):
+            return (self._data[: self._frames],)
+        return (self._data[self._pos :], self._data[: self._pos])
+
+    def clear(self) -> None:
+        self._pos = 0
+        self._frames = 0
@@ -0,0 +1,136 @@
+"""
+Capture health counters for the audio recorder.
+
+The PortAudio callback reports every block here: its status flags (input
+overflows are xruns, audio the device had to throw away), how long the
+callback itself took and how far the gap since the previous callback strayed
+from the block duration. Timings go into fixed-bucket histograms, so
+recording an observation is a bisect and an increment with no allocation
+that grows with the length of the session.
+
+The drain thread adds high-water marks for the callback ring and the
+capture buffer. ``snapshot()`` turns it all into a plain dict for the status
+file.
+"""
+
+import time
+from bisect import bisect_left
+
+# Upper bounds (microseconds) of the histogram buckets; one more bucket
+# catches everything above the last bound.
+CALLBACK_BUCKETS_US = (25, 50, 100, 250, 500, 1000, 2500, 5000)
+JITTER_BUCKETS_US = (250, 500, 1000, 2500, 5000, 10000, 25000, 50000)
+
+
+class Histogram:
+    """Counts of observations in fixed buckets, plus their count and maximum."""
+
+    def __init__(self, bounds):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, fraction: float) -> float | None:
+        """Upper bound of the bucket holding the given fraction of samples.
+
+        None when nothing was observed; the maximum when it falls in the
+        open-ended last bucket.
+        """
+        if not self.count:
+            return None
+        target = fraction * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= target:
+                return float(bound)
+        return self.max
+
+    def snapshot(self) -> dict:
+        labels = [f"<={bound}" for bound in self.bounds] + [f">{self.bounds[-1]}"]
+        return {
+            "buckets": dict(zip(labels, self.counts)),
+            "count": self.count,
+            "p50": self.percentile(0.5),
+            "p99": self.percentile(0.99),
+            "max": round(self.max, 1),
+        }
+
+
+class RecorderHealth:
+    """Per-stream xrun counts, callback timing and buffer high-water marks."""
+
+    def __init__(self, sample_rate: int, ring_capacity: int = 0):
+        self.sample_rate = sample_rate
+        self.ring_capacity = ring_capacity
+        self.callbacks = 0
+        self.frames = 0
+        self.input_overflows = 0
+        self.input_underflows = 0
+        self.callback_us = Histogram(CALLBACK_BUCKETS_US)
+        self.jitter_us = Histogram(JITTER_BUCKETS_US)
+        self.ring_high_water = 0
+        self.buffer_high_water = 0
+        self._last_callback = None
+
+    def on_callback(self, started: float, frames: int, status) -> None:
+        """Record one callback that began at ``started`` (perf_counter)."""
+        self.callback_us.add((time.perf_counter() - started) * 1e6)
+
+        if self._last_callback is not None:
+            expected = frames / self.sample_rate
+            self.jitter_us.add(abs(started - self._last_callback - expected) * 1e6)
+        self._last_callback = started
+
+        self.callbacks += 1
+        self.frames += frames
+        if status:
+            # sounddevice's CallbackFlags; a bare truthy status counts as an
+            # overflow, the only failure an input stream reports in practice.
+            if getattr(status, "input_overflow", True):
+                self.input_overflows += 1
+            if getattr(status, "input_underflow", False):
+                self.input_underflows += 1
+
+    def observe_ring(self, queued: int) -> None:
+        """Frames waiting in the callback ring when the drain thread woke."""
+        if queued > self.ring_high_water:
+            self.ring_high_water = queued
+
+    def observe_buffer(self, frames: int) -> None:
+        """Frames held in the capture buffer."""
+        if frames > self.buffer_high_water:
+            self.buffer_high_water = frames
+
+    def snapshot(self, dropped_frames: int = 0, buffer_rate: int | None = None):
+        """Everything as a JSON-ready dict.
+
+        ``dropped_frames`` comes from the ring, which the callback never
+        waits on; ``buffer_rate`` converts the buffer mark to seconds.
+        """
+        ring_fill = (
+            self.ring_high_water / self.ring_capacity if self.ring_capacity else None
+        )
+        return {
+            "seconds": round(self.frames / self.sample_rate, 2),
+            "callbacks": self.callbacks,
+            "input_overflows": self.input_overflows,
+            "input_underflows": self.input_underflows,
+            "dropped_frames": dropped_frames,
+            "callback_us": self.callback_us.snapshot(),
+            "jitter_us": self.jitter_us.snapshot(),
+            "ring_high_water": self.ring_high_water,
+            "ring_high_water_fraction": (
+                round(ring_fill, 3) if ring_fill is not None else None
+            ),
+            "buffer_high_water_seconds": round(
+                self.buffer_high_water / (buffer_rate or self.sample_rate), 2
+            ),
+        }
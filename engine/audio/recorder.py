@@ -1,6 +1,44 @@
 import threading
+import time
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
+
+
+def _to_float_mono(audio):
+    """Convert ``(frames, channels)`` samples to float32 mono in [-1, 1)."""
+    import numpy as np
+
+    samples = audio.astype(np.float32)
+    samples = samples.mean(axis=1) if samples.shape[1] > 1 else samples[:, 0]
+    if np.issubdtype(audio.dtype, np.integer):
+        samples /= float(np.iinfo(audio.dtype).max + 1)
+    return samples
+
+
+def read_recording(path, trim_silence: bool = True):
+    """Read a 16 kHz 16-bit WAV recording as float32 mono in [-1, 1).
+
+    Trimmed exactly as a finished take is for the in-memory hand-off, so
+    both give Whisper (and the transcript cache) the same samples. Returns
+    ``(audio, trimmed_seconds)``, or None for a WAV in another format.
+    """
+    import wave
+
+    import numpy as np
+
+    with wave.open(str(path), "rb") as wf:
+        if wf.getsampwidth() != 2 or wf.getframerate() != 16000:
+            return None
+        channels = wf.getnchannels()
+        samples = np.frombuffer(wf.readframes(wf.getnframes()), dtype="<i2")
+
+    samples = samples.reshape(-1, channels)
+    removed = 0.0
+    if trim_silence:
+        from .vad import trim_silence as trim
+
+        samples, removed = trim(samples, 16000)
+    return _to_float_mono(samples), removed
 
 
 def get_audio_dir() -> Path:
@@ -13,17 +51,103 @@ def get_audio_dir() -> Path:
 
 
 class AudioRecorder:
-    """Captures audio from microphone and saves to file."""
+    """Captures audio from microphone and saves to file.
+
+    The PortAudio callback only pushes blocks into a lock-free ring; a drain
+    thread moves them into the recording and streams it to the WAV file
+    while recording, so stopping only flushes the last few blocks and a
+    killed process leaves a playable file behind.
 
-    def __init__(self, sample_rate=16000, channels=1, dtype="int16"):
+    A long-lived process can ``arm()`` the recorder: the input stream then
+    stays open between recordings, so ``start()`` only flips a flag instead
+    of opening the device, and optionally keeps the last few seconds in a
+    ring that ``start()`` puts in front of the new recording. Nothing is
+    lost to stream-open latency, and the first words before the hotkey are
+    kept. With ``idle_release`` the device is let go after that long without
+    a recording and reopened by the next ``start()``.
+
+    With ``segment_seconds`` the recording is cut into segments of about that
+    length, at the quietest moment of the last SEGMENT_SEARCH_SECONDS, and
+    each one is passed to ``on_segment(index, samples, started_at)`` as
+    float32 mono while capture goes on. The WAV file still holds the whole
+    recording, but memory only holds what has not yet been handed off and
+    written, so long sessions do not grow the buffer.
+
+    With ``auto_stop_seconds`` the drain thread watches the level of the
+    incoming audio; after that long below AUTO_STOP_RMS it stops adding to
+    the recording, sets ``auto_stopped`` and calls ``on_auto_stop()`` on a
+    thread of its own, where the owner calls ``stop()`` and transcribes as
+    if the hotkey had been pressed.
+    """
+
+    # Room for this much audio is allocated up front; the buffer doubles
+    # when a recording runs longer.
+    INITIAL_BUFFER_SECONDS = 30
+
+    # How often the drain thread empties the callback's ring, and how much
+    # audio the ring can hold if the drain thread is held up.
+    DRAIN_INTERVAL = 0.02
+    RING_SECONDS = 2
+
+    # How often recorded frames are moved to disk.
+    FLUSH_INTERVAL = 0.25
+
+    # How far back from the target length a segment cut looks for a pause.
+    SEGMENT_SEARCH_SECONDS = 2.0
+
+    def __init__(
+        self,
+        sample_rate=16000,
+        channels=1,
+        dtype="int16",
+        trim_silence=False,
+        segment_seconds=None,
+        on_segment=None,
+        auto_stop_seconds=None,
+        on_auto_stop=None,
+    ):
         self.sample_rate = sample_rate
         self.channels = channels
         self.dtype = dtype
+        self.trim_silence = trim_silence
+        self.segment_seconds = segment_seconds
+        self.on_segment = on_segment
+        self.auto_stop_seconds = auto_stop_seconds
+        self.on_auto_stop = on_auto_stop
+        self.auto_stopped = False
+        self._silence = None
+        self.started_at = None
+        self.segments = 0
+        # Absolute frame indices of the buffer's first frame (audio before it
+        # was dropped after hand-off) and of the open segment's first frame.
+        self._base = 0
+        self._segment_start = 0
+        self.trimmed_seconds = 0.0
+        self._trimmed = None
+        self._preroll = None
+        self.preroll_seconds = 0.0
+        self._warm = False
+        self.idle_release = None
+        self._release_timer = None
+        self._release_generation = 0
         self._is_recording = False
-        self._audio_buffer = []
+        self._buffer = None
         self._stream = None
         self._lock = threading.Lock()
+        # Serialises opening and closing the stream between start()/stop(),
+        # arm()/disarm() and the idle-release timer. Never taken by the drain.
+        self._stream_lock = threading.Lock()
         self._sd = None
+        self._path = None
+        self._writer = None
+        self._writer_error = None
+        self._ring = None
+        self._resampler = None
+        self.device_rate = None
+        self.device_channels = None
+        self.health = None
+        self._drain_thread = None
+        self._drain_stop = threading.Event()
 
     def _get_sounddevice(self):
         """Lazy load sounddevice."""
@@ -33,63 +157,434 @@ class AudioRecorder:
             self._sd = sd
         return self._sd
 
-    def _audio_callback(self, indata, frames, time, status):
-        """Callback for audio stream."""
-        if self._is_recording:
+    def _audio_callback(self, indata, frames, time_info, status):
+        """Callback for audio stream.
+
+        Runs on PortAudio's real-time thread, so it only copies the block
+        into the lock-free ring and counts it; the drain thread does
+        everything else.
+        """
+        started = time.perf_counter()
+        self._ring.push(indata)
+        self.health.on_callback(started, frames, status)
+
+    def _drain(self, flush: bool = False) -> None:
+        """Route queued blocks to the recording or the pre-roll ring.
+
+        With ``flush``, frames recorded since the last flush also go to disk.
+        Only the drain thread and start()/stop() call this, and they take
+        ``_lock`` among themselves; the callback never waits on it.
+        """
+        with self._lock:
+            parts = self._ring.peek()
+            self.health.observe_ring(sum(len(part) for part in parts))
+            for part in parts:
+                block = self._resampler.process(part)
+                if self._is_recording:
+                    if not self.auto_stopped:
+                        self._buffer.append(block)
+                        if self._silence is not None and self._silence.update(block):
+                            self._auto_stop()
+                elif self._preroll is not None:
+                    self._preroll.write(block)
+            self._ring.advance(sum(len(part) for part in parts))
+
+            if self._is_recording:
+                self.health.observe_buffer(len(self._buffer))
+                if self.segment_seconds:
+                    self._maybe_rotate()
+
+            if flush and self._is_recording:
+                self._write_pending()
+                if self.segment_seconds:
+                    self._compact()
+
+    def _auto_stop(self) -> None:
+        """Stop taking audio and tell the owner, who may not block the drain."""
+        self.auto_stopped = True
+        if self.on_auto_stop is not None:
+            threading.Thread(
+                target=self.on_auto_stop, name="audio-auto-stop", daemon=True
+            ).start()
+
+    def _maybe_rotate(self) -> None:
+        """Close the open segment once it reaches ``segment_seconds``."""
+        total = self._base + len(self._buffer)
+        if total - self._segment_start < self.segment_seconds * self.sample_rate:
+            return
+
+        search = int(self.SEGMENT_SEARCH_SECONDS * self.sample_rate)
+        self._emit_segment(
+            self._find_pause(max(total - search, self._segment_start), total)
+        )
+
+    def _find_pause(self, start: int, stop: int) -> int:
+        """The middle of the quietest 30 ms frame between two absolute frames."""
+        from .vad import frame_features
+
+        window = self._buffer.view(start - self._base, stop - self._base)
+        rms, _, frame_len = frame_features(window, self.sample_rate)
+        if not len(rms):
+            return stop
+        return start + int(rms.argmin()) * frame_len + frame_len // 2
+
+    def _emit_segment(self, cut: int) -> None:
+        """Hand frames from the open segment's start up to ``cut`` to on_segment."""
+        audio = self._buffer.view(self._segment_start - self._base, cut - self._base)
+        if len(audio) and self.on_segment is not None:
+            offset = timedelta(seconds=self._segment_start / self.sample_rate)
+            self.on_segment(
+                self.segments, _to_float_mono(audio), self.started_at + offset
+            )
+            self.segments += 1
+        self._segment_start = cut
+
+    def _compact(self) -> None:
+        """Drop audio that has been both handed off and written to disk."""
+        drop = min(self._segment_start, self._writer.frames) - self._base
+        # Only once a segment's worth piles up, so the move stays rare.
+        if drop >= self.segment_seconds * self.sample_rate:
+            self._buffer.discard(drop)
+            self._base += drop
+
+    def _write_pending(self) -> None:
+        """Move frames captured since the last flush to the WAV file."""
+        if self._writer_error is not None:
+            return
+
+        pending = self._buffer.view(self._writer.frames - self._base)
+        if not len(pending):
+            return
+        try:
+            self._writer.write(pending)
+            self._writer.flush()
+        except OSError as e:
+            # Keep capturing into memory; stop() reports the failure.
+            self._writer_error = e
+
+    def _drain_loop(self) -> None:
+        """Empty the ring every DRAIN_INTERVAL until the stream closes."""
+        last_flush = time.monotonic()
+        while not self._drain_stop.wait(self.DRAIN_INTERVAL):
+            now = time.monotonic()
+            flush = now - last_flush >= self.FLUSH_INTERVAL
+            self._drain(flush)
+            if flush:
+                last_flush = now
+
+    def _device_format(self, sd) -> tuple[int, int]:
+        """The default input device's native sample rate and channel count."""
+        info = sd.query_devices(kind="input")
+        rate = int(info["default_samplerate"])
+        channels = int(info["max_input_channels"])
+        if self.channels != 1:
+            return rate, self.channels
+        # Stereo covers every mic we downmix; interfaces with many inputs
+        # would only add silent channels to average.
+        return rate, max(min(channels, 2), 1)
+
+    def _open_stream(self) -> None:
+        """Open and start the input stream and its drain thread.
+
+        The device runs at its own rate and channel count, which avoids
+        failures and slow host-side conversion on USB and Bluetooth mics;
+        the drain thread resamples to ``sample_rate`` mono.
+        """
+        from .health import RecorderHealth
+        from .resample import PolyphaseResampler
+        from .spsc import SpscRing
+
+        try:
+            sd = self._get_sounddevice()
+            self.device_rate, self.device_channels = self._device_format(sd)
+            self._ring = SpscRing(
+                int(self.device_rate * self.RING_SECONDS),
+                self.device_channels,
+                self.dtype,
+            )
+            self._resampler = PolyphaseResampler(
+                self.device_rate,
+                self.sample_rate,
+                self.device_channels,
+                mono=self.channels == 1,
+            )
+            self.health = RecorderHealth(self.device_rate, self._ring.capacity)
+            self._stream = sd.InputStream(
+                samplerate=self.device_rate,
+                channels=self.device_channels,
+                dtype=self.dtype,
+                callback=self._audio_callback,
+            )
+            self._stream.start()
+        except Exception:
+            # The device list may have changed under a cached --check-mic.
+            from ..utils.probe_cache import invalidate_probe
+
+            self._stream = None
+            invalidate_probe("mic")
+            raise
+
+        self._drain_stop.clear()
+        self._drain_thread = threading.Thread(
+            target=self._drain_loop, name="audio-drain", daemon=True
+        )
+        self._drain_thread.start()
+
+    def _close_stream(self) -> None:
+        if self._stream:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+        if self._drain_thread is not None:
+            self._drain_stop.set()
+            self._drain_thread.join()
+            self._drain_thread = None
+
+    @property
+    def armed(self) -> bool:
+        return self._warm
+
+    @property
+    def stream_open(self) -> bool:
+        return self._stream is not None
+
+    @property
+    def overflows(self) -> int:
+        """Frames dropped because the drain thread fell behind the device."""
+        return self._ring.dropped if self._ring is not None else 0
+
+    def health_report(self) -> dict | None:
+        """Capture health of the current (or last) input stream.
+
+        Counts cover the stream's whole life, which for an armed recorder
+        spans several recordings. None before any stream was opened.
+        """
+        if self.health is None:
+            return None
+        return {
+            "device_rate": self.device_rate,
+            "device_channels": self.device_channels,
+            **self.health.snapshot(self.overflows, self.sample_rate),
+        }
+
+    def arm(
+        self, preroll_seconds: float = 2.0, idle_release: float | None = None
+    ) -> None:
+        """Keep the stream open and the last ``preroll_seconds`` in a ring.
+
+        ``preroll_seconds`` of 0 keeps the stream warm without a ring.
+        ``idle_release`` closes the device after that many seconds without
+        a recording; None keeps it open until ``disarm()``.
+        """
+        from .buffer import RingBuffer
+
+        with self._lock:
+            self._preroll = (
+                RingBuffer(
+                    int(self.sample_rate * preroll_seconds), self.channels, self.dtype
+                )
+                if preroll_seconds
+                else None
+            )
+        self.idle_release = idle_release
+        self._warm = True
+        with self._stream_lock:
+            if self._stream is None:
+                try:
+                    self._open_stream()
+                except Exception:
+                    self._warm = False
+                    self._preroll = None
+                    raise
+        if not self._is_recording:
+            self._schedule_release()
+
+    def disarm(self) -> None:
+        """Drop the pre-roll ring and close the stream unless recording."""
+        self._cancel_release()
+        with self._lock:
+            self._preroll = None
+        self._warm = False
+        if not self._is_recording:
+            with self._stream_lock:
+                self._close_stream()
+
+    def _schedule_release(self) -> None:
+        """Start the idle-release countdown, replacing any running one."""
+        self._cancel_release()
+        if self.idle_release is None:
+            return
+        self._release_generation += 1
+        self._release_timer = threading.Timer(
+            self.idle_release, self._release_idle, args=(self._release_generation,)
+        )
+        self._release_timer.daemon = True
+        self._release_timer.start()
+
+    def _cancel_release(self) -> None:
+        if self._release_timer is not None:
+            self._release_timer.cancel()
+            self._release_timer = None
+        # A timer already past its wait sees a stale generation and gives up.
+        self._release_generation += 1
+
+    def _release_idle(self, generation: int) -> None:
+        """Close a warm stream nobody has recorded on for ``idle_release``."""
+        with self._stream_lock:
+            if (
+                generation != self._release_generation
+                or self._is_recording
+                or not self._warm
+            ):
+                return
+            self._close_stream()
             with self._lock:
-                self._audio_buffer.append(indata.copy())
+                # Audio from before the release is not "just before" anything.
+                if self._preroll is not None:
+                    self._preroll.clear()
 
     def start(self):
         """Start recording audio."""
         if self._is_recording:
             return False
 
-        self._audio_buffer = []
-        self._is_recording = True
+        from .buffer import SampleBuffer
+        from .vad import SilenceDetector
+        from .wav_writer import StreamingWavWriter
+
+        self._buffer = SampleBuffer(
+            self.channels,
+            self.dtype,
+            initial_frames=self.sample_rate * self.INITIAL_BUFFER_SECONDS,
+        )
 
-        sd = self._get_sounddevice()
-        self._stream = sd.InputStream(
-            samplerate=self.sample_rate,
-            channels=self.channels,
-            dtype=self.dtype,
-            callback=self._audio_callback,
+        timestamp = datetime.now().strftime("%Y-%m-%d-%H%M%S")
+        self._path = get_audio_dir() / f"{timestamp}.wav"
+        self._writer = StreamingWavWriter(
+            self._path, self.sample_rate, self.channels, self._buffer.dtype.itemsize
+        )
+        self._writer_error = None
+        self._trimmed = None
+        self.trimmed_seconds = 0.0
+        self.preroll_seconds = 0.0
+        self.segments = 0
+        self._base = 0
+        self._segment_start = 0
+        self.auto_stopped = False
+        self._silence = (
+            SilenceDetector(self.sample_rate, self.auto_stop_seconds)
+            if self.auto_stop_seconds
+            else None
         )
-        self._stream.start()
+        self.started_at = datetime.now()
+
+        self._cancel_release()
+        with self._stream_lock:
+            if self._stream is not None:
+                # Armed: the stream is already running, so recording starts
+                # with whatever the ring caught before the hotkey.
+                self._drain()
+                with self._lock:
+                    if self._preroll is not None:
+                        for part in self._preroll.parts():
+                            self._buffer.append(part)
+                        self.preroll_seconds = len(self._preroll) / self.sample_rate
+                        self.started_at -= timedelta(seconds=self.preroll_seconds)
+                        self._preroll.clear()
+                    self._is_recording = True
+            else:
+                self._is_recording = True
+                try:
+                    self._open_stream()
+                except Exception:
+                    self._is_recording = False
+                    self._writer.close()
+                    self._path.unlink(missing_ok=True)
+                    raise
+
         return True
 
     def stop(self) -> Path | None:
-        """Stop recording and save audio to file."""
+        """Stop recording and finish the audio file."""
         if not self._is_recording:
             return None
 
-        self._is_recording = False
+        if not self.armed:
+            # No more callbacks after this, so the last drain gets everything.
+            with self._stream_lock:
+                self._close_stream()
 
-        if self._stream:
-            self._stream.stop()
-            self._stream.close()
-            self._stream = None
+        self._drain()
+        with self._lock:
+            self._is_recording = False
+            try:
+                self._write_pending()
+            finally:
+                self._writer.close()
+            if self.segment_seconds:
+                self._emit_segment(self._base + len(self._buffer))
+        if self.armed:
+            self._schedule_release()
+
+        if self._writer_error is not None:
+            raise self._writer_error
 
-        if not self._audio_buffer:
+        if not self._writer.frames:
+            self._path.unlink(missing_ok=True)
             return None
 
-        import numpy as np
+        return self._path
 
+    @property
+    def current_path(self) -> Path | None:
+        """The file the current (or last) recording is streamed to."""
+        return self._path
+
+    def get_audio(self):
+        """Get the last recording as a view into the capture buffer (no copy).
+
+        With ``trim_silence`` a finished take comes back silence-trimmed
+        instead. The trim runs on the first call rather than in ``stop()``,
+        and only for this hand-off: the file keeps the whole take. With
+        segments it only covers audio not yet dropped after hand-off.
+        """
+        if self._trimmed is not None:
+            return self._trimmed
+        if self._buffer is None:
+            return None
         with self._lock:
-            audio_data = np.concatenate(self._audio_buffer)
+            audio = self._buffer.view()
+            finished = not self._is_recording
 
-        timestamp = datetime.now().strftime("%Y-%m-%d-%H%M%S")
-        filename = f"{timestamp}.wav"
-        filepath = get_audio_dir() / filename
+        if finished and self.trim_silence and not self.segment_seconds:
+            from .vad import trim_silence
+
+            self._trimmed, self.trimmed_seconds = trim_silence(audio, self.sample_rate)
+            return self._trimmed
+        return audio
 
-        import wave
+    def get_audio_float(self):
+        """Get the last recording as float32 mono in [-1, 1), as Whisper takes it.
 
-        with wave.open(str(filepath), "wb") as wf:
-            wf.setnchannels(self.channels)
-            wf.setsampwidth(2)
-            wf.setframerate(self.sample_rate)
-            wf.writeframes(audio_data.tobytes())
+        This is a copy, so it stays valid when the next recording starts.
+        """
+        audio = self.get_audio()
+        if audio is None:
+            return None
+        return _to_float_mono(audio)
 
-        return filepath
+    def live_segment(self):
+        """The open segment so far as ``(index, float32 mono, started_at)``.
+
+        A copy, for captioning while recording; None when not recording.
+        Without ``segment_seconds`` the open segment is the whole recording.
+        """
+        with self._lock:
+            if not self._is_recording:
+                return None
+            audio = self._buffer.view(self._segment_start - self._base)
+            offset = timedelta(seconds=self._segment_start / self.sample_rate)
+            return self.segments, _to_float_mono(audio), self.started_at + offset
 
     def is_recording(self) -> bool:
         """Check if currently recording."""
@@ -0,0 +1,118 @@
+"""
+Streaming polyphase resampling and mono downmix.
+
+Devices are opened at their native rate (usually 44.1 or 48 kHz) and the
+audio is converted here to the 16 kHz mono Whisper expects. The rate ratio
+is reduced to ``up / down`` and a windowed-sinc low-pass filter is split
+into ``up`` phases, so each output sample costs one short dot product and
+no zero-stuffed intermediate signal is ever built. A whole block's outputs
+are computed in one vectorised gather-and-multiply.
+"""
+
+from math import gcd
+
+import numpy as np
+
+# Zero crossings of the sinc kept on each side; more is a sharper low-pass
+# at a higher cost per output sample.
+FILTER_ZEROS = 8
+
+# Passband edge as a fraction of the output Nyquist frequency.
+ROLLOFF = 0.9
+
+KAISER_BETA = 8.0
+
+
+def design_filter(
+    up: int, down: int, zeros: int = FILTER_ZEROS, rolloff: float = ROLLOFF
+) -> np.ndarray:
+    """Low-pass FIR for resampling by ``up / down``, as an ``(up, taps)`` bank.
+
+    Row ``p`` holds the taps of phase ``p``, reversed so that a window of
+    input samples ordered oldest first can be multiplied straight in.
+    """
+    factor = max(up, down)
+    taps_per_phase = int(np.ceil(2 * zeros * factor / up))
+    length = taps_per_phase * up
+
+    # Centre the sinc so the filter is symmetric about its middle tap.
+    t = (np.arange(length) - (length - 1) / 2) / factor
+    taps = rolloff * np.sinc(rolloff * t) * np.kaiser(length, KAISER_BETA)
+    # Every output draws on one phase only, so scale each phase back to unity.
+    taps *= up / taps.sum()
+
+    bank = taps.reshape(taps_per_phase, up).T
+    return np.ascontiguousarray(bank[:, ::-1], dtype=np.float32)
+
+
+class PolyphaseResampler:
+    """Converts blocks from ``in_rate`` to ``out_rate``, keeping state between them.
+
+    Blocks are ``(frames, channels)`` arrays; with ``mono`` the channels are
+    averaged first. Output has the input's dtype and one channel (or the
+    input's channel count without ``mono``).
+    """
+
+    def __init__(self, in_rate: int, out_rate: int, channels: int = 1, mono=True):
+        divisor = gcd(int(in_rate), int(out_rate))
+        self.in_rate = int(in_rate)
+        self.out_rate = int(out_rate)
+        self.up = self.out_rate // divisor
+        self.down = self.in_rate // divisor
+        self.channels = channels
+        self.mono = mono
+
+        out_channels = 1 if mono else channels
+        if self.up == self.down:
+            self._bank = None
+            self._history = np.zeros((0, out_channels), dtype=np.float32)
+        else:
+            self._bank = design_filter(self.up, self.down)
+            taps = self._bank.shape[1]
+            self._history = np.zeros((taps - 1, out_channels), dtype=np.float32)
+            self._offsets = np.arange(-(taps - 1), 1)
+        # Position of the next output on the upsampled grid, relative to the
+        # first frame of the next block.
+        self._pos = 0
+
+    @property
+    def passthrough(self) -> bool:
+        return self._bank is None
+
+    def _to_float(self, block: np.ndarray) -> np.ndarray:
+        samples = block.astype(np.float32)
+        if self.mono and samples.shape[1] > 1:
+            samples = samples.mean(axis=1, keepdims=True)
+        return samples
+
+    def _from_float(self, samples: np.ndarray, dtype) -> np.ndarray:
+        if np.issubdtype(dtype, np.integer):
+            info = np.iinfo(dtype)
+            samples = np.clip(np.rint(samples), info.min, info.max)
+        return samples.astype(dtype)
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """Resample one block; returns however many output frames it yields."""
+        dtype = block.dtype
+        if self.passthrough:
+            if self.mono and block.shape[1] > 1:
+                return self._from_float(self._to_float(block), dtype)
+            return block
+
+        frames = len(block)
+        history = len(self._history)
+        x = np.concatenate((self._history, self._to_float(block)))
+
+        # Outputs whose newest input sample falls inside this block.
+        span = frames * self.up - self._pos
+        count = max(-(-span // self.down), 0)
+        positions = self._pos + self.down * np.arange(count)
+        newest = positions // self.up + history
+        phases = positions % self.up
+
+        windows = x[newest[:, None] + self._offsets]
+        out = np.einsum("nkc,nk->nc", windows, self._bank[phases])
+
+        self._pos += self.down * count - frames * self.up
+        self._history = x[len(x) - history :]
+        return self._from_float(out, dtype)
@@ -0,0 +1,303 @@
+"""
+Shared-memory audio transport between a recording and a transcribing process.
+
+The recorder process creates a ``SharedAudioRing`` and publishes finished
+segments into it; a transcription process attaches by name and reads each
+segment as a float32 NumPy view straight out of the shared block, so audio
+never goes through a file. Segments are never split across the end of the
+ring (the writer skips to the start instead), which keeps every read
+zero-copy.
+
+Layout of the block, all little-endian:
+
+    header    HEADER_FIELDS x uint64 counters and flags
+    markers   MAX_MARKERS x (start frame, frames, start time in us) uint64
+    samples   capacity x float32 mono
+
+The marker table is the control channel: the writer fills a marker, then
+bumps PUBLISHED; the reader acknowledges through CONSUMED and ACKED. Each
+side only ever writes its own counters, and only after the data they cover.
+
+``publish`` drops a segment that does not fit. ``RingPublisher`` wraps the
+writer side for callers that must not lose audio: it holds such segments
+back until the reader makes room, and cuts a take longer than the ring
+into pieces.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from multiprocessing import shared_memory
+
+import numpy as np
+
+MAGIC = 0x54455448  # "TETH"
+
+# Header slots.
+_MAGIC, _CAPACITY, _RATE, _WRITTEN, _CONSUMED, _PUBLISHED, _ACKED = range(7)
+_CLOSED, _READERS, _WRITER_PID = 7, 8, 9
+HEADER_FIELDS = 16
+
+MAX_MARKERS = 64
+DEFAULT_SECONDS = 300
+
+# Blocks created by this process; attaching to one of them must not drop the
+# creator's resource-tracker registration.
+_created: set[str] = set()
+
+
+class SharedAudioRing:
+    """A shared-memory ring of float32 audio segments with a marker channel."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self._shm = shm
+        self.owner = owner
+        self.name = shm.name
+
+        words = HEADER_FIELDS + MAX_MARKERS * 3
+        self._header = np.ndarray((HEADER_FIELDS,), np.uint64, shm.buf)
+        self._markers = np.ndarray(
+            (MAX_MARKERS, 3), np.uint64, shm.buf, offset=HEADER_FIELDS * 8
+        )
+        self.capacity = int(self._header[_CAPACITY])
+        self.sample_rate = int(self._header[_RATE])
+        self._samples = np.ndarray(
+            (self.capacity,), np.float32, shm.buf, offset=words * 8
+        )
+
+    @classmethod
+    def create(
+        cls,
+        name: str | None = None,
+        seconds: float = DEFAULT_SECONDS,
+        sample_rate: int = 16000,
+    ) -> "SharedAudioRing":
+        """Allocate a new ring holding ``seconds`` of audio."""
+        capacity = int(seconds * sample_rate)
+        size = (HEADER_FIELDS + MAX_MARKERS * 3) * 8 + capacity * 4
+        name = name or f"tether-audio-{os.getpid()}"
+
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        header = np.ndarray((HEADER_FIELDS,), np.uint64, shm.buf)
+        header[:] = 0
+        header[_CAPACITY] = capacity
+        header[_RATE] = sample_rate
+        header[_WRITER_PID] = os.getpid()
+        header[_MAGIC] = MAGIC
+        _created.add(shm.name)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedAudioRing":
+        """Open a ring created by another process."""
+        shm = _attach(name)
+        if int(np.ndarray((1,), np.uint64, shm.buf)[0]) != MAGIC:
+            shm.close()
+            raise ValueError(f"{name} is not a Tether audio ring")
+
+        ring = cls(shm, owner=False)
+        ring._header[_READERS] += 1
+        return ring
+
+    # Writer side
+
+    def publish(self, index: int, samples, started_at: datetime) -> bool:
+        """Copy a segment in and announce it; matches ``on_segment``.
+
+        Returns False, dropping the segment, if the reader is too far behind
+        for it to fit.
+        """
+        samples = np.asarray(samples, dtype=np.float32).reshape(-1)
+        frames = len(samples)
+        published = int(self._header[_PUBLISHED])
+
+        start = int(self._header[_WRITTEN])
+        if start % self.capacity + frames > self.capacity:
+            start += self.capacity - start % self.capacity
+
+        if (
+            frames > self.capacity
+            or start + frames - int(self._header[_CONSUMED]) > self.capacity
+            or published - int(self._header[_ACKED]) >= MAX_MARKERS
+        ):
+            return False
+
+        offset = start % self.capacity
+        self._samples[offset : offset + frames] = samples
+        self._markers[published % MAX_MARKERS] = (
+            start,
+            frames,
+            int(started_at.timestamp() * 1_000_000),
+        )
+        self._header[_WRITTEN] = start + frames
+        self._header[_PUBLISHED] = published + 1
+        return True
+
+    def close_stream(self) -> None:
+        """Tell readers no more segments are coming."""
+        self._header[_CLOSED] = 1
+
+    def wait_drained(self, timeout: float) -> bool:
+        """Wait until an attached reader has acknowledged every segment."""
+        deadline = time.monotonic() + timeout
+        while (
+            self._header[_READERS] and self._header[_ACKED] < self._header[_PUBLISHED]
+        ):
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    # Reader side
+
+    @property
+    def closed(self) -> bool:
+        return bool(self._header[_CLOSED])
+
+    def writer_alive(self) -> bool:
+        """Whether the creating process still exists (always True off POSIX)."""
+        if os.name != "posix":
+            return True
+        try:
+            os.kill(int(self._header[_WRITER_PID]), 0)
+        except ProcessLookupError:
+            return False
+        except OSError:
+            pass
+        return True
+
+    def pending(self) -> int:
+        """Segments published but not yet acknowledged."""
+        return int(self._header[_PUBLISHED] - self._header[_ACKED])
+
+    def next_segment(self):
+        """The oldest unacknowledged segment as ``(samples, started_at)``.
+
+        ``samples`` is a view into shared memory, valid until ``ack()``.
+        Returns None when nothing is waiting.
+        """
+        if not self.pending():
+            return None
+
+        start, frames, micros = (
+            int(value)
+            for value in self._markers[int(self._header[_ACKED]) % MAX_MARKERS]
+        )
+        offset = start % self.capacity
+        started_at = datetime.fromtimestamp(micros / 1_000_000)
+        return self._samples[offset : offset + frames], started_at
+
+    def ack(self) -> None:
+        """Release the segment returned by ``next_segment``."""
+        acked = int(self._header[_ACKED])
+        start, frames, _ = self._markers[acked % MAX_MARKERS]
+        self._header[_CONSUMED] = int(start) + int(frames)
+        self._header[_ACKED] = acked + 1
+
+    def segments(self, poll_interval: float = 0.05, timeout: float | None = None):
+        """Yield ``(samples, started_at)`` until the writer closes the stream.
+
+        Each segment is acknowledged when the consumer asks for the next one.
+        ``timeout`` bounds the wait for a segment while the stream is open.
+        """
+        waited = 0.0
+        while True:
+            segment = self.next_segment()
+            if segment is not None:
+                waited = 0.0
+                yield segment
+                self.ack()
+            elif self.closed or not self.writer_alive():
+                return
+            elif timeout is not None and waited >= timeout:
+                raise TimeoutError(f"No audio from {self.name} in {timeout}s")
+            else:
+                time.sleep(poll_interval)
+                waited += poll_interval
+
+    def close(self) -> None:
+        """Detach; the creating process also frees the block."""
+        if not self.owner:
+            self._header[_READERS] -= 1
+        # Views into the buffer must go before it can be released.
+        del self._header, self._markers, self._samples
+        self._shm.close()
+        if self.owner:
+            self._shm.unlink()
+            _created.discard(self.name)
+
+
+class RingPublisher:
+    """Publishes to a ring without dropping audio when the reader falls behind.
+
+    ``publish`` matches ``on_segment`` and never blocks: what does not fit
+    yet waits in a backlog and goes out, oldest first, on the next publish
+    or on ``flush()``. Audio longer than half the ring is cut into pieces
+    of that size, so a long take still fits while the reader is busy.
+    """
+
+    def __init__(self, ring: SharedAudioRing):
+        self.ring = ring
+        self.piece_frames = max(ring.capacity // 2, 1)
+        self._backlog = deque()
+        self._published = 0
+        self._lock = threading.Lock()
+
+    @property
+    def backlog(self) -> int:
+        """Pieces still waiting for room in the ring."""
+        return len(self._backlog)
+
+    def publish(self, index: int, samples, started_at: datetime) -> bool:
+        """Queue ``samples`` and publish as much of the backlog as fits.
+
+        Returns True if nothing is left waiting.
+        """
+        samples = np.asarray(samples, dtype=np.float32).reshape(-1)
+        rate = self.ring.sample_rate
+        with self._lock:
+            for start in range(0, len(samples), self.piece_frames):
+                offset = timedelta(seconds=start / rate)
+                piece = samples[start : start + self.piece_frames]
+                self._backlog.append((piece, started_at + offset))
+            return self._publish_ready()
+
+    def _publish_ready(self) -> bool:
+        while self._backlog:
+            piece, started_at = self._backlog[0]
+            if not self.ring.publish(self._published, piece, started_at):
+                return False
+            self._backlog.popleft()
+            self._published += 1
+        return True
+
+    def flush(self, timeout: float, poll_interval: float = 0.05) -> bool:
+        """Wait for the reader to make room for the whole backlog.
+
+        Returns False if pieces are still waiting after ``timeout``.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                if self._publish_ready():
+                    return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(poll_interval)
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Open an existing block without adopting responsibility for freeing it."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before Python 3.13 every attach registers with the resource tracker,
+        # which would unlink the creator's block when this process exits.
+        shm = shared_memory.SharedMemory(name=name)
+        if os.name == "posix" and shm.name not in _created:
+            from multiprocessing import resource_tracker
+
+            resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
@@ -0,0 +1,72 @@
+"""
+Single-producer/single-consumer frame ring for the PortAudio callback.
+
+The callback (producer) and one drain thread (consumer) share a
+preallocated array and two ever-increasing frame counters. The producer
+only ever stores ``_tail`` and the consumer only ever stores ``_head``, and
+each stores its counter after touching the data it covers, so neither side
+needs a lock: a plain attribute store is atomic under the GIL and the other
+side sees either the old or the new count, never a torn one.
+"""
+
+import numpy as np
+
+
+class SpscRing:
+    """Lock-free frame queue between exactly one writer and one reader."""
+
+    def __init__(self, frames: int, channels: int = 1, dtype="int16"):
+        self.channels = channels
+        self.dtype = np.dtype(dtype)
+        self._data = np.zeros((max(frames, 1), channels), dtype=self.dtype)
+        self._head = 0
+        self._tail = 0
+        # Frames refused because the reader fell behind; written by the
+        # producer only.
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return self._tail - self._head
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    def push(self, block: np.ndarray) -> bool:
+        """Producer: copy a block in, or drop it whole if it does not fit."""
+        frames = len(block)
+        capacity = len(self._data)
+        tail = self._tail
+
+        if frames > capacity - (tail - self._head):
+            self.dropped += frames
+            return False
+
+        start = tail % capacity
+        end = start + frames
+        if end <= capacity:
+            self._data[start:end] = block
+        else:
+            split = capacity - start
+            self._data[start:] = block[:split]
+            self._data[: frames - split] = block[split:]
+
+        self._tail = tail + frames
+        return True
+
+    def peek(self) -> tuple[np.ndarray, ...]:
+        """Consumer: views of everything queued, oldest first (no copy).
+
+        The views stay valid until ``advance`` hands the space back.
+        """
+        capacity = len(self._data)
+        available = self._tail - self._head
+        start = self._head % capacity
+
+        if start + available <= capacity:
+            return (self._data[start : start + available],)
+        return (self._data[start:], self._data[: available - (capacity - start)])
+
+    def advance(self, frames: int) -> None:
+        """Consumer: release ``frames`` frames back to the producer."""
+        self._head += frames
@@ -0,0 +1,217 @@
+"""
+Energy and zero-crossing voice activity detection.
+
+Works on whole recordings at once: samples are cut into fixed frames and
+every frame's loudness and zero-crossing rate is computed in vectorised
+passes over a minute of audio at a time, so trimming a minute takes a few
+milliseconds and an hour-long take needs no more scratch memory than one.
+``SilenceDetector`` is the live counterpart, fed block by block while
+recording to stop it after a long enough silence.
+"""
+
+from math import sqrt
+
+import numpy as np
+
+FRAME_MS = 30
+
+# Samples converted to float per pass of ``frame_features``.
+CHUNK_SAMPLES = 60 * 16000
+
+# Frames quieter than this (RMS, full scale = 1.0) are never speech, about
+# -50 dBFS. Keeps a silent clip from being judged against its own hiss.
+MIN_SPEECH_RMS = 0.003
+
+# Speech must be this much louder than the noise floor.
+NOISE_FLOOR_RATIO = 3.0
+
+# The threshold never rises above this (about -34 dBFS), so a clip that is
+# speech throughout is not judged against its own speech as "noise".
+MAX_SPEECH_THRESHOLD = 0.02
+
+# Fricatives ("s", "f") are quiet but cross zero often; frames above this
+# rate count as speech at half the energy threshold.
+FRICATIVE_ZCR = 0.25
+
+# Silence kept around speech so word onsets and tails are not clipped.
+PADDING_SECONDS = 0.2
+
+# Internal pauses longer than this are shortened to it.
+MAX_PAUSE_SECONDS = 0.6
+
+# Live blocks quieter than this (RMS, about -40 dBFS) count towards an
+# auto-stop. Higher than MIN_SPEECH_RMS: a quiet room's hum must not keep a
+# forgotten recording going.
+AUTO_STOP_RMS = 0.01
+
+
+def _to_mono_float(samples) -> np.ndarray:
+    """Flatten to mono float32 in [-1, 1]."""
+    samples = np.asarray(samples)
+    mono = samples.astype(np.float32, copy=False)
+    if mono.ndim > 1:
+        mono = mono.mean(axis=1)
+
+    if np.issubdtype(samples.dtype, np.integer):
+        mono = mono / float(np.iinfo(samples.dtype).max)
+    return mono
+
+
+def frame_features(samples, sample_rate: int, frame_ms: int = FRAME_MS):
+    """Per-frame RMS and zero-crossing rate.
+
+    A trailing partial frame is dropped from the features; ``speech_mask``
+    extends the last frame's decision over it.
+    """
+    samples = np.asarray(samples)
+    frame_len = max(int(sample_rate * frame_ms / 1000), 1)
+    count = len(samples) // frame_len
+    rms = np.empty(count, dtype=np.float32)
+    zcr = np.empty(count)
+
+    step = max(CHUNK_SAMPLES // frame_len, 1)
+    for first in range(0, count, step):
+        last = min(first + step, count)
+        chunk = _to_mono_float(samples[first * frame_len : last * frame_len])
+        frames = chunk.reshape(last - first, frame_len)
+        rms[first:last] = np.sqrt(np.mean(np.square(frames), axis=1))
+        signs = np.signbit(frames)
+        crossings = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1)
+        zcr[first:last] = crossings / frame_len
+    return rms, zcr, frame_len
+
+
+def speech_mask(rms: np.ndarray, zcr: np.ndarray) -> np.ndarray:
+    """Classify frames as speech from their energy and zero-crossing rate."""
+    if not len(rms):
+        return np.zeros(0, dtype=bool)
+
+    noise_floor = np.percentile(rms, 10)
+    threshold = max(
+        min(noise_floor * NOISE_FLOOR_RATIO, MAX_SPEECH_THRESHOLD), MIN_SPEECH_RMS
+    )
+
+    voiced = rms >= threshold
+    fricative = (rms >= threshold / 2) & (zcr >= FRICATIVE_ZCR)
+    return voiced | fricative
+
+
+def _runs(mask: np.ndarray) -> np.ndarray:
+    """Start/stop frame indices of each run of True values."""
+    edges = np.diff(np.concatenate(([0], mask.view(np.int8), [0])))
+    return np.column_stack((np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)))
+
+
+def keep_mask(
+    speech: np.ndarray,
+    frame_ms: int = FRAME_MS,
+    padding: float = PADDING_SECONDS,
+    max_pause: float = MAX_PAUSE_SECONDS,
+) -> np.ndarray:
+    """Frames to keep: speech, its padding, and shortened internal pauses."""
+    keep = np.zeros(len(speech), dtype=bool)
+    if not speech.any():
+        return keep
+
+    pad = int(round(padding * 1000 / frame_ms))
+    if pad:
+        # Dilate speech by ``pad`` frames on both sides.
+        kernel = np.ones(2 * pad + 1, dtype=np.int32)
+        # "full" and sliced rather than "same", which returns the kernel's
+        # length for clips shorter than it.
+        dilated = np.convolve(speech.view(np.int8), kernel, mode="full")
+        keep = dilated[pad : pad + len(speech)] > 0
+    else:
+        keep = speech.copy()
+
+    half_pause = int(round(max_pause * 1000 / frame_ms)) // 2
+    for start, stop in _runs(~keep):
+        # Leading and trailing silence is dropped entirely.
+        if start == 0 or stop == len(keep):
+            continue
+        if stop - start > 2 * half_pause:
+            keep[start : start + half_pause] = True
+            keep[stop - half_pause : stop] = True
+        else:
+            keep[start:stop] = True
+    return keep
+
+
+def trim_silence(
+    samples,
+    sample_rate: int,
+    frame_ms: int = FRAME_MS,
+    padding: float = PADDING_SECONDS,
+    max_pause: float = MAX_PAUSE_SECONDS,
+):
+    """Drop leading/trailing silence and collapse long pauses.
+
+    Returns the kept samples (same dtype and channel layout as the input)
+    and the number of seconds removed. A recording with no speech at all
+    comes back empty.
+    """
+    samples = np.asarray(samples)
+    if not len(samples):
+        return samples, 0.0
+
+    rms, zcr, frame_len = frame_features(samples, sample_rate, frame_ms)
+    if not len(rms):
+        return samples, 0.0
+
+    keep = keep_mask(speech_mask(rms, zcr), frame_ms, padding, max_pause)
+    if keep.all():
+        return samples, 0.0
+
+    # Copy the kept runs straight out, without a per-sample mask.
+    spans = _runs(keep) * frame_len
+    if not len(spans):
+        return samples[:0], len(samples) / sample_rate
+    if keep[-1]:
+        # The last frame's decision covers a trailing partial frame.
+        spans[-1, 1] = len(samples)
+    trimmed = np.concatenate([samples[start:stop] for start, stop in spans])
+    return trimmed, (len(samples) - len(trimmed)) / sample_rate
+
+
+class SilenceDetector:
+    """Running RMS over live audio blocks, watching for a stretch of silence.
+
+    ``update()`` returns True once ``silence_seconds`` of consecutive blocks
+    have stayed under ``threshold``. The float conversion goes through one
+    scratch array that is reused, so a block costs no new allocation.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        silence_seconds: float,
+        threshold: float = AUTO_STOP_RMS,
+        max_block: int = 4096,
+    ):
+        self.limit = int(silence_seconds * sample_rate)
+        self.threshold = threshold
+        self.silent_frames = 0
+        self._scratch = np.empty(max_block, dtype=np.float32)
+
+    def reset(self) -> None:
+        self.silent_frames = 0
+
+    def update(self, block: np.ndarray) -> bool:
+        """Account for one ``(frames, channels)`` block."""
+        samples = block.reshape(-1)
+        if not len(samples):
+            return self.silent_frames >= self.limit
+        if len(samples) > len(self._scratch):
+            self._scratch = np.empty(len(samples), dtype=np.float32)
+
+        scratch = self._scratch[: len(samples)]
+        np.copyto(scratch, samples, casting="unsafe")
+        if np.issubdtype(samples.dtype, np.integer):
+            scratch *= 1.0 / float(np.iinfo(samples.dtype).max)
+
+        rms = sqrt(float(np.dot(scratch, scratch)) / len(samples))
+        if rms >= self.threshold:
+            self.silent_frames = 0
+        else:
+            self.silent_frames += len(block)
+        return self.silent_frames >= self.limit
@@ -0,0 +1,100 @@
+import struct
+from pathlib import Path
+
+HEADER_SIZE = 44
+
+
+def _header(sample_rate: int, channels: int, sampwidth: int, data_bytes: int) -> bytes:
+    """Build a canonical 44-byte PCM WAV header."""
+    block_align = channels * sampwidth
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_bytes,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        sampwidth * 8,
+        b"data",
+        data_bytes,
+    )
+
+
+class StreamingWavWriter:
+    """Writes PCM frames to a WAV file as they arrive.
+
+    The header's size fields are patched on every flush, so the file on disk
+    is a valid WAV up to the last flush even if the process is killed.
+    """
+
+    def __init__(self, path, sample_rate: int, channels: int = 1, sampwidth: int = 2):
+        self.path = Path(path)
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.sampwidth = sampwidth
+        self.data_bytes = 0
+        self._file = open(self.path, "wb")
+        self._file.write(_header(sample_rate, channels, sampwidth, 0))
+
+    @property
+    def frames(self) -> int:
+        return self.data_bytes // (self.channels * self.sampwidth)
+
+    def write(self, frames) -> None:
+        """Append raw PCM frames (bytes or a C-contiguous array)."""
+        data = memoryview(frames).cast("B")
+        self._file.write(data)
+        self.data_bytes += len(data)
+
+    def flush(self) -> None:
+        """Patch the header to cover everything written and push it to the OS."""
+        self._file.seek(0)
+        self._file.write(
+            _header(self.sample_rate, self.channels, self.sampwidth, self.data_bytes)
+        )
+        self._file.seek(0, 2)
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+
+
+def repair_wav(path) -> bool:
+    """Fix the size fields of a WAV whose writer was killed between flushes.
+
+    Only handles the canonical 44-byte header written by
+    ``StreamingWavWriter``. Returns True if the header was changed.
+    """
+    path = Path(path)
+
+    with open(path, "r+b") as f:
+        header = f.read(HEADER_SIZE)
+        if (
+            len(header) < HEADER_SIZE
+            or header[:4] != b"RIFF"
+            or header[36:40] != b"data"
+        ):
+            return False
+
+        channels, sample_rate = struct.unpack("<HI", header[22:28])
+        sampwidth = struct.unpack("<H", header[34:36])[0] // 8
+        recorded = struct.unpack("<I", header[40:44])[0]
+
+        block_align = max(channels * sampwidth, 1)
+        actual = f.seek(0, 2) - HEADER_SIZE
+        actual -= actual % block_align
+
+        if actual == recorded:
+            return False
+
+        f.seek(0)
+        f.write(_header(sample_rate, channels, sampwidth, actual))
+        return True
@@ -2,109 +2,577 @@
 """
 Tether Engine - CLI for thought ingestion
 Usage:
+    python -m engine --spool              # Record and transcribe in one process
     python -m engine --spool-start        # Start recording, save audio, exit
     python -m engine --spool-transcribe   # Transcribe last recording, save to spool
+    python -m engine --spool-transcribe-batch DIR  # Transcribe a backlog of recordings
+    python -m engine --spool-start --shm  # Also share the audio in memory
+    python -m engine --spool-transcribe-shm NAME  # Transcribe it as it arrives
+    python -m engine --archive PATH       # Compress a recording to FLAC
     python -m engine --weave              # Process daily notes into knowledge graph
     python -m engine --ask "query"        # Query the vault
     python -m engine --check-mic          # Check microphone access
     python -m engine --check-ollama      # Check Ollama status
     python -m engine --install-ollama     # Install Ollama
+    python -m engine --warmup             # Preload the STT and LLM models
+    python -m engine --import-profile --check-mic  # Report import cost
+    python -m engine --serve              # Run as a daemon over stdin/stdout
+    python -m engine --serve --listen     # Run as a daemon on a local socket
+    python -m engine --serve --preroll 2  # Keep 2s of audio from before the hotkey
+    python -m engine --serve --warm-stream --idle-release 300  # Instant start
+    python -m engine --client --ask "q"   # Run a command on the running daemon
 """
 
+from __future__ import annotations
+
 import argparse
 import json
 import os
-import platform
-import subprocess
 import sys
 import time
-import signal
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .utils import status, get_vault_dir
+
+# How long --spool-start --shm keeps the shared block alive after recording
+# for a reader that is still transcribing.
+SHM_DRAIN_TIMEOUT = 120
+
+# Segments of --segment-seconds the shared-memory ring holds at least.
+SHM_SEGMENTS = 4
+
+# A recording's WAV is flushed every quarter second while it is written, so
+# one this recently modified is taken to be still recording.
+RECORDING_IDLE_SECONDS = 10
+
+# Subcommands import what they use when they run, so short commands such as
+# --check-mic do not pay for httpx, the STT stack or the daemon.
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    import numpy as np
+
+    from .ai import LLMClient
+    from .audio.archive import ArchiveEncoder
+    from .stt import Transcriber
+    from .stt.cache import TranscriptCache
+
+
+def _report_trim(recorder) -> None:
+    """Say how much silence the recorder cut from the last recording."""
+    if recorder.trimmed_seconds:
+        print(f"Trimmed {recorder.trimmed_seconds:.1f}s of silence.", flush=True)
+
+
+def _report_health(recorder) -> None:
+    """Publish capture health to the status file and warn about lost audio."""
+    health = recorder.health_report()
+    if health is None:
+        return
+    status.write_metrics("recorder", health)
+    if health["input_overflows"] or health["dropped_frames"]:
+        print(
+            f"Warning: audio was lost ({health['input_overflows']} input "
+            f"overflows, {health['dropped_frames']} dropped frames).",
+            flush=True,
+        )
+
+
+def _wait_while_recording(recorder) -> None:
+    """Block until the recorder stops or auto-stops on silence."""
+    while recorder.is_recording():
+        if recorder.auto_stopped:
+            print("Silence detected, stopping recording...", flush=True)
+            return
+        time.sleep(0.5)
+
+
+def _archive(audio_path: Path, archiver: ArchiveEncoder | None = None) -> None:
+    """Compress a transcribed WAV recording in the background."""
+    if audio_path.suffix.lower() != ".wav":
+        return
+    if archiver is not None:
+        archiver.submit(audio_path)
+    else:
+        from .audio.archive import spawn_archive_process
+
+        spawn_archive_process(audio_path)
+
+
+def cmd_archive(audio_path: str) -> Path | None:
+    """Compress a recording to FLAC in place of the WAV."""
+    from .audio.archive import archive_recording
+
+    audio_file = Path(audio_path)
+    if not audio_file.exists():
+        print(f"Error: Audio file not found: {audio_path}", flush=True)
+        return None
+
+    try:
+        archived = archive_recording(audio_file)
+    except Exception as e:
+        print(f"Error: Could not archive {audio_path}: {e}", flush=True)
+        return None
+
+    if archived:
+        print(f"ARCHIVE_PATH:{archived}", flush=True)
+    else:
+        print(f"Left as is: {audio_path}", flush=True)
+    return archived
+
 
-from .utils import status, get_tether_dir, get_vault_dir
-from .audio import AudioRecorder
-from .stt import Transcriber, Spool, get_daily_dir, get_spools_dir
-from .ai import (
-    LLMClient,
-    ENTITY_EXTRACTION_PROMPT,
-    ASK_VAULT_PROMPT,
-    SYSTEM_PROMPT,
-    OLLAMA_MODEL,
-)
+def cmd_spool(
+    segment_seconds: float | None = None,
+    auto_stop_seconds: float | None = None,
+    stream: bool = False,
+):
+    """Record audio and transcribe to vault.
 
+    With ``segment_seconds`` the recording is transcribed a segment at a time
+    while it is still going, so a long session is done soon after it stops.
+    ``stream`` also prints partial captions of the segment being recorded.
+    With ``auto_stop_seconds`` it stops by itself after that much silence.
+    """
+    from .audio import AudioRecorder
+    from .stt import Transcriber, Spool
 
-def cmd_spool_start():
-    """Start recording audio and save to file. Exits gracefully."""
     status.write_status("recording", "spool", os.getpid())
     print("Recording started...", flush=True)
 
-    recorder = AudioRecorder()
-    recorder.start()
+    transcriber = Transcriber()
+    spool = Spool()
+    pipeline = None
 
-    audio_path = None
+    def print_segment(index, text, started_at):
+        print(f"Segment {index} [{started_at:%H:%M:%S}]: {text}", flush=True)
 
-    def signal_handler(signum, frame):
+    if stream:
+        from .stt.streaming import WINDOW_SECONDS
+
+        segment_seconds = segment_seconds or WINDOW_SECONDS
+
+    if segment_seconds:
+        recorder = AudioRecorder(segment_seconds=segment_seconds)
+        if stream:
+            from .stt.streaming import StreamingPipeline
+
+            def print_partial(index, text, started_at):
+                print(f"Partial {index} [{started_at:%H:%M:%S}]: {text}", flush=True)
+
+            pipeline = StreamingPipeline(
+                transcriber,
+                recorder.live_segment,
+                spool,
+                on_text=print_segment,
+                on_partial=print_partial,
+            )
+        else:
+            from .stt.pipeline import SegmentPipeline
+
+            pipeline = SegmentPipeline(transcriber, spool, on_text=print_segment)
+        recorder.on_segment = pipeline.submit
+    else:
+        recorder = AudioRecorder(trim_silence=True)
+    recorder.auto_stop_seconds = auto_stop_seconds
+
+    recorder.start()
+
+    try:
+        _wait_while_recording(recorder)
+    except KeyboardInterrupt:
         print("\nStopping recording...", flush=True)
+
+    audio_path = recorder.stop()
+    _report_health(recorder)
+
+    if pipeline is not None:
+        print(f"Transcribing last of {recorder.segments} segments...", flush=True)
+        text = pipeline.close()
+        if audio_path:
+            print(f"Audio saved to: {audio_path}", flush=True)
+            _archive(audio_path)
+        if text:
+            print(f"Text: {text}", flush=True)
+        else:
+            print("No text transcribed.", flush=True)
+    elif audio_path and audio_path.exists():
+        print(f"Audio saved to: {audio_path}", flush=True)
+
+        audio = recorder.get_audio_float()
+        _report_trim(recorder)
+
+        print("Transcribing...", flush=True)
+        text = transcriber.transcribe(audio) if len(audio) else None
+        _archive(audio_path)
+
+        if text:
+            spool_path = spool.append(text, recorder.started_at)
+            print(f"Transcription saved to: {spool_path}", flush=True)
+            print(f"Text: {text}", flush=True)
+        else:
+            print("No text transcribed.", flush=True)
+    else:
+        print("No audio recorded.", flush=True)
+
+    status.mark_idle()
+    print("Recording stopped.", flush=True)
+
+
+def cmd_spool_start(
+    shm: bool = False,
+    segment_seconds: float | None = None,
+    auto_stop_seconds: float | None = None,
+):
+    """Start recording audio and save to file. Exits gracefully.
+
+    With ``shm`` the audio is also published to a shared-memory ring that a
+    concurrent ``--spool-transcribe-shm`` process reads without touching the
+    file, segment by segment when ``segment_seconds`` is given. With
+    ``auto_stop_seconds`` it also exits after that much silence, so the
+    caller moves on to transcription as if it had been stopped.
+    """
+    import signal
+
+    from .audio import AudioRecorder
+
+    status.write_status("recording", "spool", os.getpid())
+    print("Recording started...", flush=True)
+
+    ring = publisher = None
+    if shm:
+        from .audio.shm import DEFAULT_SECONDS, RingPublisher, SharedAudioRing
+
+        # Room for several segments, so one slow decode does not stall them.
+        seconds = max(DEFAULT_SECONDS, SHM_SEGMENTS * (segment_seconds or 0))
+        ring = SharedAudioRing.create(seconds=seconds)
+        publisher = RingPublisher(ring)
+        recorder = AudioRecorder(
+            trim_silence=True,
+            segment_seconds=segment_seconds,
+            on_segment=publisher.publish if segment_seconds else None,
+        )
+    else:
+        # --spool-transcribe trims the file when it reads it back.
+        recorder = AudioRecorder()
+    recorder.auto_stop_seconds = auto_stop_seconds
+
+    recorder.start()
+    print(f"Recording to: {recorder.current_path}", flush=True)
+    if ring is not None:
+        print(f"SHM_NAME:{ring.name}", flush=True)
+
+    def finish() -> bool:
+        """Stop and hand everything over; False if audio missed the reader."""
         audio_path = recorder.stop()
+        _report_health(recorder)
+
+        handed_over = True
+        if ring is not None:
+            audio = None if segment_seconds else recorder.get_audio_float()
+            _report_trim(recorder)
+            if audio is not None and len(audio):
+                publisher.publish(0, audio, recorder.started_at)
+            if not publisher.flush(SHM_DRAIN_TIMEOUT):
+                handed_over = False
+                print(
+                    f"Error: {publisher.backlog} pieces of audio never reached "
+                    "the shared-memory reader; transcribe the audio file instead.",
+                    flush=True,
+                )
+            ring.close_stream()
+
         if audio_path and audio_path.exists():
             print(f"AUDIO_PATH:{audio_path}", flush=True)
             print(f"Audio saved to: {audio_path}", flush=True)
         else:
             print("No audio recorded.", flush=True)
         status.mark_idle()
-        sys.exit(0)
+
+        if ring is not None:
+            # The block disappears with this process on some platforms.
+            if not ring.wait_drained(SHM_DRAIN_TIMEOUT):
+                print("Shared-memory reader did not finish in time.", flush=True)
+            ring.close()
+        return handed_over
+
+    def signal_handler(signum, frame):
+        print("\nStopping recording...", flush=True)
+        sys.exit(0 if finish() else 1)
 
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
     try:
-        while recorder.is_recording():
-            time.sleep(0.5)
+        _wait_while_recording(recorder)
     except KeyboardInterrupt:
         pass
 
-    audio_path = recorder.stop()
-
-    if audio_path and audio_path.exists():
-        print(f"AUDIO_PATH:{audio_path}", flush=True)
-        print(f"Audio saved to: {audio_path}", flush=True)
-    else:
-        print("No audio recorded.", flush=True)
-
-    status.mark_idle()
+    handed_over = finish()
     print("Recording stopped.", flush=True)
+    if not handed_over:
+        sys.exit(1)
+
+
+def cmd_spool_transcribe(
+    audio_path: str | None = None,
+    transcriber: Transcriber | None = None,
+    archiver: ArchiveEncoder | None = None,
+    audio: np.ndarray | None = None,
+    cache: TranscriptCache | None = None,
+) -> str | None:
+    """Transcribe an audio file and save to spool.
+
+    A warm ``transcriber`` can be passed in (the daemon does this) so the
+    Whisper model is not reloaded for every file. When the caller still holds
+    the recording as float32 ``audio`` it is transcribed from memory and the
+    file is not read back; otherwise a WAV is read and silence-trimmed the
+    same way first. Afterwards the recording is compressed to FLAC on
+    ``archiver``, or by a detached process without one.
+
+    Audio transcribed before is answered from the transcript ``cache``, and
+    text that already went to the spool is not appended again.
+    """
+    from .stt import Transcriber, Spool
+    from .stt.cache import TranscriptCache
 
-
-def cmd_spool_transcribe(audio_path: str | None = None):
-    """Transcribe an audio file and save to spool."""
     if not audio_path:
         print("Error: No audio path provided", flush=True)
-        return
+        return None
 
     audio_file = Path(audio_path)
-    if not audio_file.exists():
+    archived = audio_file.with_suffix(".flac")
+    if not audio_file.exists() and audio_file.suffix.lower() == ".wav":
+        # A retry after the first attempt archived the recording.
+        if archived.exists():
+            print(f"Using archived recording: {archived}", flush=True)
+            audio_file = audio_path = archived
+    if not audio_file.exists() and audio is None:
         print(f"Error: Audio file not found: {audio_path}", flush=True)
-        return
+        return None
+
+    from .audio.wav_writer import repair_wav
+
+    if audio is None and audio_file.suffix.lower() == ".wav":
+        from .audio.recorder import read_recording
+
+        # A recording whose process was killed mid-flush has a stale header.
+        if repair_wav(audio_file):
+            print(f"Repaired truncated recording: {audio_path}", flush=True)
+        # Trimmed here because --spool-start leaves the file as recorded.
+        recording = read_recording(audio_file)
+        if recording is not None:
+            audio, trimmed_seconds = recording
+            if trimmed_seconds:
+                print(f"Trimmed {trimmed_seconds:.1f}s of silence.", flush=True)
 
     print(f"Transcribing: {audio_path}", flush=True)
 
-    transcriber = Transcriber()
+    if transcriber is None:
+        transcriber = Transcriber()
+    if cache is None:
+        cache = TranscriptCache()
     spool = Spool(use_spools=True)
 
-    text = transcriber.transcribe(str(audio_path))
+    if audio is not None and not len(audio):
+        # Trimming found no speech in the recording.
+        key, text = None, None
+    else:
+        key, entry, hit = cache.transcribe(
+            transcriber, str(audio_path) if audio is None else audio, path=audio_file
+        )
+        text = entry["text"]
 
-    if text:
+    if text and entry.get("spooled"):
+        print(f"TRANSCRIPTION:{text}", flush=True)
+        print("Transcription already in the spool.", flush=True)
+    elif text:
         spool_path = spool.append(text)
+        cache.mark_spooled(key)
         print(f"TRANSCRIPTION:{text}", flush=True)
         print(f"Transcription saved to: {spool_path}", flush=True)
     else:
         print("No text transcribed.", flush=True)
 
+    # Only once the text is safely spooled: the WAV goes away when archived.
+    _archive(audio_file, archiver)
+
+    status.mark_idle()
+    return text
+
+
+def cmd_spool_transcribe_shm(
+    name: str, transcriber: Transcriber | None = None
+) -> str | None:
+    """Transcribe audio published by ``--spool-start --shm`` as it arrives.
+
+    Segments are read as views of the shared block and transcribed before
+    they are released, so the audio is never copied to a file or pipe.
+    """
+    from .audio.shm import SharedAudioRing
+    from .audio.vad import trim_silence
+    from .stt import Transcriber, Spool
+
+    try:
+        ring = SharedAudioRing.attach(name)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error: Cannot open shared audio {name}: {e}", flush=True)
+        return None
+
+    print(f"Transcribing from shared memory: {name}", flush=True)
+    if transcriber is None:
+        transcriber = Transcriber()
+    spool = Spool(use_spools=True)
+    texts = []
+
+    try:
+        for samples, started_at in ring.segments():
+            samples, _ = trim_silence(samples, ring.sample_rate)
+            if not len(samples):
+                continue
+            text = transcriber.transcribe(samples)
+            if text:
+                spool.append(text, started_at)
+                texts.append(text)
+                print(f"Segment [{started_at:%H:%M:%S}]: {text}", flush=True)
+    finally:
+        ring.close()
+
+    text = " ".join(texts)
+    if text:
+        print(f"TRANSCRIPTION:{text}", flush=True)
+    else:
+        print("No text transcribed.", flush=True)
+
     status.mark_idle()
+    return text or None
 
 
-def cmd_weave():
+def _recording_time(audio_file: Path) -> datetime:
+    """When a recording started, from its ``%Y-%m-%d-%H%M%S`` name or mtime."""
+    from datetime import datetime
+
+    try:
+        return datetime.strptime(audio_file.stem, "%Y-%m-%d-%H%M%S")
+    except ValueError:
+        return datetime.fromtimestamp(audio_file.stat().st_mtime)
+
+
+def cmd_spool_transcribe_batch(
+    directory: str,
+    transcriber: Transcriber | None = None,
+    batch_size: int | None = None,
+) -> dict | None:
+    """Transcribe every WAV recording left in a directory, oldest first.
+
+    For recordings that piled up while the engine was not running: the model
+    is loaded once, long recordings use faster-whisper's batched inference,
+    and each text goes to the spool stamped with its recording's start time,
+    so the spool stays in order. Transcribed files are archived to FLAC on
+    one encoder thread, which takes them out of the next run. A WAV written
+    to in the last ``RECORDING_IDLE_SECONDS`` is a recording in progress and
+    is left for the next run.
+    """
+    import wave
+
+    from .audio.archive import ArchiveEncoder
+    from .audio.wav_writer import repair_wav
+    from .stt import Transcriber, Spool
+    from .stt.cache import TranscriptCache
+    from .stt.transcriber import BATCH_SIZE
+
+    audio_dir = Path(directory).expanduser()
+    if not audio_dir.is_dir():
+        print(f"Error: Not a directory: {directory}", flush=True)
+        return None
+
+    recordings = []
+    for path in audio_dir.glob("*.wav"):
+        # Half-written silence trims left by a crash are not recordings.
+        if path.name.endswith(".trim.wav"):
+            continue
+        if time.time() - path.stat().st_mtime < RECORDING_IDLE_SECONDS:
+            # Transcribing and archiving it would take the file from under
+            # the recorder; the next run picks it up.
+            print(f"Skipping {path.name}: still being recorded", flush=True)
+            continue
+        recordings.append(path)
+    recordings.sort(key=_recording_time)
+    if not recordings:
+        print(f"No recordings to transcribe in {audio_dir}", flush=True)
+        return {"files": 0, "audio_seconds": 0.0, "wall_seconds": 0.0}
+
+    status.write_status("busy", "spool-batch", os.getpid())
+    print(f"Transcribing {len(recordings)} recordings from {audio_dir}", flush=True)
+
+    if transcriber is None:
+        transcriber = Transcriber()
+    cache = TranscriptCache()
+    spool = Spool(use_spools=True)
+    batch_size = batch_size or BATCH_SIZE
+
+    audio_seconds = 0.0
+    failed = []
+    started = time.perf_counter()
+    # One encoder for the batch rather than a detached process per file.
+    archiver = ArchiveEncoder()
+
+    for audio_file in recordings:
+        try:
+            repair_wav(audio_file)
+            with wave.open(str(audio_file), "rb") as wf:
+                seconds = wf.getnframes() / wf.getframerate()
+            key, entry, _ = cache.transcribe(
+                transcriber, str(audio_file), batch_size=batch_size
+            )
+        except Exception as e:
+            # One damaged file must not hold up the rest of the backlog.
+            print(f"Failed: {audio_file.name}: {e}", flush=True)
+            failed.append(str(audio_file))
+            continue
+
+        audio_seconds += seconds
+        recorded_at = _recording_time(audio_file)
+        text = entry["text"]
+        if text and entry.get("spooled"):
+            # A run that was interrupted before archiving this file.
+            print(f"[{recorded_at:%Y-%m-%d %H:%M:%S}] (already spooled)", flush=True)
+        elif text:
+            spool.append(text, recorded_at)
+            cache.mark_spooled(key)
+            print(f"[{recorded_at:%Y-%m-%d %H:%M:%S}] {text}", flush=True)
+        else:
+            print(f"[{recorded_at:%Y-%m-%d %H:%M:%S}] (no speech)", flush=True)
+        _archive(audio_file, archiver)
+
+    wall_seconds = time.perf_counter() - started
+    # This process exits after the summary, so finish the encodes first.
+    archiver.close()
+    for archived_path, error in archiver.errors:
+        print(f"Could not archive {archived_path}: {error}", flush=True)
+    summary = {
+        "files": len(recordings) - len(failed),
+        "failed": failed,
+        "audio_seconds": round(audio_seconds, 2),
+        "wall_seconds": round(wall_seconds, 2),
+        "throughput": round(audio_seconds / wall_seconds, 2) if wall_seconds else None,
+    }
+    print(
+        f"Transcribed {summary['files']} recordings ({audio_seconds:.1f}s of audio) "
+        f"in {wall_seconds:.1f}s: {summary['throughput']}x real time "
+        "(audio-seconds per wall-second)",
+        flush=True,
+    )
+
+    status.mark_idle()
+    return summary
+
+
+def cmd_weave(llm: LLMClient | None = None) -> dict | None:
     """Process daily notes into knowledge graph."""
+    from .stt import Spool
+    from .ai import LLMClient, ENTITY_EXTRACTION_PROMPT, SYSTEM_PROMPT
+
     status.write_status("busy", "weave", os.getpid())
     print("Starting weave...", flush=True)
 
@@ -114,13 +582,14 @@ def cmd_weave():
     if not daily_content.strip():
         print("No content to weave.", flush=True)
         status.mark_idle()
-        return
+        return None
 
-    llm = LLMClient()
+    if llm is None:
+        llm = LLMClient()
     if not llm.is_available():
         print("Ollama not available. Install and run 'ollama serve'.", flush=True)
         status.mark_idle()
-        return
+        return None
 
     print("Extracting entities...", flush=True)
     prompt = ENTITY_EXTRACTION_PROMPT.format(daily_content=daily_content)
@@ -147,14 +616,18 @@ def cmd_weave():
 
     except Exception as e:
         print(f"Weave failed: {e}", flush=True)
+        entities = None
 
     status.mark_idle()
+    return entities
 
 
 def _update_daily_with_links(daily_content: str, entities: dict) -> None:
     """Update daily note with wiki-style links."""
     from datetime import datetime
 
+    from .stt import get_daily_dir
+
     today = datetime.now().strftime("%Y-%m-%d")
     daily_path = get_daily_dir() / f"{today}.md"
 
@@ -228,20 +701,23 @@ def _write_to_vault_folders(entities: dict) -> None:
             idea_file.write_text(existing + entry, encoding="utf-8")
 
 
-def cmd_ask(query: str):
+def cmd_ask(query: str, llm: LLMClient | None = None, vault_cache: dict | None = None):
     """Query the vault using RAG."""
+    from .ai import LLMClient, ASK_VAULT_PROMPT, SYSTEM_PROMPT
+
     status.write_status("busy", "ask", os.getpid())
     print(f"Processing query: {query}", flush=True)
 
     vault_dir = get_vault_dir()
-    context = _search_vault(query, vault_dir)
+    context = _search_vault(query, vault_dir, vault_cache)
 
     if not context:
         print("No relevant context found in vault.", flush=True)
         status.mark_idle()
         return "No relevant context found in vault."
 
-    llm = LLMClient()
+    if llm is None:
+        llm = LLMClient()
     if not llm.is_available():
         print("Ollama not available.", flush=True)
         status.mark_idle()
@@ -260,7 +736,23 @@ def cmd_ask(query: str):
         return f"Error: {e}"
 
 
-def _search_vault(query: str, vault_dir: Path) -> str:
+def _read_vault_file(md_file: Path, cache: dict | None) -> tuple[str, str]:
+    """Read a vault note, reusing the cached copy while its mtime is unchanged."""
+    if cache is None:
+        content = md_file.read_text(encoding="utf-8")
+        return content, content.lower()
+
+    mtime = md_file.stat().st_mtime_ns
+    cached = cache.get(md_file)
+    if cached is not None and cached[0] == mtime:
+        return cached[1], cached[2]
+
+    content = md_file.read_text(encoding="utf-8")
+    cache[md_file] = (mtime, content, content.lower())
+    return content, content.lower()
+
+
+def _search_vault(query: str, vault_dir: Path, cache: dict | None = None) -> str:
     """Search vault for files containing query terms."""
     import re
 
@@ -274,8 +766,7 @@ def _search_vault(query: str, vault_dir: Path) -> str:
 
     for md_file in vault_dir.rglob("*.md"):
         try:
-            content = md_file.read_text(encoding="utf-8")
-            content_lower = content.lower()
+            content, content_lower = _read_vault_file(md_file, cache)
 
             for keyword in keywords:
                 if keyword in content_lower:
@@ -288,8 +779,8 @@ def _search_vault(query: str, vault_dir: Path) -> str:
     return "\n\n".join(results[:5])
 
 
-def cmd_check_mic():
-    """Check microphone access and list available devices."""
+def _probe_mic() -> dict:
+    """Initialise PortAudio and list the input devices."""
     result = {"available": False, "devices": [], "error": None}
 
     try:
@@ -325,30 +816,45 @@ def cmd_check_mic():
     except Exception as e:
         result["error"] = str(e)
 
+    return result
+
+
+def cmd_check_mic(refresh: bool = False):
+    """Check microphone access and list available devices."""
+    from .utils.probe_cache import (
+        MIC_PROBE_TTL,
+        MIC_UNAVAILABLE_TTL,
+        audio_device_fingerprint,
+        cached_probe,
+    )
+
+    result = cached_probe(
+        "mic",
+        audio_device_fingerprint(),
+        MIC_PROBE_TTL,
+        _probe_mic,
+        refresh,
+        unavailable_ttl=MIC_UNAVAILABLE_TTL,
+    )
+
     print(json.dumps(result), flush=True)
     return result
 
 
-def cmd_check_ollama():
-    """Check Ollama status."""
-    result = {"status": "not_installed", "model": OLLAMA_MODEL, "error": None}
+def _probe_ollama(llm: LLMClient | None = None) -> dict:
+    """Look for the ollama binary and ask the server whether it is up."""
+    import shutil
 
-    try:
-        system = platform.system().lower()
+    from .ai import LLMClient, OLLAMA_MODEL
 
-        if system == "windows":
-            check_cmd = ["where", "ollama"]
-        else:
-            check_cmd = ["which", "ollama"]
+    result = {"status": "not_installed", "model": OLLAMA_MODEL, "error": None}
 
-        subprocess.run(check_cmd, capture_output=True, check=True)
-    except subprocess.CalledProcessError:
-        result["status"] = "not_installed"
-        print(json.dumps(result), flush=True)
+    if shutil.which("ollama") is None:
         return result
 
     try:
-        llm = LLMClient()
+        if llm is None:
+            llm = LLMClient()
         if llm.is_available():
             result["status"] = "available"
         else:
@@ -357,12 +863,97 @@ def cmd_check_ollama():
         result["status"] = "not_running"
         result["error"] = str(e)
 
+    return result
+
+
+def cmd_check_ollama(refresh: bool = False, llm: LLMClient | None = None):
+    """Check Ollama status."""
+    from .ai.ollama_client import OLLAMA_HOST
+    from .utils.probe_cache import OLLAMA_PROBE_TTL, cached_probe, make_fingerprint
+
+    host = llm.host if llm is not None else OLLAMA_HOST
+    result = cached_probe(
+        "ollama",
+        make_fingerprint(os.environ.get("PATH", ""), host),
+        OLLAMA_PROBE_TTL,
+        lambda: _probe_ollama(llm),
+        refresh,
+    )
+
     print(json.dumps(result), flush=True)
     return result
 
 
+def _timed_step(step) -> dict:
+    """Run one warmup step and report how long it took."""
+    result = {"ok": False, "seconds": None, "error": None}
+    started = time.perf_counter()
+
+    try:
+        detail = step()
+        result["ok"] = True
+        if isinstance(detail, dict):
+            result.update(detail)
+    except Exception as e:
+        result["error"] = str(e)
+
+    result["seconds"] = round(time.perf_counter() - started, 3)
+    return result
+
+
+def cmd_warmup(
+    transcriber: Transcriber | None = None,
+    llm: LLMClient | None = None,
+    quiet: bool = False,
+) -> dict:
+    """Preload the Whisper model and the Ollama model ahead of the first hotkey.
+
+    Inside the daemon the model is loaded into the daemon itself. From the
+    CLI the request is forwarded to a running daemon if there is one;
+    otherwise the model files are read into the OS page cache so the next
+    engine process loads them from memory.
+    """
+    from .ai import LLMClient
+    from .stt.transcriber import get_model_path, prefetch_model_files
+
+    if transcriber is None:
+        try:
+            from .server.client import EngineClient
+
+            with EngineClient() as client:
+                result = client.request("warmup")
+            if not quiet:
+                print(json.dumps(result), flush=True)
+            return result
+        except (ConnectionError, OSError, RuntimeError):
+            pass
+
+    def warm_stt():
+        if transcriber is not None:
+            transcriber.load()
+            return {"mode": "daemon"}
+        model = get_model_path()
+        return {"mode": "page_cache", "bytes": prefetch_model_files(model)}
+
+    def warm_llm():
+        client = llm or LLMClient()
+        client.warmup()
+        return {"model": client.model}
+
+    result = {"stt": _timed_step(warm_stt), "llm": _timed_step(warm_llm)}
+
+    if not quiet:
+        print(json.dumps(result), flush=True)
+    return result
+
+
 def cmd_install_ollama():
     """Install Ollama and pull the model."""
+    import platform
+    import subprocess
+
+    from .ai import OLLAMA_MODEL
+
     system = platform.system().lower()
     result = {
         "status": "downloading",
@@ -424,19 +1015,48 @@ def cmd_install_ollama():
         result["status"] = "error"
         result["error"] = str(e)
 
+    from .utils.probe_cache import invalidate_probe
+
+    invalidate_probe("ollama")
+
     print(json.dumps(result), flush=True)
     return result
 
 
-def main():
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Tether Engine - Privacy-first thought ingestion"
     )
 
+    parser.add_argument(
+        "--spool", action="store_true", help="Start recording and transcribe"
+    )
+
+    parser.add_argument(
+        "--segment-seconds",
+        type=float,
+        metavar="N",
+        help="With --spool or --spool-start --shm, cut the recording into "
+        "segments of about N seconds that are transcribed while recording",
+    )
+
     parser.add_argument(
         "--spool-start", action="store_true", help="Start recording, save audio, exit"
     )
 
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="With --spool, print partial transcripts while recording",
+    )
+
+    parser.add_argument(
+        "--auto-stop",
+        type=float,
+        metavar="SECONDS",
+        help="With --spool or --spool-start, stop after SECONDS of silence",
+    )
+
     parser.add_argument(
         "--spool-transcribe",
         type=str,
@@ -444,6 +1064,34 @@ def main():
         help="Transcribe audio file and save to spool",
     )
 
+    parser.add_argument(
+        "--spool-transcribe-batch",
+        type=str,
+        metavar="DIR",
+        help="Transcribe every recording left in DIR (e.g. ~/.tether/audio) "
+        "with one model load, oldest first",
+    )
+
+    parser.add_argument(
+        "--shm",
+        action="store_true",
+        help="With --spool-start, also publish audio to shared memory",
+    )
+
+    parser.add_argument(
+        "--spool-transcribe-shm",
+        type=str,
+        metavar="NAME",
+        help="Transcribe audio from a --spool-start --shm recording as it arrives",
+    )
+
+    parser.add_argument(
+        "--archive",
+        type=str,
+        metavar="AUDIO_PATH",
+        help="Compress a transcribed recording to FLAC",
+    )
+
     parser.add_argument(
         "--weave", action="store_true", help="Process daily notes into knowledge graph"
     )
@@ -458,25 +1106,181 @@ def main():
         "--check-ollama", action="store_true", help="Check Ollama status"
     )
 
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="With --check-mic/--check-ollama, ignore cached results and re-probe",
+    )
+
     parser.add_argument("--install-ollama", action="store_true", help="Install Ollama")
 
+    parser.add_argument(
+        "--warmup",
+        action="store_true",
+        help="Preload the STT and LLM models and report how long each took",
+    )
+
+    parser.add_argument(
+        "--import-profile",
+        action="store_true",
+        help="Report the import cost of the rest of the command line",
+    )
+
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run as a long-lived daemon speaking JSON lines on stdin/stdout",
+    )
+
+    parser.add_argument(
+        "--listen",
+        nargs="?",
+        const="",
+        metavar="ADDRESS",
+        help="With --serve, listen on a local socket instead of stdin/stdout",
+    )
+
+    parser.add_argument(
+        "--stt-workers",
+        type=int,
+        metavar="N",
+        help="With --serve, run up to N transcriptions at once on one shared model",
+    )
+
+    parser.add_argument(
+        "--preroll",
+        type=float,
+        default=0.0,
+        metavar="SECONDS",
+        help="With --serve, keep the mic open and start recordings SECONDS early",
+    )
+
+    parser.add_argument(
+        "--warm-stream",
+        action="store_true",
+        help="With --serve, keep the mic open between recordings so they "
+        "start instantly",
+    )
+
+    parser.add_argument(
+        "--idle-release",
+        type=float,
+        metavar="SECONDS",
+        help="With --warm-stream or --preroll, release the mic after SECONDS "
+        "without a recording (default: keep it)",
+    )
+
+    parser.add_argument(
+        "--model-tiers",
+        type=lambda value: [tier for tier in value.split(",") if tier],
+        metavar="MODELS",
+        help="With --serve or --spool-transcribe*, pick the Whisper model per "
+        "clip from these comma-separated models, smallest first "
+        "(e.g. tiny.en,base.en,small.en)",
+    )
+
+    parser.add_argument(
+        "--target-rtf",
+        type=float,
+        metavar="RATIO",
+        help="With --model-tiers, transcription seconds allowed per second "
+        "of audio (default: 0.5)",
+    )
+
+    parser.add_argument(
+        "--client",
+        action="store_true",
+        help="Run the command on the running engine server if there is one",
+    )
+
+    return parser
+
+
+def _transcriber(args) -> Transcriber | None:
+    """The tiered transcriber --model-tiers asks for; None for the default."""
+    if not args.model_tiers:
+        return None
+
+    from .stt.tiers import create_transcriber
+
+    return create_transcriber(args.model_tiers, args.target_rtf)
+
+
+def main():
+    parser = build_parser()
     args = parser.parse_args()
 
-    if args.spool_start:
-        cmd_spool_start()
+    if args.import_profile:
+        from .utils.import_profile import profile_imports
+
+        argv = [arg for arg in sys.argv[1:] if arg != "--import-profile"]
+        print(json.dumps(profile_imports(argv), indent=2), flush=True)
+        return
+
+    if args.client:
+        from .server.client import run_client
+
+        if run_client(args):
+            return
+        print("Engine server not available, running locally.", file=sys.stderr)
+
+    if args.serve:
+        if args.listen is not None:
+            from .server.rpc import serve_socket
+
+            serve_socket(
+                args.listen or None,
+                stt_workers=args.stt_workers,
+                preroll=args.preroll,
+                warm_stream=args.warm_stream,
+                idle_release=args.idle_release,
+                model_tiers=args.model_tiers,
+                target_rtf=args.target_rtf,
+            )
+        else:
+            from .server import serve_stdio
+
+            serve_stdio(
+                stt_workers=args.stt_workers,
+                preroll=args.preroll,
+                warm_stream=args.warm_stream,
+                idle_release=args.idle_release,
+                model_tiers=args.model_tiers,
+                target_rtf=args.target_rtf,
+            )
+    elif args.spool:
+        cmd_spool(
+            segment_seconds=args.segment_seconds,
+            auto_stop_seconds=args.auto_stop,
+            stream=args.stream,
+        )
+    elif args.spool_start:
+        cmd_spool_start(
+            shm=args.shm,
+            segment_seconds=args.segment_seconds,
+            auto_stop_seconds=args.auto_stop,
+        )
     elif args.spool_transcribe:
-        cmd_spool_transcribe(args.spool_transcribe)
+        cmd_spool_transcribe(args.spool_transcribe, transcriber=_transcriber(args))
+    elif args.spool_transcribe_batch:
+        cmd_spool_transcribe_batch(args.spool_transcribe_batch, _transcriber(args))
+    elif args.spool_transcribe_shm:
+        cmd_spool_transcribe_shm(args.spool_transcribe_shm, _transcriber(args))
+    elif args.archive:
+        cmd_archive(args.archive)
     elif args.weave:
         cmd_weave()
     elif args.ask:
         result = cmd_ask(args.ask)
         print(result)
     elif args.check_mic:
-        cmd_check_mic()
+        cmd_check_mic(refresh=args.refresh)
     elif args.check_ollama:
-        cmd_check_ollama()
+        cmd_check_ollama(refresh=args.refresh)
     elif args.install_ollama:
         cmd_install_ollama()
+    elif args.warmup:
+        cmd_warmup()
     else:
         parser.print_help()
 
@@ -0,0 +1,20 @@
+import importlib
+
+# Each name's submodule. They load on first use, so ``--client`` and
+# ``--warmup`` do not pull in the daemon and the STT stack behind it.
+_EXPORTS = {
+    "EngineDaemon": ".daemon",
+    "serve_stdio": ".daemon",
+    "WorkerPools": ".pools",
+    "RpcServer": ".rpc",
+    "serve_socket": ".rpc",
+    "EngineClient": ".client",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
@@ -0,0 +1,175 @@
+"""
+Thin client that runs engine CLI commands against a running server.
+
+``python -m engine --client --ask "query"`` behaves like ``--ask`` but is
+answered by the warm daemon instead of a fresh interpreter.
+"""
+
+import itertools
+import json
+import signal
+import threading
+
+from .rpc import open_connection, read_server_address, read_server_token
+
+
+class EngineClient:
+    """Sends requests to a running engine server and waits for the answers."""
+
+    def __init__(
+        self,
+        address: str | None = None,
+        timeout: float = 2.0,
+        token: str | None = None,
+    ):
+        address = address or read_server_address()
+        if not address:
+            raise ConnectionError("No engine server is running")
+        if token is None and address == read_server_address():
+            token = read_server_token()
+        self._token = token
+
+        self._sock = open_connection(address, timeout=timeout)
+        self._reader = self._sock.makefile("r", encoding="utf-8")
+        self._ids = itertools.count(1)
+
+    def request(self, cmd: str, on_event=None, **args):
+        """Send a request and block until its response arrives.
+
+        Events received in the meantime are passed to ``on_event``.
+        """
+        request_id = next(self._ids)
+        request = {"id": request_id, "cmd": cmd, "args": args}
+        if self._token is not None:
+            request["token"] = self._token
+        line = json.dumps(request) + "\n"
+        self._sock.sendall(line.encode("utf-8"))
+
+        for raw in self._reader:
+            message = json.loads(raw)
+
+            if "event" in message:
+                if on_event is not None:
+                    on_event(message)
+                continue
+
+            if message.get("id") != request_id:
+                continue
+
+            if not message.get("ok"):
+                raise RuntimeError(message.get("error"))
+            return message.get("result")
+
+        raise ConnectionError("Engine server closed the connection")
+
+    def close(self) -> None:
+        self._reader.close()
+        self._sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _wait_for_stop_signal(poll=None) -> None:
+    """Block until SIGINT or SIGTERM, the way ``--spool-start`` does.
+
+    ``poll`` is called every half second and ends the wait by returning True.
+    """
+    stop = threading.Event()
+
+    def handler(signum, frame):
+        stop.set()
+
+    signal.signal(signal.SIGINT, handler)
+    signal.signal(signal.SIGTERM, handler)
+
+    while not stop.wait(0.5):
+        if poll is not None and poll():
+            return
+
+
+def run_client(args) -> bool:
+    """Run a parsed CLI command on the server.
+
+    Returns False when there is no server or the command is not served, so
+    the caller can fall back to running it locally.
+    """
+    try:
+        client = EngineClient()
+    except (ConnectionError, OSError):
+        return False
+
+    with client:
+        if args.spool or args.spool_start:
+            client.request(
+                "spool_start",
+                segment_seconds=args.segment_seconds,
+                auto_stop_seconds=args.auto_stop,
+                stream=args.stream,
+            )
+            print("Recording started...", flush=True)
+
+            # The server finishes an auto-stopped recording itself and sends
+            # the result as an event; that and any captions arrive while
+            # polling status.
+            auto_stopped = {}
+
+            def on_event(message):
+                event, data = message.get("event"), message.get("data", {})
+                if event == "recording-auto-stopped":
+                    auto_stopped.update(data)
+                elif event == "transcription-partial":
+                    print(f"Partial {data['segment']}: {data['text']}", flush=True)
+                elif event == "transcription" and "segment" in data:
+                    print(f"Segment {data['segment']}: {data['text']}", flush=True)
+
+            def poll():
+                client.request("status", on_event=on_event)
+                return bool(auto_stopped)
+
+            _wait_for_stop_signal(poll if args.auto_stop or args.stream else None)
+
+            if auto_stopped:
+                print("Silence detected, recording stopped.", flush=True)
+                result = auto_stopped
+            else:
+                result = client.request("spool_stop", transcribe=bool(args.spool))
+            if result.get("trimmed_seconds"):
+                seconds = result["trimmed_seconds"]
+                print(f"Trimmed {seconds:.1f}s of silence.", flush=True)
+            audio_path = result.get("audio_path")
+            if audio_path:
+                print(f"AUDIO_PATH:{audio_path}", flush=True)
+                print(f"Audio saved to: {audio_path}", flush=True)
+            else:
+                print("No audio recorded.", flush=True)
+            if result.get("text"):
+                print(f"Text: {result['text']}", flush=True)
+        elif args.spool_transcribe:
+            text = client.request("spool_transcribe", audio_path=args.spool_transcribe)
+            if text:
+                print(f"TRANSCRIPTION:{text}", flush=True)
+            else:
+                print("No text transcribed.", flush=True)
+        elif args.weave:
+            entities = client.request("weave")
+            if entities is not None:
+                print(
+                    f"Extracted entities: {json.dumps(entities, indent=2)}", flush=True
+                )
+                print("Weave complete!", flush=True)
+        elif args.ask:
+            print(client.request("ask", query=args.ask), flush=True)
+        elif args.check_mic:
+            result = client.request("check_mic", refresh=args.refresh)
+            print(json.dumps(result), flush=True)
+        elif args.check_ollama:
+            result = client.request("check_ollama", refresh=args.refresh)
+            print(json.dumps(result), flush=True)
+        else:
+            return False
+
+    return True
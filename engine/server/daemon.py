@@ -0,0 +1,496 @@
+"""
+Long-lived engine daemon.
+
+Requests and responses are newline-delimited JSON:
+
+    -> {"id": 1, "cmd": "ask", "args": {"query": "..."}}
+    <- {"id": 1, "ok": true, "result": "..."}
+    <- {"id": 1, "ok": false, "error": "..."}
+
+Events are pushed on the same stream and carry an ``event`` key instead of
+``ok``:
+
+    <- {"event": "ready", "id": null, "data": {"pid": 1234}}
+"""
+
+import json
+import os
+import sys
+import threading
+from typing import Callable, Optional
+
+from ..utils import status
+from .pools import INLINE_COMMANDS, WorkerPools, read_memory_kb
+from ..audio import AudioRecorder
+from ..audio.archive import ArchiveEncoder
+from ..stt import Spool, Transcriber
+from ..stt.transcriber import loaded_models, unload_models
+from ..stt.pipeline import SegmentPipeline
+from ..stt.streaming import WINDOW_SECONDS, StreamingPipeline
+from ..stt.tiers import create_transcriber
+from ..ai import LLMClient
+from ..main import (
+    cmd_spool_transcribe,
+    cmd_weave,
+    cmd_ask,
+    cmd_check_mic,
+    cmd_check_ollama,
+    cmd_warmup,
+)
+
+
+class EngineDaemon:
+    """Keeps the Whisper model, LLM client and vault cache warm between requests."""
+
+    def __init__(
+        self,
+        emit: Optional[Callable[[dict], None]] = None,
+        pools: Optional[WorkerPools] = None,
+        stt_workers: int | None = None,
+        preroll: float = 0.0,
+        warm_stream: bool = False,
+        idle_release: float | None = None,
+        model_tiers: list[str] | None = None,
+        target_rtf: float | None = None,
+    ):
+        self._emit = emit
+        self.pools = pools
+        self.stt_workers = stt_workers
+        self._transcriber = None
+        self.model_tiers = model_tiers
+        self.target_rtf = target_rtf
+        self._llm = None
+        self._archiver = None
+        self._recorder = None
+        self._pipeline = None
+        self._armed_recorder = None
+        self._vault_cache = {}
+        self._running = True
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._handlers = {
+            "ping": self._cmd_ping,
+            "status": self._cmd_status,
+            "spool_start": self._cmd_spool_start,
+            "spool_stop": self._cmd_spool_stop,
+            "spool_transcribe": self._cmd_spool_transcribe,
+            "weave": self._cmd_weave,
+            "ask": self._cmd_ask,
+            "check_mic": self._cmd_check_mic,
+            "check_ollama": self._cmd_check_ollama,
+            "warmup": self._cmd_warmup,
+            "pool_stats": self._cmd_pool_stats,
+            "unload_model": self._cmd_unload_model,
+            "shutdown": self._cmd_shutdown,
+        }
+
+        self.preroll = preroll
+        if preroll or warm_stream:
+            self._arm_recorder(preroll, idle_release)
+
+    def _arm_recorder(self, preroll: float, idle_release: float | None) -> None:
+        """Keep the microphone open, with a ``preroll`` seconds ring if nonzero."""
+        recorder = AudioRecorder(trim_silence=True)
+        try:
+            recorder.arm(preroll, idle_release=idle_release)
+        except Exception as e:
+            print(
+                f"Warm stream disabled, could not open microphone: {e}",
+                file=sys.stderr,
+            )
+            return
+        self._armed_recorder = recorder
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    @property
+    def commands(self) -> list[str]:
+        return sorted(self._handlers)
+
+    def transcriber(self) -> Transcriber:
+        """Get the shared transcriber, loading it on first use.
+
+        With ``stt_workers`` its one model serves that many transcriptions
+        at once, one per STT pool thread; with ``model_tiers`` it is a
+        ``TieredTranscriber``.
+        """
+        with self._lock:
+            if self._transcriber is None:
+                self._transcriber = create_transcriber(
+                    self.model_tiers, self.target_rtf, self.stt_workers or 1
+                )
+            return self._transcriber
+
+    def llm(self) -> LLMClient:
+        """Get the shared LLM client, creating it on first use."""
+        with self._lock:
+            if self._llm is None:
+                self._llm = LLMClient()
+            return self._llm
+
+    def archiver(self) -> ArchiveEncoder:
+        """Get the background FLAC encoder, starting it on first use."""
+        with self._lock:
+            if self._archiver is None:
+                self._archiver = ArchiveEncoder()
+            return self._archiver
+
+    def emit(self, event: str, request_id=None, **data) -> None:
+        """Push an event to the client that sent the current request."""
+        emit = getattr(self._local, "emit", None) or self._emit
+        if emit is not None:
+            emit({"event": event, "id": request_id, "data": data})
+
+    def submit(self, request, write: Callable[[dict], None]):
+        """Answer a request on its worker pool, or inline when there is none.
+
+        Returns the pool future, or ``None`` if the response was already written.
+        """
+        cmd = request.get("cmd") if isinstance(request, dict) else None
+
+        if self.pools is None or cmd in INLINE_COMMANDS or cmd not in self._handlers:
+            write(self.handle(request, emit=write))
+            return None
+
+        return self.pools.submit(cmd, lambda: write(self.handle(request, emit=write)))
+
+    def handle(
+        self, request: dict, emit: Optional[Callable[[dict], None]] = None
+    ) -> dict:
+        """Dispatch a single request and build its response.
+
+        Events raised while handling go to ``emit`` when given, so each client
+        only sees events for its own requests.
+        """
+        self._local.emit = emit
+        try:
+            return self._handle(request)
+        finally:
+            self._local.emit = None
+
+    def _handle(self, request: dict) -> dict:
+        if not isinstance(request, dict):
+            return {"id": None, "ok": False, "error": "Request must be an object"}
+
+        request_id = request.get("id")
+        cmd = request.get("cmd")
+        handler = self._handlers.get(cmd)
+
+        if handler is None:
+            return {"id": request_id, "ok": False, "error": f"Unknown command: {cmd}"}
+
+        args = request.get("args") or {}
+        try:
+            result = handler(request_id, **args)
+        except Exception as e:
+            return {"id": request_id, "ok": False, "error": str(e)}
+
+        return {"id": request_id, "ok": True, "result": result}
+
+    def close(self) -> None:
+        """Stop any recording in progress, finish archiving and mark the engine idle."""
+        if self._recorder is not None and self._recorder.is_recording():
+            self._recorder.stop()
+        self._recorder = None
+        if self._pipeline is not None:
+            self._pipeline.close()
+            self._pipeline = None
+        if self._armed_recorder is not None:
+            self._armed_recorder.disarm()
+            self._armed_recorder = None
+        if self._archiver is not None:
+            self._archiver.close()
+            self._archiver = None
+        status.mark_idle()
+
+    def _cmd_ping(self, request_id):
+        return {"pid": os.getpid()}
+
+    def _cmd_status(self, request_id):
+        recorder = self._recorder or self._armed_recorder
+        return {
+            **status.read_status(),
+            "recorder_health": recorder.health_report() if recorder else None,
+            "recording": self._recorder is not None and self._recorder.is_recording(),
+            "preroll_armed": self._armed_recorder is not None and bool(self.preroll),
+            "stream_open": recorder is not None and recorder.stream_open,
+            "transcriber_loaded": self._transcriber is not None
+            and self._transcriber.is_loaded,
+            "models": loaded_models(),
+        }
+
+    def _segment_pipeline(
+        self, request_id, transcriber, live_recorder=None
+    ) -> SegmentPipeline:
+        """A pipeline that spools each segment and reports it to this client.
+
+        With ``live_recorder`` it also sends ``transcription-partial`` events
+        for the segment being recorded, replaced by its ``transcription``.
+        """
+        # Segments finish on the pipeline thread, outside this request's
+        # handler, so bind the requesting client's emitter now.
+        emit = getattr(self._local, "emit", None) or self._emit
+
+        def emitter(event):
+            def send(index, text, started_at):
+                if emit is not None:
+                    data = {"text": text, "segment": index, "started_at": started_at}
+                    emit({"event": event, "id": request_id, "data": data})
+
+            return send
+
+        if live_recorder is not None:
+            return StreamingPipeline(
+                transcriber,
+                live_recorder.live_segment,
+                Spool(use_spools=True),
+                on_text=emitter("transcription"),
+                on_partial=emitter("transcription-partial"),
+            )
+        return SegmentPipeline(
+            transcriber, Spool(use_spools=True), on_text=emitter("transcription")
+        )
+
+    def _cmd_spool_start(
+        self,
+        request_id,
+        segment_seconds: float | None = None,
+        auto_stop_seconds: float | None = None,
+        stream: bool = False,
+    ):
+        if stream:
+            segment_seconds = segment_seconds or WINDOW_SECONDS
+        # Before taking the lock, which loading the model needs too.
+        transcriber = self.transcriber() if segment_seconds else None
+
+        with self._lock:
+            if self._recorder is not None and self._recorder.is_recording():
+                raise RuntimeError("Already recording")
+
+            recorder = self._armed_recorder or AudioRecorder(trim_silence=True)
+            self._pipeline = None
+            recorder.segment_seconds = segment_seconds
+            recorder.on_segment = None
+            if segment_seconds:
+                self._pipeline = self._segment_pipeline(
+                    request_id, transcriber, recorder if stream else None
+                )
+                recorder.on_segment = self._pipeline.submit
+            recorder.auto_stop_seconds = auto_stop_seconds
+            recorder.on_auto_stop = self._auto_stop_handler(request_id, recorder)
+
+            self._recorder = recorder
+            self._recorder.start()
+
+        status.write_status("recording", "spool", os.getpid())
+        self.emit("recording-started", request_id)
+        return {"recording": True}
+
+    def _auto_stop_handler(self, request_id, recorder):
+        """Finish ``recorder``'s recording on silence and report it to this client."""
+        emit = getattr(self._local, "emit", None) or self._emit
+
+        def on_auto_stop():
+            # Runs on the recorder's auto-stop thread; answer the client that
+            # started the recording, as the hotkey's spool_stop would have.
+            self._local.emit = emit
+            try:
+                result = self._stop_recording(request_id, True, only=recorder)
+            except RuntimeError:
+                # Stopped by hand in the meantime.
+                return
+            self.emit("recording-auto-stopped", request_id, **result)
+
+        return on_auto_stop
+
+    def _cmd_spool_stop(self, request_id, transcribe: bool = False):
+        return self._stop_recording(request_id, transcribe)
+
+    def _stop_recording(self, request_id, transcribe: bool, only=None) -> dict:
+        """Finish the current recording; with ``only``, just if it is that one."""
+        with self._lock:
+            if only is not None and self._recorder is not only:
+                raise RuntimeError("Not recording")
+            recorder, self._recorder = self._recorder, None
+            pipeline, self._pipeline = self._pipeline, None
+
+        if recorder is None or not recorder.is_recording():
+            raise RuntimeError("Not recording")
+
+        audio_path = recorder.stop()
+        health = recorder.health_report()
+        if health is not None:
+            status.write_metrics("recorder", health)
+        status.mark_idle("spool")
+        self.emit("recording-stopped", request_id)
+
+        result = {
+            "audio_path": str(audio_path) if audio_path else None,
+            "trimmed_seconds": recorder.trimmed_seconds,
+            "preroll_seconds": recorder.preroll_seconds,
+            "auto_stopped": recorder.auto_stopped,
+            "text": None,
+        }
+        if pipeline is not None:
+            # Earlier segments are already done; this waits for the last one.
+            result["segments"] = recorder.segments
+            result["text"] = pipeline.close() or None
+            if audio_path:
+                self.archiver().submit(audio_path)
+        elif transcribe and audio_path:
+            # Hand the samples over directly instead of re-reading the WAV.
+            result["text"] = self._on_stt_pool(
+                self._transcribe,
+                request_id,
+                str(audio_path),
+                recorder.get_audio_float(),
+            )
+            # Known once the samples were trimmed for the hand-off.
+            result["trimmed_seconds"] = recorder.trimmed_seconds
+        return result
+
+    def _on_stt_pool(self, fn, *args):
+        """Run ``fn`` on the STT pool and wait for it, keeping this client's emitter.
+
+        For handlers on another pool that only need the STT pool for part of
+        their work.
+        """
+        if self.pools is None:
+            return fn(*args)
+
+        emit = getattr(self._local, "emit", None)
+
+        def run():
+            self._local.emit = emit
+            try:
+                return fn(*args)
+            finally:
+                self._local.emit = None
+
+        return self.pools.submit("spool_transcribe", run).result()
+
+    def _cmd_spool_transcribe(self, request_id, audio_path: str):
+        return self._transcribe(request_id, audio_path)
+
+    def _transcribe(self, request_id, audio_path: str, audio=None):
+        text = cmd_spool_transcribe(
+            audio_path,
+            transcriber=self.transcriber(),
+            archiver=self.archiver(),
+            audio=audio,
+        )
+        if text:
+            self.emit("transcription", request_id, text=text)
+        return text
+
+    def _cmd_weave(self, request_id):
+        return cmd_weave(llm=self.llm())
+
+    def _cmd_ask(self, request_id, query: str):
+        return cmd_ask(query, llm=self.llm(), vault_cache=self._vault_cache)
+
+    def _cmd_check_mic(self, request_id, refresh: bool = False):
+        return cmd_check_mic(refresh=refresh)
+
+    def _cmd_check_ollama(self, request_id, refresh: bool = False):
+        return cmd_check_ollama(refresh=refresh, llm=self.llm())
+
+    def _cmd_warmup(self, request_id):
+        return cmd_warmup(transcriber=self.transcriber(), llm=self.llm(), quiet=True)
+
+    def _cmd_pool_stats(self, request_id):
+        stats = self.pools.stats() if self.pools is not None else {}
+        stats["stt_model"] = {
+            "workers": self.stt_workers or 1,
+            "models": loaded_models(),
+            "process": {"pid": os.getpid(), **read_memory_kb(os.getpid())},
+        }
+        return stats
+
+    def _cmd_unload_model(self, request_id):
+        """Free the Whisper model's memory; the next transcription reloads it."""
+        with self._lock:
+            transcriber, self._transcriber = self._transcriber, None
+        if transcriber is not None:
+            transcriber.unload()
+        return {"unloaded": unload_models(), "models": loaded_models()}
+
+    def _cmd_shutdown(self, request_id):
+        self._running = False
+        return {"shutdown": True}
+
+
+def serve_stdio(
+    stdin=None,
+    stdout=None,
+    pool_sizes: dict | None = None,
+    stt_workers: int | None = None,
+    preroll: float = 0.0,
+    warm_stream: bool = False,
+    idle_release: float | None = None,
+    model_tiers: list[str] | None = None,
+    target_rtf: float | None = None,
+) -> None:
+    """Serve JSON-line requests from stdin until EOF or a shutdown request.
+
+    Requests run on worker pools, so responses may arrive out of order; match
+    them to requests by ``id``. With ``preroll`` the microphone stays open and
+    recordings start with that many seconds from before ``spool_start``;
+    ``warm_stream`` keeps it open without the pre-roll. ``idle_release``
+    closes it after that many idle seconds until the next recording.
+    ``model_tiers`` picks the Whisper model per clip (see ``stt.tiers``).
+    """
+    stdin = stdin or sys.stdin
+    out = stdout or sys.stdout
+    write_lock = threading.Lock()
+
+    def write(message: dict) -> None:
+        line = json.dumps(message, default=str)
+        with write_lock:
+            out.write(line + "\n")
+            out.flush()
+
+    # Command output is human-oriented chatter; keep it off the protocol stream.
+    real_stdout = sys.stdout
+    sys.stdout = sys.stderr
+
+    if stt_workers:
+        pool_sizes = {**(pool_sizes or {}), "stt": stt_workers}
+
+    daemon = EngineDaemon(
+        emit=write,
+        pools=WorkerPools(pool_sizes),
+        stt_workers=stt_workers,
+        preroll=preroll,
+        warm_stream=warm_stream,
+        idle_release=idle_release,
+        model_tiers=model_tiers,
+        target_rtf=target_rtf,
+    )
+    if stt_workers:
+        # Requests are only read once the shared model is loaded.
+        daemon.transcriber().load()
+    daemon.emit("ready", pid=os.getpid(), commands=daemon.commands)
+
+    try:
+        for line in stdin:
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as e:
+                write({"id": None, "ok": False, "error": f"Invalid JSON: {e}"})
+                continue
+
+            daemon.submit(request, write)
+
+            if not daemon.running:
+                break
+    finally:
+        daemon.pools.shutdown(wait=True)
+        daemon.close()
+        sys.stdout = real_stdout
@@ -0,0 +1,95 @@
+"""Worker pools that keep slow workloads from blocking each other."""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+# Which pool each daemon command runs on. Anything not listed is cheap I/O.
+# spool_stop stops the microphone on I/O and queues only its transcription
+# on STT, so a stop never waits behind another transcription.
+WORKLOADS = {
+    "spool_transcribe": "stt",
+    "warmup": "stt",
+    "unload_model": "stt",
+    "weave": "llm",
+    "ask": "llm",
+}
+
+# Commands answered on the reader thread so they are never queued behind work.
+INLINE_COMMANDS = {"shutdown", "pool_stats"}
+
+DEFAULT_POOL_SIZES = {"stt": 1, "llm": 2, "io": 4}
+
+
+def read_memory_kb(pid: int) -> dict:
+    """Read a process's resident and proportional set sizes from /proc."""
+    memory = {"rss_kb": None, "pss_kb": None}
+
+    status_path = Path(f"/proc/{pid}/status")
+    rollup_path = Path(f"/proc/{pid}/smaps_rollup")
+
+    try:
+        for line in status_path.read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                memory["rss_kb"] = int(line.split()[1])
+                break
+    except (OSError, ValueError):
+        pass
+
+    # PSS splits shared pages (libraries, the interpreter) between the
+    # processes mapping them, so it is this process's fair share of memory.
+    try:
+        for line in rollup_path.read_text().splitlines():
+            if line.startswith("Pss:"):
+                memory["pss_kb"] = int(line.split()[1])
+                break
+    except (OSError, ValueError):
+        pass
+
+    return memory
+
+
+class WorkerPools:
+    """A thread pool per workload (STT, LLM, I/O) with queue-depth accounting."""
+
+    def __init__(self, sizes: dict | None = None):
+        self.sizes = {**DEFAULT_POOL_SIZES, **(sizes or {})}
+        self._executors = {
+            name: ThreadPoolExecutor(max_workers=size, thread_name_prefix=name)
+            for name, size in self.sizes.items()
+        }
+        self._pending = {name: 0 for name in self.sizes}
+        self._lock = threading.Lock()
+
+    def workload(self, cmd: str) -> str:
+        """Get the pool name a command runs on."""
+        return WORKLOADS.get(cmd, "io")
+
+    def submit(self, cmd: str, fn: Callable, *args, **kwargs) -> Future:
+        """Run ``fn`` on the pool for ``cmd``."""
+        name = self.workload(cmd)
+
+        with self._lock:
+            self._pending[name] += 1
+
+        future = self._executors[name].submit(fn, *args, **kwargs)
+        future.add_done_callback(lambda _: self._done(name))
+        return future
+
+    def _done(self, name: str) -> None:
+        with self._lock:
+            self._pending[name] -= 1
+
+    def stats(self) -> dict:
+        """Get pool sizes and the number of queued or running requests."""
+        with self._lock:
+            return {
+                name: {"workers": self.sizes[name], "pending": self._pending[name]}
+                for name in self.sizes
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop all pools, optionally waiting for in-flight requests."""
+        for executor in self._executors.values():
+            executor.shutdown(wait=wait)
@@ -0,0 +1,279 @@
+"""
+Local socket server for the engine daemon.
+
+Listens on ``~/.tether/engine.sock`` (or a loopback TCP port where Unix
+sockets are unavailable) and serves several clients at once. The address in
+use is written to ``~/.tether/engine.addr`` for clients to discover.
+
+A Unix socket is only reachable by its owner. A TCP port is open to every
+local user, so a TCP server also writes a random token to the owner-only
+address file and answers only requests that carry it.
+"""
+
+from __future__ import annotations
+
+import hmac
+import json
+import os
+import secrets
+import socket
+import socketserver
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ..utils import get_tether_dir
+from .pools import WorkerPools
+
+# The daemon pulls in engine.main and the STT stack; --client only needs
+# the connection helpers here, so the daemon is imported where it is built.
+if TYPE_CHECKING:
+    from .daemon import EngineDaemon
+
+
+def get_socket_path() -> Path:
+    """Get the path of the engine's Unix socket."""
+    return get_tether_dir() / "engine.sock"
+
+
+def get_address_file_path() -> Path:
+    """Get the path of the file advertising the running server's address."""
+    return get_tether_dir() / "engine.addr"
+
+
+def _read_address_file() -> list[str]:
+    try:
+        text = get_address_file_path().read_text(encoding="utf-8")
+    except OSError:
+        return []
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+def read_server_address() -> str | None:
+    """Read the advertised server address, e.g. ``unix:/path`` or ``tcp:host:port``."""
+    lines = _read_address_file()
+    return lines[0] if lines else None
+
+
+def read_server_token() -> str | None:
+    """Read the token a TCP server requires on every request, if any."""
+    lines = _read_address_file()
+    return lines[1] if len(lines) > 1 else None
+
+
+def _write_address_file(address: str, token: str | None) -> None:
+    """Write the address file readable by its owner only."""
+    path = get_address_file_path()
+    path.unlink(missing_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(address if token is None else f"{address}\n{token}")
+
+
+def open_connection(address: str, timeout: float | None = None) -> socket.socket:
+    """Connect to a server address as written by ``RpcServer``."""
+    kind, _, target = address.partition(":")
+
+    if kind == "unix":
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        sock.connect(target)
+    elif kind == "tcp":
+        host, _, port = target.rpartition(":")
+        sock = socket.create_connection((host, int(port)), timeout=timeout)
+    else:
+        raise ValueError(f"Unknown engine address: {address}")
+
+    sock.settimeout(None)
+    return sock
+
+
+class _ConnectionHandler(socketserver.StreamRequestHandler):
+    """Reads JSON-line requests from one client and dispatches them to the pools."""
+
+    def handle(self):
+        server: RpcServer = self.server.rpc
+        write_lock = threading.Lock()
+        futures = []
+
+        def write(message: dict) -> None:
+            line = (json.dumps(message, default=str) + "\n").encode("utf-8")
+            with write_lock:
+                try:
+                    self.wfile.write(line)
+                    self.wfile.flush()
+                except OSError:
+                    pass
+
+        for raw in self.rfile:
+            line = raw.decode("utf-8").strip()
+            if not line:
+                continue
+
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as e:
+                write({"id": None, "ok": False, "error": f"Invalid JSON: {e}"})
+                continue
+
+            if not server.authorized(request):
+                request_id = request.get("id") if isinstance(request, dict) else None
+                write({"id": request_id, "ok": False, "error": "Unauthorized"})
+                continue
+
+            futures.append(server.daemon.submit(request, write))
+
+            if not server.daemon.running:
+                server.stop()
+                break
+
+        # Keep the connection open until this client's requests have answered.
+        for future in futures:
+            if future is not None:
+                future.result()
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class _TcpServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class RpcServer:
+    """Serves an ``EngineDaemon`` to many local clients concurrently."""
+
+    def __init__(
+        self,
+        daemon: EngineDaemon | None = None,
+        pools: WorkerPools | None = None,
+        address: str | None = None,
+    ):
+        if daemon is None:
+            from .daemon import EngineDaemon
+
+            daemon = EngineDaemon()
+        self.daemon = daemon
+        self.pools = pools or self.daemon.pools or WorkerPools()
+        self.daemon.pools = self.pools
+        self.address = address
+        self.token = None
+        self._server = None
+
+    def _bind(self):
+        if self.address is None:
+            if hasattr(socket, "AF_UNIX"):
+                self.address = f"unix:{get_socket_path()}"
+            else:
+                self.address = "tcp:127.0.0.1:0"
+
+        kind, _, target = self.address.partition(":")
+
+        if kind == "unix":
+            _remove_stale_socket(target)
+            server = _UnixServer(target, _ConnectionHandler)
+            os.chmod(target, 0o600)
+        elif kind == "tcp":
+            host, _, port = target.rpartition(":")
+            server = _TcpServer((host, int(port)), _ConnectionHandler)
+            bound_host, bound_port = server.server_address[:2]
+            self.address = f"tcp:{bound_host}:{bound_port}"
+            self.token = secrets.token_hex(16)
+        else:
+            raise ValueError(f"Unknown engine address: {self.address}")
+
+        server.rpc = self
+        return server
+
+    def start(self) -> str:
+        """Bind the socket and advertise its address. Returns the address."""
+        self._server = self._bind()
+        _write_address_file(self.address, self.token)
+        return self.address
+
+    def authorized(self, request) -> bool:
+        """Whether ``request`` carries this server's token, where it has one."""
+        if self.token is None:
+            return True
+        token = request.get("token") if isinstance(request, dict) else None
+        return isinstance(token, str) and hmac.compare_digest(token, self.token)
+
+    def serve_forever(self) -> None:
+        """Serve clients until a shutdown request arrives."""
+        if self._server is None:
+            self.start()
+        try:
+            self._server.serve_forever()
+        finally:
+            self.close()
+
+    def stop(self) -> None:
+        """Ask ``serve_forever`` to return. Safe to call from a handler thread."""
+        if self._server is not None:
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+
+    def close(self) -> None:
+        """Wait for in-flight requests, then release the socket."""
+        self.pools.shutdown(wait=True)
+        self.daemon.close()
+
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+
+        if read_server_address() == self.address:
+            get_address_file_path().unlink(missing_ok=True)
+
+        kind, _, target = (self.address or "").partition(":")
+        if kind == "unix":
+            Path(target).unlink(missing_ok=True)
+
+
+def _remove_stale_socket(path: str) -> None:
+    """Remove a socket file left behind by a server that is no longer running."""
+    if not os.path.exists(path):
+        return
+
+    try:
+        open_connection(f"unix:{path}", timeout=0.5).close()
+    except OSError:
+        os.unlink(path)
+        return
+
+    raise RuntimeError(f"An engine server is already listening on {path}")
+
+
+def serve_socket(
+    address: str | None = None,
+    pool_sizes: dict | None = None,
+    stt_workers: int | None = None,
+    preroll: float = 0.0,
+    warm_stream: bool = False,
+    idle_release: float | None = None,
+    model_tiers: list[str] | None = None,
+    target_rtf: float | None = None,
+) -> None:
+    """Run the socket server until shutdown."""
+    from .daemon import EngineDaemon
+
+    if stt_workers:
+        pool_sizes = {**(pool_sizes or {}), "stt": stt_workers}
+
+    pools = WorkerPools(pool_sizes)
+    daemon = EngineDaemon(
+        pools=pools,
+        stt_workers=stt_workers,
+        preroll=preroll,
+        warm_stream=warm_stream,
+        idle_release=idle_release,
+        model_tiers=model_tiers,
+        target_rtf=target_rtf,
+    )
+    if stt_workers:
+        daemon.transcriber().load()
+    server = RpcServer(daemon, pools, address=address)
+    bound = server.start()
+    print(f"Engine listening on {bound}", flush=True)
+    server.serve_forever()
@@ -0,0 +1,263 @@
+"""
+Persistent transcript cache keyed by the audio itself.
+
+A retry from the Tauri shell, or running ``--spool-transcribe`` on the same
+file again, would otherwise decode the same audio again and append its text
+to the spool a second time. Entries live in ``~/.tether/transcripts`` as one
+small JSON file each, named by a BLAKE2b hash of the audio's 16-bit PCM
+and the transcriber's settings (model, compute type, language).
+
+The hash covers samples, not files: a WAV on disk and the same recording
+still in memory as float32 map to the same key, so it does not matter which
+of the two paths transcribed it first. The hash of what was transcribed is
+also filed under the recording's name, so a retry from the untrimmed WAV,
+or after the WAV was archived to FLAC, finds the same entry. A file's mtime is its last use; when the directory outgrows
+MAX_BYTES the least recently used entries go first.
+"""
+
+import hashlib
+import json
+import os
+import wave
+from pathlib import Path
+
+import numpy as np
+
+MAX_BYTES = 32 << 20
+
+# Frames hashed per read of a WAV file.
+CHUNK_FRAMES = 1 << 16
+
+# Canonical form of the audio the engine records: 16 kHz mono int16.
+_CANONICAL = (1, 2, 16000)
+
+
+def get_cache_dir() -> Path:
+    """Get the transcript cache directory."""
+    from ..utils import get_tether_dir
+
+    cache_dir = get_tether_dir() / "transcripts"
+    cache_dir.mkdir(exist_ok=True)
+    return cache_dir
+
+
+def _hash_format(digest, channels: int, sampwidth: int, rate: int) -> None:
+    digest.update(f"pcm:{channels}:{sampwidth}:{rate};".encode())
+
+
+def _hash_array(digest, audio) -> None:
+    """Hash 16 kHz mono samples as the int16 PCM they were recorded as."""
+    samples = np.asarray(audio).reshape(-1)
+    if samples.dtype != np.int16:
+        # The recorder's float32 is int16 / 32768, so this is exact for it.
+        samples = np.clip(np.rint(samples * 32768.0), -32768, 32767).astype(np.int16)
+    _hash_format(digest, *_CANONICAL)
+    digest.update(samples.astype("<i2", copy=False).tobytes())
+
+
+def _hash_file(digest, path: Path):
+    """Hash a WAV's sample data (not its header), or any other file's bytes."""
+    pcm = digest.copy()
+    try:
+        with wave.open(str(path), "rb") as wf:
+            _hash_format(pcm, wf.getnchannels(), wf.getsampwidth(), wf.getframerate())
+            while frames := wf.readframes(CHUNK_FRAMES):
+                pcm.update(frames)
+        return pcm
+    except (wave.Error, EOFError):
+        pass
+
+    # Archived FLAC and the like: decoding just to hash would cost more than
+    # the lookup saves, so these only match themselves.
+    with open(path, "rb") as f:
+        digest.update(b"file;")
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+    return digest
+
+
+def audio_digest(audio) -> str:
+    """Hash of ``audio`` (a path or 16 kHz mono samples), whatever the model."""
+    digest = hashlib.blake2b(digest_size=20)
+    if isinstance(audio, (str, Path)):
+        digest = _hash_file(digest, Path(audio))
+    else:
+        _hash_array(digest, audio)
+    return digest.hexdigest()
+
+
+def entry_key(digest: str, settings: dict) -> str:
+    """Cache key of audio with ``digest`` transcribed under ``settings``."""
+    material = f"{json.dumps(settings, sort_keys=True)};{digest}"
+    return hashlib.blake2b(material.encode(), digest_size=20).hexdigest()
+
+
+def audio_key(audio, settings: dict) -> str:
+    """Cache key of ``audio`` (a path or 16 kHz mono samples) under ``settings``."""
+    return entry_key(audio_digest(audio), settings)
+
+
+def cache_settings(transcriber) -> list[dict]:
+    """The settings a transcript from ``transcriber`` may have been stored under.
+
+    One entry for a plain transcriber; one per model for those that choose
+    a model per clip, whose results name the ``model`` they used.
+    """
+    candidates = getattr(transcriber, "cache_settings", None)
+    if candidates:
+        return list(candidates)
+    return [getattr(transcriber, "settings", None) or {}]
+
+
+def _recording_name(path) -> str:
+    """The same for a recording's WAV and the FLAC it is archived to."""
+    stem = str(Path(path).resolve().with_suffix(""))
+    return hashlib.blake2b(stem.encode(), digest_size=20).hexdigest()
+
+
+def _wav_stamp(path) -> str:
+    """Size and mtime of a recording's WAV; empty if there is none."""
+    try:
+        stat = Path(path).with_suffix(".wav").stat()
+    except OSError:
+        return ""
+    return f"{stat.st_size} {stat.st_mtime_ns}"
+
+
+def _is_wav(path) -> bool:
+    return Path(path).suffix.lower() == ".wav"
+
+
+class TranscriptCache:
+    """Transcripts on disk by audio hash, evicted least recently used first."""
+
+    def __init__(self, directory: Path | None = None, max_bytes: int = MAX_BYTES):
+        self.directory = Path(directory) if directory else get_cache_dir()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> dict | None:
+        """The entry for ``key``, marking it as just used; None on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(path)
+        except (OSError, json.JSONDecodeError):
+            return None
+        return entry
+
+    def put(self, key: str, entry: dict) -> None:
+        """Store ``entry`` (``text``, ``segments`` and flags) under ``key``."""
+        path = self._path(key)
+        partial = path.with_suffix(".part")
+        with open(partial, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(partial, path)
+        self._evict()
+
+    def mark_spooled(self, key: str) -> None:
+        """Record that the entry's text is in the spool, so it is not added twice."""
+        entry = self.get(key)
+        if entry is not None and not entry.get("spooled"):
+            self.put(key, {**entry, "spooled": True})
+
+    def _alias(self, path) -> Path:
+        return self.directory / f"{_recording_name(path)}.alias"
+
+    def _digest(self, audio, path) -> str:
+        """Hash ``audio``, or find the digest its recording was filed under.
+
+        A recording's file need not hold the samples that were transcribed:
+        the hand-off is silence-trimmed, and archiving replaces the WAV with
+        FLAC, whose bytes hash to something else. The digest of what was
+        transcribed is kept under the recording's name with the WAV's size
+        and mtime. A WAV only uses it while those still match, so a file
+        recorded again under the same name is hashed afresh; a FLAC only
+        once its WAV is gone.
+        """
+        from_file = isinstance(audio, (str, Path))
+        if path is not None and from_file:
+            digest = self._read_alias(path)
+            if digest is not None:
+                return digest
+
+        digest = audio_digest(audio)
+        if path is not None and (_is_wav(path) or not from_file):
+            self._alias(path).write_text(
+                f"{digest}\n{_wav_stamp(path)}", encoding="utf-8"
+            )
+        return digest
+
+    def _read_alias(self, path) -> str | None:
+        alias = self._alias(path)
+        try:
+            digest, _, stamp = alias.read_text(encoding="utf-8").partition("\n")
+        except OSError:
+            return None
+
+        if _is_wav(path):
+            if stamp.strip() != _wav_stamp(path) or not stamp.strip():
+                return None
+        elif Path(path).with_suffix(".wav").exists():
+            # The WAV is still there, so this is not its archive.
+            return None
+
+        os.utime(alias)
+        return digest.strip()
+
+    def transcribe(
+        self, transcriber, audio, path=None, **kwargs
+    ) -> tuple[str, dict, bool]:
+        """Look ``audio`` up, transcribing and storing it on a miss.
+
+        ``path`` is the recording's file when ``audio`` holds its samples.
+        Returns ``(key, entry, hit)``. Transcribers without segment output
+        are stored with ``segments`` set to None.
+        """
+        if path is None and isinstance(audio, (str, Path)):
+            path = audio
+        digest = self._digest(audio, path)
+        candidates = cache_settings(transcriber)
+        for settings in candidates:
+            key = entry_key(digest, settings)
+            entry = self.get(key)
+            if entry is not None:
+                return key, entry, True
+
+        if hasattr(transcriber, "transcribe_segments"):
+            entry = transcriber.transcribe_segments(audio, **kwargs)
+        else:
+            entry = {"text": transcriber.transcribe(audio, **kwargs), "segments": None}
+        entry = {**entry, "spooled": False}
+
+        settings = candidates[0]
+        if "model" in entry:
+            # Filed under the model that actually ran, not the whole set.
+            settings = next(
+                (s for s in candidates if s.get("model") == entry["model"]), settings
+            )
+        key = entry_key(digest, settings)
+        self.put(key, entry)
+        return key, entry, False
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        paths = [*self.directory.glob("*.json"), *self.directory.glob("*.alias")]
+        for path in paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                return
+            path.unlink(missing_ok=True)
+            total -= size
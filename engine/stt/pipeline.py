@@ -0,0 +1,80 @@
+"""
+Pipelined transcription of a recording that is still going.
+
+``AudioRecorder`` hands over each finished segment while it keeps
+capturing; one worker thread transcribes them in arrival order and appends
+each to the spool stamped with the time the segment started. When the
+recording stops only the last segment is left, so a long session finishes
+seconds after the hotkey instead of minutes.
+"""
+
+import queue
+import threading
+from datetime import datetime
+
+
+class SegmentPipeline:
+    """Transcribes recording segments in order on a background thread."""
+
+    def __init__(
+        self,
+        transcriber,
+        spool=None,
+        on_text=None,
+        trim_silence: bool = True,
+        sample_rate: int = 16000,
+    ):
+        self.transcriber = transcriber
+        self.spool = spool
+        self.on_text = on_text
+        self.trim_silence = trim_silence
+        self.sample_rate = sample_rate
+        self.texts = []
+        self.errors = []
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="segment-pipeline", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, index: int, samples, started_at: datetime) -> None:
+        """Queue a segment; matches ``AudioRecorder``'s ``on_segment``."""
+        self._queue.put((index, samples, started_at))
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def _transcribe(self, index: int, samples, started_at: datetime) -> None:
+        if self.trim_silence:
+            from ..audio.vad import trim_silence
+
+            samples, _ = trim_silence(samples, self.sample_rate)
+        if not len(samples):
+            return
+
+        text = self.transcriber.transcribe(samples)
+        if not text:
+            return
+
+        self.texts.append(text)
+        if self.spool is not None:
+            self.spool.append(text, started_at)
+        if self.on_text is not None:
+            self.on_text(index, text, started_at)
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            try:
+                self._transcribe(*job)
+            except Exception as e:
+                # One bad segment must not cost the rest of the session.
+                self.errors.append((job[0], str(e)))
+
+    def close(self, timeout: float | None = None) -> str:
+        """Wait for queued segments and return the session's text."""
+        self._queue.put(None)
+        self._thread.join(timeout)
+        return " ".join(self.texts)
@@ -0,0 +1,100 @@
+"""
+Live captions: partial transcripts of the segment still being recorded.
+
+``StreamingPipeline`` is a ``SegmentPipeline`` whose worker, while it has
+no finished segment to transcribe, re-decodes the open segment (the window
+since the last cut) every PARTIAL_INTERVAL and reports it through
+``on_partial``. Finished segments still go through ``on_text`` as final
+text, replacing the partials for that index. The window never grows past
+the recorder's ``segment_seconds``, so each partial costs a bounded decode,
+and when recording stops only the last window is left to finalise.
+"""
+
+import queue
+import time
+
+from .pipeline import SegmentPipeline
+
+# Default segment length in streaming mode: the longest window a partial
+# re-decodes.
+WINDOW_SECONDS = 10.0
+
+# How often the open segment is re-decoded.
+PARTIAL_INTERVAL = 1.0
+
+# Less new audio than this since the last partial is not worth a decode.
+MIN_NEW_SECONDS = 0.3
+
+
+class StreamingPipeline(SegmentPipeline):
+    """Transcribes segments in order and captions the open one as it grows.
+
+    ``live_audio()`` returns the open segment as ``(index, samples,
+    started_at)``, or None when nothing is being recorded; the recorder's
+    ``live_segment`` fits.
+    """
+
+    def __init__(
+        self,
+        transcriber,
+        live_audio,
+        spool=None,
+        on_text=None,
+        on_partial=None,
+        partial_interval: float = PARTIAL_INTERVAL,
+        trim_silence: bool = True,
+        sample_rate: int = 16000,
+    ):
+        # The worker starts in the base constructor and reads these.
+        self.live_audio = live_audio
+        self.on_partial = on_partial
+        self.partial_interval = partial_interval
+        self.partials = 0
+        self._partial_index = None
+        self._partial_frames = 0
+        super().__init__(transcriber, spool, on_text, trim_silence, sample_rate)
+
+    def _partial(self) -> None:
+        live = self.live_audio()
+        if live is None:
+            return
+
+        index, samples, started_at = live
+        if index != self._partial_index:
+            self._partial_index, self._partial_frames = index, 0
+        if len(samples) - self._partial_frames < MIN_NEW_SECONDS * self.sample_rate:
+            return
+        self._partial_frames = len(samples)
+
+        if self.trim_silence:
+            from ..audio.vad import trim_silence
+
+            samples, _ = trim_silence(samples, self.sample_rate)
+        if not len(samples):
+            return
+
+        text = self.transcriber.transcribe(samples)
+        self.partials += 1
+        if text and self.on_partial is not None:
+            self.on_partial(index, text, started_at)
+
+    def _run(self) -> None:
+        next_partial = time.monotonic() + self.partial_interval
+        while True:
+            try:
+                job = self._queue.get(timeout=max(next_partial - time.monotonic(), 0))
+            except queue.Empty:
+                try:
+                    self._partial()
+                except Exception as e:
+                    # A caption is only a preview; the final pass retries.
+                    self.errors.append((self._partial_index, str(e)))
+                next_partial = time.monotonic() + self.partial_interval
+                continue
+
+            if job is None:
+                return
+            try:
+                self._transcribe(*job)
+            except Exception as e:
+                self.errors.append((job[0], str(e)))
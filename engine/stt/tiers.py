@@ -0,0 +1,270 @@
+"""
+Choose a Whisper model per clip from a set of tiers.
+
+A three-second note and a twenty-minute recording have different latency
+budgets: the budget is the clip's duration times a target real-time factor
+(processing seconds per audio second), with a floor so short notes are not
+all pushed onto the smallest model. ``TieredTranscriber`` predicts each
+tier's time from the clip length, that tier's real-time factor, the CPU
+load average and, for a model not loaded yet, its load time, and uses the
+largest tier predicted to fit.
+
+The real-time factors start as rough CPU int8 figures and follow measured
+timings from then on. Every choice is kept with its inputs and a one-line
+reason on ``last_choice``; the status file's ``stt_tier`` metrics get it
+whenever the tier changes. All tiers load through the shared model
+registry, and transcripts are cached under the tier that produced them.
+"""
+
+import os
+import sys
+import threading
+import time
+import wave
+from pathlib import Path
+
+from .transcriber import Transcriber
+
+DEFAULT_TIERS = ("tiny.en", "base.en", "small.en")
+
+TARGET_RTF = 0.5
+
+# A clip's budget is never less than this, in seconds.
+MIN_BUDGET_SECONDS = 2.0
+
+# Starting real-time factors (CPU, int8) until timings replace them.
+ESTIMATED_RTF = {
+    "tiny.en": 0.04,
+    "base.en": 0.08,
+    "small.en": 0.25,
+    "medium.en": 0.7,
+}
+UNKNOWN_RTF = 0.5
+
+# Seconds to load a model that is not in memory.
+ESTIMATED_LOAD_SECONDS = {
+    "tiny.en": 0.4,
+    "base.en": 0.7,
+    "small.en": 1.5,
+    "medium.en": 4.0,
+}
+UNKNOWN_LOAD_SECONDS = 3.0
+
+# Weight of a new timing in a tier's running real-time factor.
+RTF_SMOOTHING = 0.3
+
+
+# Idle, kernel and user CPU time at the previous Windows measurement.
+_last_cpu_times = None
+
+
+def _windows_cpu_busy() -> float:
+    """Share of CPU time spent busy since the previous call (since boot at first)."""
+    global _last_cpu_times
+    import ctypes
+    from ctypes import wintypes
+
+    times = [wintypes.FILETIME() for _ in range(3)]
+    if not ctypes.windll.kernel32.GetSystemTimes(*map(ctypes.byref, times)):
+        return 0.0
+    idle, kernel, user = ((t.dwHighDateTime << 32) | t.dwLowDateTime for t in times)
+
+    last, _last_cpu_times = _last_cpu_times, (idle, kernel, user)
+    if last is not None:
+        idle, kernel, user = idle - last[0], kernel - last[1], user - last[2]
+    # Kernel time includes idle time.
+    total = kernel + user
+    return (total - idle) / total if total > 0 else 0.0
+
+
+def cpu_load() -> float:
+    """One-minute load average per CPU.
+
+    Windows keeps no load average, so there this is the share of CPU time
+    spent busy since the last call instead. That stops at 1.0 where a load
+    average keeps climbing, so an overloaded Windows machine looks less
+    loaded than it is. 0.0 where neither can be measured.
+    """
+    try:
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+    except (AttributeError, OSError):
+        pass
+    if sys.platform == "win32":
+        try:
+            return _windows_cpu_busy()
+        except (AttributeError, OSError):
+            pass
+    return 0.0
+
+
+def audio_seconds(audio, sample_rate: int = 16000) -> float | None:
+    """Duration of a 16 kHz sample array or a WAV file; None if unknown."""
+    if not isinstance(audio, (str, Path)):
+        return len(audio) / sample_rate
+    try:
+        with wave.open(str(audio), "rb") as wf:
+            return wf.getnframes() / wf.getframerate()
+    except (wave.Error, EOFError, OSError):
+        return None
+
+
+def create_transcriber(
+    tiers=None, target_rtf: float | None = None, num_workers: int = 1
+):
+    """A ``TieredTranscriber`` over ``tiers``, or a plain ``Transcriber``."""
+    if not tiers:
+        return Transcriber(num_workers=num_workers)
+    return TieredTranscriber(tiers, target_rtf or TARGET_RTF, num_workers=num_workers)
+
+
+class TieredTranscriber:
+    """Transcribes each clip with the largest tier that fits its budget.
+
+    ``tiers`` go from smallest to largest model. Anything that takes a
+    ``Transcriber`` takes this too, and it pickles like one: a pickled copy
+    measures the real CPU load, whatever ``load`` this one was given.
+    """
+
+    def __init__(
+        self,
+        tiers=DEFAULT_TIERS,
+        target_rtf: float = TARGET_RTF,
+        load=None,
+        num_workers: int = 1,
+    ):
+        if not tiers:
+            raise ValueError("Need at least one model tier")
+        self.tiers = tuple(tiers)
+        self.target_rtf = target_rtf
+        self._cpu_load = load or cpu_load
+        self._transcribers = {
+            tier: Transcriber(tier, num_workers) for tier in self.tiers
+        }
+        self.rtf = {tier: ESTIMATED_RTF.get(tier, UNKNOWN_RTF) for tier in self.tiers}
+        self.last_choice = None
+        self._reported_model = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Locks do not pickle, nor does a lambda passed as ``load``.
+        del state["_lock"]
+        state["_cpu_load"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._cpu_load = cpu_load
+        self._lock = threading.Lock()
+
+    def choose(self, seconds: float | None) -> dict:
+        """Pick a tier for ``seconds`` of audio, with the reasons for it."""
+        load = self._cpu_load()
+        if seconds is None:
+            return {
+                "model": self.tiers[-1],
+                "audio_seconds": None,
+                "cpu_load": round(load, 2),
+                "reason": "duration unknown, using the largest tier",
+            }
+
+        budget = max(seconds * self.target_rtf, MIN_BUDGET_SECONDS)
+        # Other work on every core roughly halves our share of the CPU.
+        slowdown = 1.0 + load
+        predicted = {}
+        for tier in self.tiers:
+            predicted[tier] = seconds * self.rtf[tier] * slowdown
+            if not self._transcribers[tier].is_loaded:
+                predicted[tier] += ESTIMATED_LOAD_SECONDS.get(
+                    tier, UNKNOWN_LOAD_SECONDS
+                )
+
+        fitting = [tier for tier in self.tiers if predicted[tier] <= budget]
+        if fitting:
+            model = fitting[-1]
+            if model == self.tiers[-1]:
+                reason = (
+                    f"{model} expected in {predicted[model]:.1f}s, "
+                    f"within the {budget:.1f}s budget"
+                )
+            else:
+                larger = self.tiers[self.tiers.index(model) + 1]
+                reason = (
+                    f"{larger} would take {predicted[larger]:.1f}s, "
+                    f"over the {budget:.1f}s budget"
+                )
+        else:
+            model = min(self.tiers, key=predicted.get)
+            reason = (
+                f"no tier fits the {budget:.1f}s budget, {model} is fastest "
+                f"at {predicted[model]:.1f}s"
+            )
+        if load >= 0.5:
+            reason += f" (CPU load {load:.2f})"
+
+        return {
+            "model": model,
+            "audio_seconds": round(seconds, 2),
+            "cpu_load": round(load, 2),
+            "target_rtf": self.target_rtf,
+            "budget_seconds": round(budget, 2),
+            "predicted_seconds": {
+                tier: round(value, 2) for tier, value in predicted.items()
+            },
+            "reason": reason,
+        }
+
+    def _observe(self, tier: str, seconds: float, elapsed: float, load: float):
+        """Fold a measured decode into the tier's real-time factor."""
+        rtf = elapsed / seconds / (1.0 + load)
+        with self._lock:
+            self.rtf[tier] += RTF_SMOOTHING * (rtf - self.rtf[tier])
+
+    def transcribe_segments(self, audio, batch_size: int | None = None) -> dict:
+        """``Transcriber.transcribe_segments`` on the chosen tier, plus its
+        ``model``."""
+        from ..utils import status
+
+        seconds = audio_seconds(audio)
+        choice = self.choose(seconds)
+        transcriber = self._transcribers[choice["model"]]
+        was_loaded = transcriber.is_loaded
+
+        started = time.perf_counter()
+        result = transcriber.transcribe_segments(audio, batch_size)
+        elapsed = time.perf_counter() - started
+
+        # A first use also timed the model load, which is not decoding.
+        if was_loaded and seconds:
+            self._observe(choice["model"], seconds, elapsed, choice["cpu_load"])
+
+        choice["elapsed_seconds"] = round(elapsed, 2)
+        self.last_choice = choice
+        # Partials transcribe often; the status file only needs tier changes.
+        if choice["model"] != self._reported_model:
+            self._reported_model = choice["model"]
+            status.write_metrics("stt_tier", choice)
+        return {**result, "model": choice["model"]}
+
+    def transcribe(self, audio, batch_size: int | None = None) -> str:
+        """Transcribe audio to text with the tier chosen for it."""
+        return self.transcribe_segments(audio, batch_size)["text"]
+
+    def load(self) -> None:
+        """Load every tier now, so none of them costs a load on first use."""
+        for transcriber in self._transcribers.values():
+            transcriber.load()
+
+    def unload(self) -> None:
+        for transcriber in self._transcribers.values():
+            transcriber.unload()
+
+    @property
+    def is_loaded(self) -> bool:
+        return any(t.is_loaded for t in self._transcribers.values())
+
+    @property
+    def cache_settings(self) -> list[dict]:
+        """Each tier's settings, largest first: a transcript from any of them
+        answers a lookup, and is stored under the tier that produced it."""
+        return [self._transcribers[tier].settings for tier in reversed(self.tiers)]
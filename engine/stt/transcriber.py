@@ -1,4 +1,6 @@
 import sys
+import threading
+import weakref
 from pathlib import Path
 from typing import Optional
 
@@ -13,39 +15,238 @@ def get_model_path():
     return "small.en"
 
 
+def find_model_dir(model_size: str) -> Path:
+    """Find the on-disk directory of a downloaded faster-whisper model."""
+    if Path(model_size).is_dir():
+        return Path(model_size)
+
+    from faster_whisper.utils import download_model
+
+    return Path(download_model(model_size, local_files_only=True))
+
+
+def prefetch_model_files(model_size: str, chunk_size: int = 1 << 20) -> int:
+    """Read a model's files once so the OS page cache holds them.
+
+    Used when no daemon is running to keep the model loaded: the next process
+    that loads it reads from memory instead of disk. Returns bytes read.
+    """
+    buffer = bytearray(chunk_size)
+    total = 0
+
+    for path in sorted(find_model_dir(model_size).rglob("*")):
+        if not path.is_file():
+            continue
+        with open(path, "rb", buffering=0) as f:
+            while True:
+                read = f.readinto(buffer)
+                if not read:
+                    break
+                total += read
+
+    return total
+
+
+# Speech chunks decoded together by faster-whisper's batched pipeline.
+BATCH_SIZE = 8
+
+COMPUTE_TYPE = "int8"
+LANGUAGE = "en"
+
+
+# Whisper models loaded in this process, shared by every Transcriber that
+# asks for the same (model, device, compute type, workers). Each entry holds
+# the model, how many Transcribers use it and a lock that serialises its
+# first load.
+# Models stay loaded with no users until unload_models() drops them, so a
+# Transcriber created per recording still finds the model in memory.
+_models: dict[tuple, dict] = {}
+_models_lock = threading.Lock()
+
+
+def acquire_model(
+    model_size: str, compute_type: str = COMPUTE_TYPE, num_workers: int = 1
+):
+    """Get a shared Whisper model, loading it if no one has yet.
+
+    Returns ``(key, model)``; hand ``key`` to ``release_model`` when done.
+    Concurrent callers for the same model wait for a single load. With
+    ``num_workers`` CTranslate2 runs that many transcriptions of the one
+    loaded model in parallel, for callers on as many threads.
+    """
+    key = (str(model_size), "cpu", compute_type, num_workers)
+    with _models_lock:
+        entry = _models.setdefault(
+            key, {"model": None, "refs": 0, "lock": threading.Lock()}
+        )
+        entry["refs"] += 1
+
+    try:
+        # Outside the registry lock, so different models load in parallel.
+        with entry["lock"]:
+            if entry["model"] is None:
+                from faster_whisper import WhisperModel
+
+                entry["model"] = WhisperModel(
+                    key[0], device=key[1], compute_type=key[2], num_workers=key[3]
+                )
+    except BaseException:
+        release_model(key, unload=True)
+        raise
+    return key, entry["model"]
+
+
+def release_model(key: tuple, unload: bool = False) -> None:
+    """Give up one reference taken by ``acquire_model``.
+
+    With ``unload`` the model is also dropped if that was the last reference.
+    """
+    with _models_lock:
+        entry = _models.get(key)
+        if entry is None:
+            return
+        if entry["refs"] > 0:
+            entry["refs"] -= 1
+        if unload and not entry["refs"]:
+            del _models[key]
+
+
+def unload_models(force: bool = False) -> int:
+    """Drop loaded models nothing uses any more; with ``force``, all of them.
+
+    Transcribers holding a forced-out model keep their copy until they are
+    unloaded themselves. Returns how many models were dropped.
+    """
+    with _models_lock:
+        keys = [
+            key
+            for key, entry in _models.items()
+            if force or (not entry["refs"] and entry["model"] is not None)
+        ]
+        for key in keys:
+            del _models[key]
+    return len(keys)
+
+
+def loaded_models() -> list[dict]:
+    """The models in the registry and how many Transcribers use each."""
+    with _models_lock:
+        return [
+            {
+                "model": key[0],
+                "compute_type": key[2],
+                "workers": key[3],
+                "refs": entry["refs"],
+            }
+            for key, entry in _models.items()
+            if entry["model"] is not None
+        ]
+
+
 class Transcriber:
-    """Handles speech-to-text transcription using faster-whisper."""
+    """Handles speech-to-text transcription using faster-whisper.
 
-    def __init__(self, model_size: str = None):
+    The model comes from the process-wide registry, so Transcribers for the
+    same model share one copy; a Transcriber's reference is released when it
+    is unloaded or garbage collected. ``num_workers`` lets that many threads
+    transcribe with the one copy at the same time.
+    """
+
+    def __init__(self, model_size: str = None, num_workers: int = 1):
         if model_size is None:
             model_size = get_model_path()
         self.model_size = model_size
+        self.num_workers = num_workers
         self._model = None
+        self._batched = None
+        self._release = None
 
     def _get_model(self):
         """Lazy load the Whisper model."""
         if self._model is None:
-            from faster_whisper import WhisperModel
-
-            self._model = WhisperModel(
-                self.model_size, device="cpu", compute_type="int8"
-            )
+            key, model = acquire_model(self.model_size, COMPUTE_TYPE, self.num_workers)
+            self._release = weakref.finalize(self, release_model, key)
+            self._model = model
         return self._model
 
-    def transcribe(self, audio_path: str) -> str:
-        """Transcribe audio file to text."""
-        model = self._get_model()
-        segments, info = model.transcribe(audio_path, language="en")
+    def _get_batched(self):
+        """faster-whisper's batched pipeline over the same model.
+
+        None with faster-whisper releases that predate it (before 1.1).
+        """
+        if self._batched is None:
+            try:
+                from faster_whisper import BatchedInferencePipeline
+            except ImportError:
+                self._batched = False
+            else:
+                self._batched = BatchedInferencePipeline(model=self._get_model())
+        return self._batched or None
 
-        text_parts = []
-        for segment in segments:
-            text_parts.append(segment.text)
+    def load(self) -> None:
+        """Load the Whisper model now instead of on first use."""
+        self._get_model()
+
+    def unload(self) -> None:
+        """Release the model, unloading it if no other Transcriber uses it."""
+        detached = self._release.detach() if self._release is not None else None
+        if detached is not None:
+            _, _, args, _ = detached
+            release_model(*args, unload=True)
+        self._release = None
+        self._model = None
+        self._batched = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._model is not None
+
+    @property
+    def settings(self) -> dict:
+        """Everything besides the audio that decides the transcript."""
+        return {
+            "model": str(self.model_size),
+            "compute_type": COMPUTE_TYPE,
+            "language": LANGUAGE,
+        }
+
+    def transcribe(self, audio, batch_size: int | None = None) -> str:
+        """Transcribe audio to text.
+
+        ``audio`` is a file path (any format faster-whisper can decode,
+        including archived FLAC) or a float32 mono NumPy array at 16 kHz,
+        such as ``AudioRecorder.get_audio_float()``, which skips decoding.
+        With ``batch_size`` the speech chunks of a long recording are decoded
+        that many at a time, where faster-whisper supports it.
+        """
+        return self.transcribe_segments(audio, batch_size)["text"]
+
+    def transcribe_segments(self, audio, batch_size: int | None = None) -> dict:
+        """Like ``transcribe``, as ``{"text", "segments"}`` with timed segments."""
+        if isinstance(audio, Path):
+            audio = str(audio)
+
+        model = self._get_model()
+        batched = self._get_batched() if batch_size else None
+        if batched is not None:
+            segments, info = batched.transcribe(
+                audio, language=LANGUAGE, batch_size=batch_size
+            )
+        else:
+            segments, info = model.transcribe(audio, language=LANGUAGE)
 
-        return " ".join(text_parts).strip()
+        parts = [
+            {"start": segment.start, "end": segment.end, "text": segment.text}
+            for segment in segments
+        ]
+        return {
+            "text": " ".join(part["text"] for part in parts).strip(),
+            "segments": parts,
+        }
 
-    async def transcribe_async(self, audio_path: str) -> str:
+    async def transcribe_async(self, audio) -> str:
         """Async wrapper for transcribe."""
         import asyncio
 
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.transcribe, audio_path)
+        return await loop.run_in_executor(None, self.transcribe, audio)
@@ -1,6 +1,7 @@
 from .status import (
     read_status,
     write_status,
+    write_metrics,
     is_busy,
     get_current_task,
     mark_idle,
@@ -12,6 +13,7 @@ from .status import (
 __all__ = [
     "read_status",
     "write_status",
+    "write_metrics",
     "is_busy",
     "get_current_task",
     "mark_idle",
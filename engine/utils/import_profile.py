@@ -0,0 +1,98 @@
+"""Report what an engine command imports, in the style of ``-X importtime``."""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Modules that should only be imported by the commands that need them.
+HEAVY_MODULES = ("httpx", "numpy", "sounddevice", "faster_whisper", "ctranslate2")
+
+
+def parse_importtime(output: str) -> list[dict]:
+    """Parse ``-X importtime`` stderr into one entry per imported module."""
+    entries = []
+
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3:
+            continue
+
+        try:
+            self_us = int(fields[0])
+            cumulative_us = int(fields[1])
+        except ValueError:
+            # Header line
+            continue
+
+        name = fields[2].rstrip()
+        indent = len(name) - len(name.lstrip())
+        entries.append(
+            {
+                "module": name.strip(),
+                "self_us": self_us,
+                "cumulative_us": cumulative_us,
+                "depth": max(indent - 1, 0) // 2,
+            }
+        )
+
+    return entries
+
+
+def summarize_imports(entries: list[dict], top: int = 15) -> dict:
+    """Total the parsed entries and pick out the most expensive imports."""
+    top_level = [e for e in entries if e["depth"] == 0]
+    top_level.sort(key=lambda e: e["cumulative_us"], reverse=True)
+    imported = {e["module"] for e in entries}
+
+    return {
+        "modules": len(entries),
+        "total_ms": round(sum(e["self_us"] for e in entries) / 1000, 2),
+        "engine_ms": round(
+            sum(e["self_us"] for e in entries if e["module"].startswith("engine"))
+            / 1000,
+            2,
+        ),
+        "heavy_modules": [m for m in HEAVY_MODULES if m in imported],
+        "top": [
+            {
+                "module": e["module"],
+                "cumulative_ms": round(e["cumulative_us"] / 1000, 2),
+            }
+            for e in top_level[:top]
+        ],
+    }
+
+
+def engine_entry() -> tuple[list[str], Path]:
+    """Get the arguments that start this engine, and the directory to run in."""
+    package_root = Path(__file__).resolve().parents[2]
+
+    # Inside a zipapp bundle the "root" is the engine.pyz file itself.
+    if package_root.is_file():
+        return [str(package_root)], package_root.parent
+    return ["-m", "engine"], package_root
+
+
+def profile_imports(argv: list[str], top: int = 15) -> dict:
+    """Run ``python -m engine <argv>`` under ``-X importtime`` and summarize it."""
+    entry, cwd = engine_entry()
+
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *entry, *argv],
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+
+    return {
+        "command": argv,
+        "returncode": result.returncode,
+        "wall_ms": round(wall_ms, 2),
+        **summarize_imports(parse_importtime(result.stderr), top),
+    }
@@ -0,0 +1,160 @@
+"""
+Cache for environment probes (--check-mic, --check-ollama).
+
+Results are kept in ``~/.tether/probe_cache.json`` with a time-to-live and a
+fingerprint of the environment they depend on. A cached result is discarded
+when it expires or when the fingerprint changes (PATH, Ollama host, audio
+device list).
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from .status import get_tether_dir
+
+MIC_PROBE_TTL = 300.0
+# "No microphone" is only trusted briefly: off Linux there is no device
+# fingerprint to notice one being plugged in.
+MIC_UNAVAILABLE_TTL = 10.0
+OLLAMA_PROBE_TTL = 30.0
+
+_LOCK = threading.Lock()
+
+
+def get_probe_cache_path() -> Path:
+    """Get the path to the probe cache file."""
+    return get_tether_dir() / "probe_cache.json"
+
+
+def _load() -> dict:
+    try:
+        with open(get_probe_cache_path(), "r") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save(data: dict) -> None:
+    path = get_probe_cache_path()
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def make_fingerprint(*parts) -> str:
+    """Hash the values a probe result depends on."""
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(repr(part).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def audio_device_fingerprint() -> str:
+    """Cheap fingerprint of the audio device list, without starting PortAudio.
+
+    Only Linux exposes one (ALSA's card list). Elsewhere the mic probe relies
+    on its TTL and on the recorder invalidating it when a stream fails to open.
+    """
+    parts = []
+
+    try:
+        parts.append(Path("/proc/asound/cards").read_text())
+    except OSError:
+        pass
+
+    try:
+        parts.append(sorted(os.listdir("/dev/snd")))
+    except OSError:
+        pass
+
+    return make_fingerprint(*parts)
+
+
+def read_probe(
+    name: str,
+    fingerprint: str,
+    ttl: float,
+    unavailable_ttl: Optional[float] = None,
+) -> Optional[dict]:
+    """Get a cached probe result, or None if missing, expired or stale.
+
+    Results with ``available`` false expire after ``unavailable_ttl`` when
+    one is given.
+    """
+    with _LOCK:
+        entry = _load().get(name)
+
+    if not isinstance(entry, dict):
+        return None
+    if entry.get("fingerprint") != fingerprint:
+        return None
+
+    value = entry.get("value")
+    if unavailable_ttl is not None and isinstance(value, dict):
+        if value.get("available") is False:
+            ttl = min(ttl, unavailable_ttl)
+    if time.time() - entry.get("checked_at", 0) > ttl:
+        return None
+
+    return value
+
+
+def write_probe(name: str, fingerprint: str, value: dict) -> None:
+    """Store a probe result."""
+    with _LOCK:
+        data = _load()
+        data[name] = {
+            "fingerprint": fingerprint,
+            "checked_at": time.time(),
+            "value": value,
+        }
+        _save(data)
+
+
+def invalidate_probe(name: Optional[str] = None) -> None:
+    """Drop one cached probe, or all of them."""
+    with _LOCK:
+        data = _load()
+        if name is None:
+            data = {}
+        else:
+            data.pop(name, None)
+        try:
+            _save(data)
+        except OSError:
+            pass
+
+
+def cached_probe(
+    name: str,
+    fingerprint: str,
+    ttl: float,
+    probe: Callable[[], dict],
+    refresh: bool = False,
+    unavailable_ttl: Optional[float] = None,
+) -> dict:
+    """Answer from the cache, or run ``probe`` and cache its result.
+
+    Results with an ``error`` are returned but not cached, so a transient
+    failure is retried on the next call; with ``unavailable_ttl``, results
+    with ``available`` false are only kept that long. The returned dict has
+    ``cached`` set to whether it came from the cache.
+    """
+    if not refresh:
+        value = read_probe(name, fingerprint, ttl, unavailable_ttl)
+        if value is not None:
+            return {**value, "cached": True}
+
+    value = probe()
+    if not value.get("error"):
+        write_probe(name, fingerprint, value)
+
+    return {**value, "cached": False}
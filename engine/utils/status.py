@@ -1,3 +1,4 @@
+import itertools
 import json
 import os
 import threading
@@ -7,6 +8,18 @@ from typing import Optional
 
 _LOCK = threading.Lock()
 
+# Tasks in flight in this process, keyed by a number per start: the daemon
+# runs several commands at once, two of them possibly the same command, so
+# the status file lists all of them. The top-level fields mirror the most
+# recently started one for readers that only understand a single slot.
+_ACTIVE_TASKS: dict[int, dict] = {}
+_TASK_IDS = itertools.count()
+_LOCAL = threading.local()
+
+# Named metric sections (recorder health and the like) carried in every
+# status write, so a status change does not wipe them.
+_METRICS: dict[str, dict] = {}
+
 
 def get_tether_dir() -> Path:
     """Get the tether config directory."""
@@ -37,7 +50,13 @@ def get_status_file_path() -> Path:
 
 def get_default_status() -> dict:
     """Get default status."""
-    return {"pid": None, "status": "idle", "task": None, "started_at": None}
+    return {
+        "pid": None,
+        "status": "idle",
+        "task": None,
+        "started_at": None,
+        "tasks": [],
+    }
 
 
 def read_status() -> dict:
@@ -72,8 +91,63 @@ def write_status(
 
         if status in ("busy", "recording"):
             data["started_at"] = datetime.now().isoformat()
+            if task is not None:
+                # A new status for this thread's own task replaces it.
+                own = getattr(_LOCAL, "task", None)
+                if own in _ACTIVE_TASKS and _ACTIVE_TASKS[own]["task"] == task:
+                    del _ACTIVE_TASKS[own]
+                task_id = next(_TASK_IDS)
+                _ACTIVE_TASKS[task_id] = {
+                    "status": status,
+                    "task": task,
+                    "pid": pid,
+                    "started_at": data["started_at"],
+                }
+                _LOCAL.task = task_id
         else:
             data["started_at"] = None
+            if task is not None:
+                _end_task(task)
+                data["task"] = None
+            if _ACTIVE_TASKS:
+                # Another task is still running; report it instead of idle.
+                data.update(list(_ACTIVE_TASKS.values())[-1])
+
+        data["tasks"] = list(_ACTIVE_TASKS.values())
+        if _METRICS:
+            data["metrics"] = dict(_METRICS)
+
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+
+        return data
+
+
+def _end_task(task) -> None:
+    """Drop the entry for ``task``, an id or a name: the calling thread's own
+    entry if it has that name, else the latest one that does."""
+    own = getattr(_LOCAL, "task", None)
+    if own in _ACTIVE_TASKS and task in (own, _ACTIVE_TASKS[own]["task"]):
+        del _ACTIVE_TASKS[own]
+        _LOCAL.task = None
+        return
+    if task in _ACTIVE_TASKS:
+        del _ACTIVE_TASKS[task]
+        return
+    for task_id in reversed(_ACTIVE_TASKS):
+        if _ACTIVE_TASKS[task_id]["task"] == task:
+            del _ACTIVE_TASKS[task_id]
+            return
+
+
+def write_metrics(section: str, values: dict) -> dict:
+    """Publish a metrics section in the status file, keeping the status."""
+    path = get_status_file_path()
+
+    with _LOCK:
+        _METRICS[section] = values
+        data = read_status()
+        data["metrics"] = {**data.get("metrics", {}), **_METRICS}
 
         with open(path, "w") as f:
             json.dump(data, f, indent=2)
@@ -93,6 +167,9 @@ def get_current_task() -> Optional[str]:
     return status.get("task")
 
 
-def mark_idle() -> None:
-    """Mark the engine as idle."""
-    write_status("idle", None, None)
+def mark_idle(task: Optional[str] = None) -> None:
+    """Mark a task as finished, or the calling thread's task if none is given."""
+    if task is None:
+        task = getattr(_LOCAL, "task", None)
+    _LOCAL.task = None
+    write_status("idle", task, None)
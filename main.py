@@ -14,7 +14,8 @@ def on_audio_ready(audio_path: str):
 
     def process():
         try:
-            # Transcribe audio
+            # Transcribe audio; the model loaded for an earlier recording is
+            # still in the transcriber registry and gets reused.
             transcriber = Transcriber()
             text = transcriber.transcribe(audio_path)
 
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Measure the size/CPU trade-off of archiving recordings as FLAC.
+
+Usage:
+    python scripts/bench_archive.py                  # recordings in ~/.tether/audio
+    python scripts/bench_archive.py --dir PATH --levels 0 5 8
+
+Each WAV is encoded once per FLAC compression level into a scratch
+directory (the originals are never touched). Reported per level:
+
+    ratio     FLAC bytes / WAV bytes (lower is better)
+    cpu ms    encoder CPU time per minute of audio
+    x rt      audio seconds encoded per CPU second
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from engine.audio.archive import encode_flac  # noqa: E402
+
+
+def _duration(path: Path) -> float:
+    with wave.open(str(path), "rb") as wf:
+        return wf.getnframes() / wf.getframerate()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark FLAC archiving")
+    parser.add_argument("--dir", type=Path, default=Path.home() / ".tether" / "audio")
+    parser.add_argument("--levels", type=int, nargs="+", default=[0, 2, 5, 8])
+    args = parser.parse_args()
+
+    recordings = sorted(args.dir.glob("*.wav"))
+    if not recordings:
+        sys.exit(f"No WAV recordings in {args.dir}")
+
+    wav_bytes = sum(path.stat().st_size for path in recordings)
+    seconds = sum(_duration(path) for path in recordings)
+
+    print(f"{len(recordings)} recordings, {seconds:.1f}s, {wav_bytes} WAV bytes")
+    print(f"{'level':>5} {'bytes':>12} {'ratio':>7} {'cpu ms/min':>11} {'x rt':>8}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for level in args.levels:
+            flac_bytes = 0
+            cpu = 0.0
+            for path in recordings:
+                output = Path(tmp) / f"{path.stem}-{level}.flac"
+                started = time.process_time()
+                encode_flac(path, level, output=output, remove_source=False)
+                cpu += time.process_time() - started
+                flac_bytes += output.stat().st_size
+                output.unlink()
+
+            print(
+                f"{level:>5} {flac_bytes:>12} {flac_bytes / wav_bytes:>7.3f} "
+                f"{cpu * 1000 / (seconds / 60):>11.1f} {seconds / max(cpu, 1e-9):>8.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Measure audio callback time under synthetic load.
+
+Usage:
+    python scripts/bench_callback.py
+    python scripts/bench_callback.py --seconds 20 --load-threads 4
+
+Drives two capture paths with 10 ms blocks at real-time pace while other
+threads burn CPU and a consumer drains the captured audio to disk the way
+a recording does:
+
+    lock     the previous design: the callback takes the lock the writer
+             holds while it copies and writes the recording
+    spsc     AudioRecorder's lock-free ring, emptied by a drain thread
+
+Percentiles are of the time spent inside the callback. A callback that
+runs longer than one block (10 ms) would overflow a real input stream.
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from engine.audio.buffer import SampleBuffer  # noqa: E402
+from engine.audio.spsc import SpscRing  # noqa: E402
+from engine.audio.wav_writer import StreamingWavWriter  # noqa: E402
+
+RATE = 16000
+BLOCK = 160
+
+
+class LockedCapture:
+    """Callback appends under a lock; the writer copies out under it too."""
+
+    def __init__(self, writer):
+        self.buffer = SampleBuffer(initial_frames=RATE * 30)
+        self.lock = threading.Lock()
+        self.writer = writer
+
+    def callback(self, block):
+        with self.lock:
+            self.buffer.append(block)
+
+    def consume(self):
+        with self.lock:
+            pending = self.buffer.view(self.writer.frames).copy()
+            self.writer.write(pending)
+            self.writer.flush()
+
+
+class SpscCapture:
+    """Callback pushes to the ring; the drain thread owns everything else."""
+
+    def __init__(self, writer):
+        self.buffer = SampleBuffer(initial_frames=RATE * 30)
+        self.ring = SpscRing(RATE * 2)
+        self.writer = writer
+
+    def callback(self, block):
+        self.ring.push(block)
+
+    def consume(self):
+        parts = self.ring.peek()
+        for part in parts:
+            self.buffer.append(part)
+        self.ring.advance(sum(len(part) for part in parts))
+        self.writer.write(self.buffer.view(self.writer.frames))
+        self.writer.flush()
+
+
+def _burn(stop: threading.Event) -> None:
+    values = np.random.default_rng().standard_normal(50_000)
+    while not stop.is_set():
+        np.sort(values)
+        sum(range(20_000))
+
+
+def _run(capture_cls, seconds: float, load_threads: int) -> list[float]:
+    stop = threading.Event()
+    block = np.zeros((BLOCK, 1), dtype=np.int16)
+    timings = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = StreamingWavWriter(Path(tmp) / "bench.wav", RATE)
+        capture = capture_cls(writer)
+
+        def consumer():
+            while not stop.wait(0.02):
+                capture.consume()
+
+        threads = [
+            threading.Thread(target=_burn, args=(stop,)) for _ in range(load_threads)
+        ]
+        threads.append(threading.Thread(target=consumer))
+        for thread in threads:
+            thread.start()
+
+        interval = BLOCK / RATE
+        deadline = time.perf_counter()
+        for _ in range(int(seconds / interval)):
+            deadline += interval
+            started = time.perf_counter_ns()
+            capture.callback(block)
+            timings.append((time.perf_counter_ns() - started) / 1000)
+            time.sleep(max(deadline - time.perf_counter(), 0))
+
+        stop.set()
+        for thread in threads:
+            thread.join()
+        writer.close()
+
+    return timings
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    return float(np.percentile(values, pct))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the audio callback")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--load-threads", type=int, default=2)
+    args = parser.parse_args()
+
+    print(
+        f"{args.seconds:.0f}s of {BLOCK}-frame blocks, "
+        f"{args.load_threads} load threads (callback time, us)"
+    )
+    print(
+        f"{'path':<6} {'median':>8} {'p90':>8} {'p99':>8} {'p99.9':>8} "
+        f"{'max':>8} {'>10ms':>6}"
+    )
+    for name, capture_cls in (("lock", LockedCapture), ("spsc", SpscCapture)):
+        timings = _run(capture_cls, args.seconds, args.load_threads)
+        late = sum(1 for t in timings if t > BLOCK / RATE * 1e6)
+        print(
+            f"{name:<6} {statistics.median(timings):>8.1f} "
+            f"{_percentile(timings, 90):>8.1f} {_percentile(timings, 99):>8.1f} "
+            f"{_percentile(timings, 99.9):>8.1f} {max(timings):>8.1f} {late:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
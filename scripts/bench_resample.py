@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Measure the CPU cost of converting device audio to 16 kHz mono.
+
+Usage:
+    python scripts/bench_resample.py
+    python scripts/bench_resample.py --seconds 30 --block-ms 20
+
+Feeds synthetic speech-band noise through PolyphaseResampler in blocks the
+size PortAudio delivers, once per common device format, and reports CPU
+milliseconds per second of audio (1000 would be one full core).
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from engine.audio.resample import PolyphaseResampler  # noqa: E402
+
+FORMATS = [
+    (16000, 1),
+    (22050, 1),
+    (44100, 1),
+    (44100, 2),
+    (48000, 1),
+    (48000, 2),
+    (96000, 2),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the resampler")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--block-ms", type=float, default=10.0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{args.seconds:.0f}s of audio in {args.block_ms:.0f} ms blocks")
+    print(f"{'rate':>6} {'ch':>3} {'up/down':>9} {'taps':>5} {'cpu ms/s':>9}")
+
+    for rate, channels in FORMATS:
+        samples = rng.normal(0, 3000, (int(rate * args.seconds), channels))
+        samples = samples.astype(np.int16)
+        block = max(int(rate * args.block_ms / 1000), 1)
+        resampler = PolyphaseResampler(rate, 16000, channels)
+
+        started = time.process_time()
+        for start in range(0, len(samples), block):
+            resampler.process(samples[start : start + block])
+        cpu = time.process_time() - started
+
+        taps = 0 if resampler.passthrough else resampler._bank.shape[1]
+        ratio = f"{resampler.up}/{resampler.down}"
+        print(
+            f"{rate:>6} {channels:>3} {ratio:>9} {taps:>5} "
+            f"{cpu * 1000 / args.seconds:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Measure how long a recording takes to start: cold stream vs warm stream.
+
+Usage:
+    python scripts/bench_start_latency.py                 # real microphone
+    python scripts/bench_start_latency.py --runs 20
+    python scripts/bench_start_latency.py --simulate-open-ms 80
+
+Two ways of starting a recording are timed:
+
+    cold    AudioRecorder.start() opens a new input stream, as --spool-start
+            and a daemon without --warm-stream do
+    warm    the stream is already open (arm(0), as --serve --warm-stream),
+            so start() only flips the recording flag
+
+For each run it reports how long start() took to return and how long until
+the first audio block of the recording arrived. Without a microphone (or
+with --simulate-open-ms) a fake device stands in, whose stream takes the
+given time to open and then delivers 10 ms blocks.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from engine.audio import AudioRecorder  # noqa: E402
+
+RATE = 16000
+BLOCK = 160
+
+
+class FakeStream:
+    """Input stream that takes ``open_ms`` to start, then delivers blocks."""
+
+    def __init__(self, open_ms, callback, channels, dtype, **kwargs):
+        self.open_ms = open_ms
+        self.callback = callback
+        self.block = np.zeros((BLOCK, channels), dtype=dtype)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        time.sleep(self.open_ms / 1000)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(BLOCK / RATE):
+            self.callback(self.block, BLOCK, None, None)
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def close(self):
+        time.sleep(self.open_ms / 4000)
+
+
+class FakeSoundDevice:
+    def __init__(self, open_ms):
+        self.open_ms = open_ms
+
+    def query_devices(self, kind=None):
+        return {"default_samplerate": float(RATE), "max_input_channels": 1}
+
+    def InputStream(self, **kwargs):
+        return FakeStream(self.open_ms, **kwargs)
+
+
+def _time_start(recorder) -> tuple[float, float]:
+    """Milliseconds until start() returned and until the first new block."""
+    health = recorder.health
+    before = health.callbacks if health else 0
+    started = time.perf_counter()
+    recorder.start()
+    returned = time.perf_counter()
+    if recorder.health is not health:
+        # A new stream was opened, with counters of its own.
+        health, before = recorder.health, 0
+    while health.callbacks <= before:
+        time.sleep(0.0002)
+    first_audio = time.perf_counter()
+    return (returned - started) * 1000, (first_audio - started) * 1000
+
+
+def _run(recorder, runs: int, warm: bool) -> list[tuple[float, float]]:
+    results = []
+    if warm:
+        recorder.arm(preroll_seconds=0)
+    for _ in range(runs):
+        results.append(_time_start(recorder))
+        time.sleep(0.1)
+        recorder.stop()
+        time.sleep(0.05)
+    if warm:
+        recorder.disarm()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark recording start")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--simulate-open-ms",
+        type=float,
+        metavar="MS",
+        help="Use a fake device whose stream takes MS to open",
+    )
+    args = parser.parse_args()
+
+    sd = None
+    if args.simulate_open_ms is None:
+        try:
+            import sounddevice
+
+            sounddevice.query_devices(kind="input")
+            sd = sounddevice
+        except Exception as e:
+            print(f"No microphone ({e}); simulating a 50 ms stream open.")
+            args.simulate_open_ms = 50.0
+    if sd is None:
+        sd = FakeSoundDevice(args.simulate_open_ms)
+        device = f"fake device, {args.simulate_open_ms:.0f} ms open"
+    else:
+        device = "default input device"
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["HOME"] = os.environ["USERPROFILE"] = tmp
+        for mode in ("cold", "warm"):
+            recorder = AudioRecorder()
+            with patch.object(recorder, "_get_sounddevice", return_value=sd):
+                results[mode] = _run(recorder, args.runs, warm=mode == "warm")
+
+    print(f"Recording start, {device} ({args.runs} runs, ms)")
+    print(
+        f"{'mode':<6} {'start() med':>12} {'max':>8} {'1st audio med':>14} {'max':>8}"
+    )
+    for mode, timings in results.items():
+        returned = [r for r, _ in timings]
+        first = [f for _, f in timings]
+        print(
+            f"{mode:<6} {statistics.median(returned):>12.2f} {max(returned):>8.2f} "
+            f"{statistics.median(first):>14.2f} {max(first):>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
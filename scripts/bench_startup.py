@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Compare engine cold-start time: loose files vs the zipapp bundle.
+
+Usage:
+    python scripts/bench_startup.py                    # times --check-mic
+    python scripts/bench_startup.py --runs 20 -- --help
+
+Three layouts are timed, each as the median wall time of a fresh process:
+
+    loose-cold   engine/ copied without __pycache__ (first run after install)
+    loose-warm   engine/ with bytecode already cached
+    bundle       engine.pyz from scripts/bundle_engine.py
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from bundle_engine import ENGINE_DIR, build_bundle
+
+
+def _time_run(cmd: list[str], cwd: Path, env: dict) -> float:
+    started = time.perf_counter()
+    subprocess.run(cmd, cwd=cwd, env=env, capture_output=True, check=False)
+    return (time.perf_counter() - started) * 1000
+
+
+def _copy_engine(dest: Path) -> None:
+    if dest.exists():
+        shutil.rmtree(dest)
+    shutil.copytree(
+        ENGINE_DIR, dest / "engine", ignore=shutil.ignore_patterns("__pycache__")
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark engine startup")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("engine_args", nargs="*", default=["--check-mic"])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        env = {**os.environ, "HOME": str(tmp), "USERPROFILE": str(tmp)}
+        loose_cmd = [sys.executable, "-m", "engine", *args.engine_args]
+        bundle = tmp / "engine.pyz"
+        build_bundle(bundle)
+
+        results = {"loose-cold": [], "loose-warm": [], "bundle": []}
+
+        for _ in range(args.runs):
+            cold_root = tmp / "cold"
+            _copy_engine(cold_root)
+            results["loose-cold"].append(_time_run(loose_cmd, cold_root, env))
+
+        warm_root = tmp / "warm"
+        _copy_engine(warm_root)
+        _time_run(loose_cmd, warm_root, env)
+        for _ in range(args.runs):
+            results["loose-warm"].append(_time_run(loose_cmd, warm_root, env))
+
+        bundle_cmd = [sys.executable, str(bundle), *args.engine_args]
+        for _ in range(args.runs):
+            results["bundle"].append(_time_run(bundle_cmd, tmp, env))
+
+    print(f"engine {' '.join(args.engine_args)} ({args.runs} runs, wall ms)")
+    print(f"{'layout':<12} {'median':>8} {'min':>8} {'max':>8}")
+    for layout, times in results.items():
+        print(
+            f"{layout:<12} {statistics.median(times):>8.1f} "
+            f"{min(times):>8.1f} {max(times):>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
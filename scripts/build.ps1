@@ -60,6 +60,12 @@ if (Test-Path $BundleEngineDir) {
 Copy-Item -Path (Join-Path $ProjectRoot "engine") -Destination $BundleEngineDir -Recurse
 Write-Host "Engine copied to: $BundleEngineDir" -ForegroundColor Green
 
+# Precompiled zipapp; bytecode must match the runtime, so build with it
+$RuntimePython = Join-Path $ProjectRoot "python-runtime\Scripts\python.exe"
+$BundleScript = Join-Path $ProjectRoot "scripts\bundle_engine.py"
+& $RuntimePython $BundleScript --output (Join-Path $BundleEngineDir "engine.pyz")
+Write-Host "Engine bundle built: $BundleEngineDir\engine.pyz" -ForegroundColor Green
+
 # Step 2b: Copy python-runtime to src-tauri for bundling (needed during tauri build)
 Write-Host "`n[2b/4] Copying python-runtime for bundling..." -ForegroundColor Yellow
 $BundlePythonDir = Join-Path $ProjectRoot "src-tauri\python-runtime"
@@ -125,6 +131,7 @@ if (Test-Path $EngineDst) {
     Remove-Item -Recurse -Force $EngineDst
 }
 Copy-Item -Path $EngineSrc -Destination $EngineDst -Recurse
+& $RuntimePython $BundleScript --output (Join-Path $EngineDst "engine.pyz")
 Write-Host "Engine bundled" -ForegroundColor Green
 
 Write-Host "`n========================================" -ForegroundColor Cyan
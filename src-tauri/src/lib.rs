@@ -74,6 +74,17 @@ fn get_engine_dir() -> String {
     "engine".to_string()
 }
 
+fn engine_entry<'a>(cmd: &'a mut Command, engine_dir: &str) -> &'a mut Command {
+    // Prefer the precompiled zipapp when it was bundled; fall back to loose files
+    let bundle = std::path::Path::new(engine_dir).join("engine.pyz");
+    
+    if bundle.exists() {
+        cmd.arg(bundle)
+    } else {
+        cmd.arg("-m").arg("engine")
+    }
+}
+
 #[tauri::command]
 fn show_main_window(app: tauri::AppHandle) {
     if let Some(window) = app.get_webview_window("main") {
@@ -136,7 +147,7 @@ async fn start_spool(app: tauri::AppHandle, state: tauri::State<'_, AppState>) -
     info!("Engine dir: {}", engine_dir);
     
     let mut cmd = Command::new(&python_path);
-    cmd.arg("-m").arg("engine").arg("--spool-start");
+    engine_entry(&mut cmd, &engine_dir).arg("--spool-start");
     cmd.current_dir(&engine_dir);
     hide_console(&mut cmd);
     
@@ -208,7 +219,7 @@ async fn transcribe_spool(app: tauri::AppHandle, audio_path: String) -> Result<S
     let engine_dir = get_engine_dir();
     
     let mut cmd = Command::new(&python_path);
-    cmd.arg("-m").arg("engine").arg("--spool-transcribe").arg(&audio_path);
+    engine_entry(&mut cmd, &engine_dir).arg("--spool-transcribe").arg(&audio_path);
     cmd.current_dir(&engine_dir);
     hide_console(&mut cmd);
     
@@ -251,7 +262,7 @@ async fn run_weave(app: tauri::AppHandle, _state: tauri::State<'_, AppState>) ->
     let engine_dir = get_engine_dir();
     
     let mut cmd = Command::new(&python_path);
-    cmd.arg("-m").arg("engine").arg("--weave");
+    engine_entry(&mut cmd, &engine_dir).arg("--weave");
     cmd.current_dir(&engine_dir);
     hide_console(&mut cmd);
     
@@ -277,7 +288,7 @@ async fn run_ask(app: tauri::AppHandle, query: String, _state: tauri::State<'_,
     let engine_dir = get_engine_dir();
     
     let mut cmd = Command::new(&python_path);
-    cmd.arg("-m").arg("engine").arg("--ask");
+    engine_entry(&mut cmd, &engine_dir).arg("--ask");
     cmd.arg(&query);
     cmd.current_dir(&engine_dir);
     hide_console(&mut cmd);
@@ -304,7 +315,7 @@ async fn check_mic(app: tauri::AppHandle) -> Result<String, String> {
     let engine_dir = get_engine_dir();
     
     let mut cmd = Command::new(&python_path);
-    cmd.arg("-m").arg("engine").arg("--check-mic");
+    engine_entry(&mut cmd, &engine_dir).arg("--check-mic");
     cmd.current_dir(&engine_dir);
     hide_console(&mut cmd);
     
@@ -329,7 +340,7 @@ async fn check_ollama(app: tauri::AppHandle) -> Result<String, String> {
     let engine_dir = get_engine_dir();
     
     let mut cmd = Command::new(&python_path);
-    cmd.arg("-m").arg("engine").arg("--check-ollama");
+    engine_entry(&mut cmd, &engine_dir).arg("--check-ollama");
     cmd.current_dir(&engine_dir);
     hide_console(&mut cmd);
     
@@ -354,7 +365,7 @@ async fn install_ollama(app: tauri::AppHandle) -> Result<String, String> {
     let engine_dir = get_engine_dir();
     
     let mut cmd = Command::new(&python_path);
-    cmd.arg("-m").arg("engine").arg("--install-ollama");
+    engine_entry(&mut cmd, &engine_dir).arg("--install-ollama");
     cmd.current_dir(&engine_dir);
     hide_console(&mut cmd);
     
@@ -371,6 +382,31 @@ async fn install_ollama(app: tauri::AppHandle) -> Result<String, String> {
     }
 }
 
+fn run_warmup() -> Result<String, String> {
+    let python_path = get_python_path();
+    let engine_dir = get_engine_dir();
+    
+    let mut cmd = Command::new(&python_path);
+    engine_entry(&mut cmd, &engine_dir).arg("--warmup");
+    cmd.current_dir(&engine_dir);
+    hide_console(&mut cmd);
+    
+    let output = cmd.output()
+        .map_err(|e| format!("Failed to warm up engine: {}", e))?;
+    
+    if output.status.success() {
+        Ok(String::from_utf8_lossy(&output.stdout).to_string())
+    } else {
+        Err(String::from_utf8_lossy(&output.stderr).to_string())
+    }
+}
+
+#[tauri::command]
+async fn warmup_engine() -> Result<String, String> {
+    info!("Warming up engine");
+    run_warmup()
+}
+
 #[tauri::command]
 fn get_engine_status() -> Result<process_manager::EngineStatus, String> {
     process_manager::read_status_file()
@@ -401,6 +437,7 @@ pub fn run() {
             check_mic,
             check_ollama,
             install_ollama,
+            warmup_engine,
             get_engine_status
         ])
         .setup(|app| {
@@ -489,6 +526,14 @@ pub fn run() {
             
             info!("Global shortcuts registered");
             
+            // Preload the Whisper and Ollama models so the first hotkey is fast
+            std::thread::spawn(|| {
+                match run_warmup() {
+                    Ok(report) => info!("Engine warmup: {}", report.trim()),
+                    Err(e) => warn!("Engine warmup failed: {}", e),
+                }
+            });
+            
             Ok(())
         })
         .on_window_event(|window, event| {
@@ -1,5 +1,15 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
+
+
+@pytest.fixture
+def tether_home(tmp_path, monkeypatch):
+    """A scratch home directory, so ~/.tether lands in ``tmp_path``."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+    return tmp_path
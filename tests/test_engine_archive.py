@@ -0,0 +1,94 @@
+import wave
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from engine.audio import archive
+from engine.audio.archive import ArchiveEncoder, archive_recording
+
+
+def _write_wav(path, frames=1600):
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        wf.writeframes(np.arange(frames, dtype=np.int16).tobytes())
+    return path
+
+
+class TestArchiveRecording:
+    """Tests for compressing transcribed recordings"""
+
+    def test_encodes_lossless_flac(self, tmp_path):
+        av = pytest.importorskip("av")
+        wav_path = _write_wav(tmp_path / "clip.wav")
+
+        flac_path = archive_recording(wav_path)
+
+        assert flac_path == tmp_path / "clip.flac"
+        assert not wav_path.exists()
+        with av.open(str(flac_path)) as container:
+            samples = np.concatenate(
+                [frame.to_ndarray().ravel() for frame in container.decode(audio=0)]
+            )
+        np.testing.assert_array_equal(samples, np.arange(1600, dtype=np.int16))
+
+    def test_skips_non_wav(self, tmp_path):
+        flac_path = tmp_path / "clip.flac"
+        flac_path.write_bytes(b"fLaC")
+        assert archive_recording(flac_path) is None
+
+    def test_keeps_wav_without_pyav(self, tmp_path):
+        wav_path = _write_wav(tmp_path / "clip.wav")
+        with patch.object(archive, "encode_flac", side_effect=ImportError):
+            assert archive_recording(wav_path) is None
+        assert wav_path.exists()
+
+    def test_spawns_detached_archive_process(self, tmp_path):
+        with patch("subprocess.Popen") as mock_popen:
+            archive.spawn_archive_process(tmp_path / "clip.wav")
+
+        argv = mock_popen.call_args.args[0]
+        assert argv[-2:] == ["--archive", str(tmp_path / "clip.wav")]
+
+
+class TestArchiveEncoder:
+    """Tests for the daemon's background encoder"""
+
+    def test_encodes_in_order_and_drains_on_close(self, tmp_path):
+        done = []
+        with patch.object(archive, "archive_recording", side_effect=done.append):
+            encoder = ArchiveEncoder()
+            encoder.submit(tmp_path / "a.wav")
+            encoder.submit(tmp_path / "b.wav")
+            encoder.close()
+
+        assert done == [tmp_path / "a.wav", tmp_path / "b.wav"]
+
+    def test_records_errors(self, tmp_path):
+        with patch.object(
+            archive, "archive_recording", side_effect=RuntimeError("bad file")
+        ):
+            encoder = ArchiveEncoder()
+            encoder.submit(tmp_path / "a.wav")
+            encoder.close()
+
+        assert encoder.errors == [(str(tmp_path / "a.wav"), "bad file")]
+
+
+class TestSpoolTranscribeArchives:
+    """Tests for archiving after --spool-transcribe"""
+
+    def test_submits_to_archiver(self, tether_home):
+        from engine.main import cmd_spool_transcribe
+
+        wav_path = _write_wav(tether_home / "clip.wav")
+        transcriber = MagicMock(spec=["transcribe", "settings"])
+        transcriber.settings = {"model": "base"}
+        transcriber.transcribe.return_value = "hello"
+        archiver = MagicMock()
+
+        cmd_spool_transcribe(str(wav_path), transcriber=transcriber, archiver=archiver)
+
+        archiver.submit.assert_called_once_with(wav_path)
@@ -0,0 +1,120 @@
+import os
+import time
+import wave
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from engine.main import cmd_spool_transcribe_batch
+
+
+def _write_wav(path, seconds=1.0, age=60):
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        wf.writeframes(np.zeros(int(16000 * seconds), dtype=np.int16).tobytes())
+    # Finished recordings; a fresh file is one still being recorded.
+    modified = time.time() - age
+    os.utime(path, (modified, modified))
+    return path
+
+
+@pytest.fixture
+def backlog(tether_home):
+    audio_dir = tether_home / "audio"
+    audio_dir.mkdir()
+    # Written newest first, so sorting has to come from the names.
+    for name, seconds in (
+        ("2026-01-05-170000", 2.0),
+        ("2026-01-05-090000", 1.0),
+        ("2026-01-04-120000", 0.5),
+    ):
+        _write_wav(audio_dir / f"{name}.wav", seconds)
+    return audio_dir
+
+
+def _transcriber():
+    transcriber = MagicMock(spec=["transcribe", "settings"])
+    transcriber.settings = {"model": "base"}
+    transcriber.transcribe.side_effect = lambda path, batch_size: Path(path).stem
+    return transcriber
+
+
+class TestSpoolTranscribeBatch:
+    """Tests for --spool-transcribe-batch"""
+
+    def test_spools_in_recording_order(self, backlog, tether_home):
+        transcriber = _transcriber()
+        with patch("engine.main._archive") as archive:
+            summary = cmd_spool_transcribe_batch(str(backlog), transcriber)
+
+        spooled = sorted((tether_home / ".tether" / "spools").glob("*.md"))
+        assert [path.stem for path in spooled] == ["2026-01-04", "2026-01-05"]
+        day = spooled[1].read_text()
+        assert day.index("[09:00:00]**: 2026-01-05-090000") < day.index(
+            "[17:00:00]**: 2026-01-05-170000"
+        )
+        assert [c.args[0].stem for c in archive.call_args_list] == [
+            "2026-01-04-120000",
+            "2026-01-05-090000",
+            "2026-01-05-170000",
+        ]
+        assert summary["files"] == 3
+        assert summary["audio_seconds"] == 3.5
+        assert summary["throughput"] > 0
+
+    def test_one_archiver_for_the_batch(self, backlog):
+        with patch("engine.audio.archive.ArchiveEncoder") as encoder:
+            encoder.return_value.errors = []
+            cmd_spool_transcribe_batch(str(backlog), _transcriber())
+
+        encoder.assert_called_once_with()
+        archiver = encoder.return_value
+        assert [c.args[0].stem for c in archiver.submit.call_args_list] == [
+            "2026-01-04-120000",
+            "2026-01-05-090000",
+            "2026-01-05-170000",
+        ]
+        archiver.close.assert_called_once()
+
+    def test_loads_one_model_with_batching(self, backlog):
+        transcriber = _transcriber()
+        with patch("engine.main._archive"):
+            cmd_spool_transcribe_batch(str(backlog), transcriber, batch_size=4)
+
+        assert transcriber.transcribe.call_count == 3
+        assert {
+            c.kwargs["batch_size"] for c in transcriber.transcribe.call_args_list
+        } == {4}
+
+    def test_damaged_file_is_skipped(self, backlog, capsys):
+        damaged = backlog / "2026-01-06-080000.wav"
+        damaged.write_bytes(b"not a wav")
+        os.utime(damaged, (1000, 1000))
+        transcriber = _transcriber()
+        with patch("engine.main._archive") as archive:
+            summary = cmd_spool_transcribe_batch(str(backlog), transcriber)
+
+        assert summary["files"] == 3
+        assert summary["failed"] == [str(backlog / "2026-01-06-080000.wav")]
+        assert archive.call_count == 3
+        assert "Failed: 2026-01-06-080000.wav" in capsys.readouterr().out
+
+    def test_recording_in_progress_is_left_alone(self, backlog, capsys):
+        live = _write_wav(backlog / "2026-01-06-080000.wav", age=0)
+        transcriber = _transcriber()
+        with patch("engine.main._archive") as archive:
+            summary = cmd_spool_transcribe_batch(str(backlog), transcriber)
+
+        assert summary["files"] == 3
+        assert live.name not in {c.args[0].name for c in archive.call_args_list}
+        assert transcriber.transcribe.call_count == 3
+        assert live.exists()
+        assert "Skipping 2026-01-06-080000.wav" in capsys.readouterr().out
+
+    def test_empty_and_missing_directories(self, tmp_path):
+        assert cmd_spool_transcribe_batch(str(tmp_path))["files"] == 0
+        assert cmd_spool_transcribe_batch(str(tmp_path / "nope")) is None
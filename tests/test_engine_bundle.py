@@ -0,0 +1,73 @@
+import json
+import os
+import subprocess
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture(scope="module")
+def bundle(tmp_path_factory):
+    output = tmp_path_factory.mktemp("bundle") / "engine.pyz"
+    result = subprocess.run(
+        [
+            sys.executable,
+            str(PROJECT_ROOT / "scripts" / "bundle_engine.py"),
+            "--output",
+            str(output),
+        ],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    return output
+
+
+class TestEngineBundle:
+    """Tests for the precompiled zipapp engine bundle"""
+
+    def test_bundle_is_sourceless(self, bundle):
+        with zipfile.ZipFile(bundle) as zf:
+            names = zf.namelist()
+
+        assert "__main__.pyc" in names
+        assert "engine/main.pyc" in names
+        assert "engine/__init__.pyc" in names
+        assert not [n for n in names if n.endswith(".py")]
+
+    def test_bundle_runs_help(self, bundle, tmp_path):
+        result = subprocess.run(
+            [sys.executable, str(bundle), "--help"],
+            capture_output=True,
+            text=True,
+            cwd=tmp_path,
+            timeout=30,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert "spool" in result.stdout.lower()
+        assert "weave" in result.stdout.lower()
+
+    def test_bundle_runs_command(self, bundle, tmp_path):
+        env = {**os.environ, "HOME": str(tmp_path), "USERPROFILE": str(tmp_path)}
+        result = subprocess.run(
+            [sys.executable, str(bundle), "--check-ollama"],
+            capture_output=True,
+            text=True,
+            cwd=tmp_path,
+            env=env,
+            timeout=30,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert json.loads(result.stdout)["model"] == "granite4:3b"
+
+    def test_tauri_prefers_bundle(self):
+        lib_rs = (PROJECT_ROOT / "src-tauri" / "src" / "lib.rs").read_text()
+
+        assert "engine.pyz" in lib_rs
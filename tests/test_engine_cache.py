@@ -0,0 +1,265 @@
+import os
+import wave
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from engine.stt.cache import TranscriptCache, audio_key
+
+SETTINGS = {"model": "small.en", "compute_type": "int8", "language": "en"}
+
+
+def _samples(seconds=0.5, seed=0):
+    rng = np.random.default_rng(seed)
+    pcm = rng.integers(-8000, 8000, int(16000 * seconds), dtype=np.int16)
+    return pcm
+
+
+def _write_wav(path, pcm):
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        wf.writeframes(pcm.tobytes())
+    return path
+
+
+def _transcriber(text="hello there"):
+    transcriber = MagicMock(spec=["transcribe_segments", "settings"])
+    transcriber.settings = dict(SETTINGS)
+    transcriber.transcribe_segments.return_value = {
+        "text": text,
+        "segments": [{"start": 0.0, "end": 0.5, "text": text}],
+    }
+    return transcriber
+
+
+class TestAudioKey:
+    """Tests for the audio hash"""
+
+    def test_wav_and_memory_share_a_key(self, tmp_path):
+        pcm = _samples()
+        wav = _write_wav(tmp_path / "clip.wav", pcm)
+
+        assert audio_key(wav, SETTINGS) == audio_key(pcm / 32768.0, SETTINGS)
+        assert audio_key(wav, SETTINGS) == audio_key(
+            pcm.astype(np.float32) / 32768.0, SETTINGS
+        )
+
+    def test_settings_and_audio_change_the_key(self):
+        pcm = _samples()
+        key = audio_key(pcm, SETTINGS)
+
+        assert audio_key(pcm, {**SETTINGS, "model": "tiny.en"}) != key
+        assert audio_key(pcm, {**SETTINGS, "language": "de"}) != key
+        assert audio_key(_samples(seed=1), SETTINGS) != key
+
+    def test_non_wav_file_hashes_its_bytes(self, tmp_path):
+        path = tmp_path / "clip.flac"
+        path.write_bytes(b"fLaC" + bytes(100))
+
+        key = audio_key(path, SETTINGS)
+        assert audio_key(str(path), SETTINGS) == key
+        path.write_bytes(b"fLaC" + bytes(101))
+        assert audio_key(path, SETTINGS) != key
+
+
+class TestTranscriptCache:
+    """Tests for the on-disk transcript cache"""
+
+    def test_hit_skips_transcription(self, tmp_path):
+        cache = TranscriptCache(tmp_path)
+        transcriber = _transcriber()
+        pcm = _samples()
+
+        key, entry, hit = cache.transcribe(transcriber, pcm)
+        assert not hit
+        assert entry["segments"][0]["text"] == "hello there"
+
+        again, cached, hit = cache.transcribe(transcriber, pcm)
+        assert hit
+        assert again == key
+        assert cached == entry
+        transcriber.transcribe_segments.assert_called_once()
+
+    def test_persists_across_instances(self, tmp_path):
+        pcm = _samples()
+        TranscriptCache(tmp_path).transcribe(_transcriber(), pcm)
+
+        transcriber = _transcriber()
+        _, entry, hit = TranscriptCache(tmp_path).transcribe(transcriber, pcm)
+        assert hit
+        assert entry["text"] == "hello there"
+        transcriber.transcribe_segments.assert_not_called()
+
+    def test_text_only_transcriber(self, tmp_path):
+        transcriber = MagicMock(spec=["transcribe"])
+        transcriber.transcribe.return_value = "pooled"
+
+        _, entry, _ = TranscriptCache(tmp_path).transcribe(transcriber, _samples())
+
+        assert entry == {"text": "pooled", "segments": None, "spooled": False}
+
+    def test_tiered_entries_are_keyed_by_the_tier_used(self, tmp_path):
+        cache = TranscriptCache(tmp_path)
+        transcriber = MagicMock(spec=["transcribe_segments", "cache_settings"])
+        transcriber.cache_settings = [
+            {**SETTINGS, "model": "small.en"},
+            {**SETTINGS, "model": "tiny.en"},
+        ]
+        transcriber.transcribe_segments.return_value = {
+            "text": "hi",
+            "segments": [],
+            "model": "tiny.en",
+        }
+        pcm = _samples()
+
+        key, _, _ = cache.transcribe(transcriber, pcm)
+        # A retry finds it whichever tier would be picked this time.
+        assert cache.transcribe(transcriber, pcm)[2] is True
+
+        assert key == audio_key(pcm, {**SETTINGS, "model": "tiny.en"})
+        transcriber.transcribe_segments.assert_called_once()
+
+    def test_mark_spooled(self, tmp_path):
+        cache = TranscriptCache(tmp_path)
+        key, entry, _ = cache.transcribe(_transcriber(), _samples())
+        assert not entry["spooled"]
+
+        cache.mark_spooled(key)
+        assert cache.get(key)["spooled"]
+        cache.mark_spooled("missing")
+        assert cache.get("missing") is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = TranscriptCache(tmp_path)
+        keys = [cache.transcribe(_transcriber(), _samples(seed=i))[0] for i in range(3)]
+        for age, key in enumerate(keys):
+            # Oldest first, then the first entry is used again.
+            os.utime(tmp_path / f"{key}.json", (1000 + age, 1000 + age))
+        cache.get(keys[0])
+
+        size = (tmp_path / f"{keys[0]}.json").stat().st_size
+        cache.max_bytes = size * 3
+        cache.transcribe(_transcriber(), _samples(seed=3))
+
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[2]) is not None
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        cache = TranscriptCache(tmp_path)
+        (tmp_path / "abc.json").write_text("{not json")
+
+        assert cache.get("abc") is None
+
+
+class TestSpoolTranscribeCache:
+    """Tests for the cache in --spool-transcribe"""
+
+    def test_retry_is_not_spooled_twice(self, tether_home, capsys):
+        from engine.main import cmd_spool_transcribe
+
+        pcm = _samples()
+        wav = _write_wav(tether_home / "clip.wav", pcm)
+        transcriber = _transcriber()
+
+        with patch("engine.main._archive"):
+            assert cmd_spool_transcribe(str(wav), transcriber=transcriber)
+            # The shell retries with the audio it still holds in memory.
+            assert cmd_spool_transcribe(
+                str(wav), transcriber=transcriber, audio=pcm / 32768.0
+            )
+
+        transcriber.transcribe_segments.assert_called_once()
+        spool = next((tether_home / ".tether" / "spools").glob("*.md")).read_text()
+        assert spool.count("hello there") == 1
+        out = capsys.readouterr().out
+        assert out.count("TRANSCRIPTION:hello there") == 2
+        assert "already in the spool" in out
+
+    def test_wav_is_trimmed_like_the_hand_off(self, tether_home, capsys):
+        from engine.audio.vad import trim_silence
+        from engine.main import cmd_spool_transcribe
+
+        # 6 s with 5 s of it silence, as --spool-start leaves it on disk.
+        t = np.arange(16000) / 16000
+        tone = (8000 * np.sin(2 * np.pi * 220 * t)).astype(np.int16)
+        silence = np.zeros(16000 * 5 // 2, dtype=np.int16)
+        pcm = np.concatenate([silence, tone, silence])
+        wav = _write_wav(tether_home / "clip.wav", pcm)
+        transcriber = _transcriber()
+
+        with patch("engine.main._archive"):
+            cmd_spool_transcribe(str(wav), transcriber=transcriber)
+            # The daemon's in-memory hand-off of the same take.
+            trimmed, _ = trim_silence(pcm.reshape(-1, 1), 16000)
+            cmd_spool_transcribe(
+                str(wav), transcriber=transcriber, audio=trimmed[:, 0] / 32768.0
+            )
+
+        transcriber.transcribe_segments.assert_called_once()
+        audio = transcriber.transcribe_segments.call_args.args[0]
+        assert isinstance(audio, np.ndarray) and len(audio) == len(trimmed)
+        assert len(audio) < 16000 * 2
+        assert "Trimmed" in capsys.readouterr().out
+        spool = next((tether_home / ".tether" / "spools").glob("*.md")).read_text()
+        assert spool.count("hello there") == 1
+
+    def test_new_recording_at_the_same_path_is_transcribed(self, tmp_path):
+        cache = TranscriptCache(tmp_path / "cache")
+        transcriber = _transcriber()
+        wav = _write_wav(tmp_path / "a.wav", _samples(seconds=1000 / 16000))
+        cache.transcribe(transcriber, str(wav))
+
+        _write_wav(wav, _samples(seconds=5000 / 16000, seed=1))
+        _, _, hit = cache.transcribe(transcriber, str(wav))
+
+        assert hit is False
+        assert transcriber.transcribe_segments.call_count == 2
+
+    def test_retry_after_archive_uses_flac(self, tether_home, capsys):
+        from engine.main import cmd_spool_transcribe
+
+        wav = _write_wav(tether_home / "clip.wav", _samples())
+        transcriber = _transcriber()
+
+        def archive(path, archiver=None):
+            if path.suffix != ".wav":
+                return
+            # The text must be spooled before the WAV can go.
+            spool = next((tether_home / ".tether" / "spools").glob("*.md")).read_text()
+            assert "hello there" in spool
+            path.with_suffix(".flac").write_bytes(b"fLaC" + bytes(64))
+            path.unlink()
+
+        with patch("engine.main._archive", side_effect=archive) as archived:
+            assert cmd_spool_transcribe(str(wav), transcriber=transcriber)
+            assert cmd_spool_transcribe(str(wav), transcriber=transcriber)
+
+        transcriber.transcribe_segments.assert_called_once()
+        assert archived.call_args.args[0] == tether_home / "clip.flac"
+        spool = next((tether_home / ".tether" / "spools").glob("*.md")).read_text()
+        assert spool.count("hello there") == 1
+        out = capsys.readouterr().out
+        assert "Using archived recording" in out
+        assert "already in the spool" in out
+
+    def test_batch_rerun_skips_spooled_files(self, tether_home):
+        from engine.main import cmd_spool_transcribe_batch
+
+        audio_dir = tether_home / "audio"
+        audio_dir.mkdir()
+        wav = _write_wav(audio_dir / "2026-01-05-090000.wav", _samples())
+        # Not the recording in progress.
+        os.utime(wav, (1000, 1000))
+        transcriber = _transcriber()
+
+        # The first run is cut short before it archives the file.
+        with patch("engine.main._archive"):
+            cmd_spool_transcribe_batch(str(audio_dir), transcriber)
+            cmd_spool_transcribe_batch(str(audio_dir), transcriber)
+
+        transcriber.transcribe_segments.assert_called_once()
+        spool = next((tether_home / ".tether" / "spools").glob("*.md")).read_text()
+        assert spool.count("hello there") == 1
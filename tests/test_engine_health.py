@@ -0,0 +1,75 @@
+import json
+from types import SimpleNamespace
+
+from engine.audio.health import Histogram, RecorderHealth
+
+
+class TestHistogram:
+    """Tests for the fixed-bucket histogram"""
+
+    def test_values_land_in_their_buckets(self):
+        histogram = Histogram((10, 100))
+        for value in (5, 10, 50, 500):
+            histogram.add(value)
+
+        assert histogram.counts == [2, 1, 1]
+        assert histogram.count == 4
+        assert histogram.max == 500
+
+    def test_percentiles_use_bucket_bounds(self):
+        histogram = Histogram((10, 100))
+        for _ in range(98):
+            histogram.add(5)
+        histogram.add(50)
+        histogram.add(700)
+
+        assert histogram.percentile(0.5) == 10
+        assert histogram.percentile(0.99) == 100
+        assert histogram.percentile(1.0) == 700
+        assert Histogram((10,)).percentile(0.5) is None
+
+    def test_snapshot_labels(self):
+        histogram = Histogram((10, 100))
+        histogram.add(1000)
+
+        assert histogram.snapshot()["buckets"] == {"<=10": 0, "<=100": 0, ">100": 1}
+
+
+class TestRecorderHealth:
+    """Tests for the recorder's capture health counters"""
+
+    def test_counts_overflow_flags(self):
+        health = RecorderHealth(16000)
+        clean = SimpleNamespace(input_overflow=False, input_underflow=False)
+        overflow = SimpleNamespace(input_overflow=True, input_underflow=False)
+
+        health.on_callback(0.0, 160, None)
+        health.on_callback(0.01, 160, clean)
+        health.on_callback(0.02, 160, overflow)
+
+        assert health.callbacks == 3
+        assert health.input_overflows == 1
+        assert health.input_underflows == 0
+
+    def test_jitter_is_distance_from_the_block_period(self):
+        health = RecorderHealth(16000)
+        # 160 frames at 16 kHz: callbacks are due every 10 ms.
+        for started in (0.0, 0.010, 0.030, 0.040):
+            health.on_callback(started, 160, None)
+
+        assert health.jitter_us.count == 3
+        assert round(health.jitter_us.max) == 10000
+
+    def test_high_water_marks(self):
+        health = RecorderHealth(16000, ring_capacity=1000)
+        for queued in (100, 600, 200):
+            health.observe_ring(queued)
+        health.observe_buffer(32000)
+        health.observe_buffer(16000)
+
+        snapshot = health.snapshot(dropped_frames=160)
+        assert snapshot["ring_high_water"] == 600
+        assert snapshot["ring_high_water_fraction"] == 0.6
+        assert snapshot["buffer_high_water_seconds"] == 2.0
+        assert snapshot["dropped_frames"] == 160
+        json.dumps(snapshot)
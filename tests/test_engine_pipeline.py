@@ -0,0 +1,142 @@
+import time
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from engine.stt import Spool
+from engine.stt.pipeline import SegmentPipeline
+from engine.stt.streaming import StreamingPipeline
+
+
+def _tone(seconds=0.5):
+    t = np.arange(int(16000 * seconds)) / 16000
+    return (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+class SlowTranscriber:
+    """Takes longer on early segments, to show order is kept anyway."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def transcribe(self, samples):
+        self.calls += 1
+        time.sleep(0.02 if self.calls == 1 else 0)
+        return f"segment {self.calls}"
+
+
+class TestSegmentPipeline:
+    """Tests for transcribing segments while recording continues"""
+
+    def test_spools_in_order_with_segment_timestamps(self, tmp_path):
+        spool = Spool(daily_dir=tmp_path)
+        pipeline = SegmentPipeline(SlowTranscriber(), spool)
+        started = datetime(2026, 1, 5, 9, 0, 0)
+
+        for index in range(3):
+            pipeline.submit(index, _tone(), started + timedelta(seconds=30 * index))
+        text = pipeline.close()
+
+        assert text == "segment 1 segment 2 segment 3"
+        note = (tmp_path / "2026-01-05.md").read_text()
+        assert note.index("[09:00:00]**: segment 1") < note.index(
+            "[09:00:30]**: segment 2"
+        )
+        assert "[09:01:00]**: segment 3" in note
+
+    def test_silent_segments_are_skipped(self):
+        transcriber = MagicMock()
+        pipeline = SegmentPipeline(transcriber)
+
+        pipeline.submit(0, np.zeros(16000, dtype=np.float32), datetime.now())
+        pipeline.close()
+
+        transcriber.transcribe.assert_not_called()
+
+    def test_failed_segment_does_not_stop_the_rest(self):
+        transcriber = MagicMock()
+        transcriber.transcribe.side_effect = [RuntimeError("decode failed"), "later"]
+        seen = []
+        pipeline = SegmentPipeline(transcriber, on_text=lambda *args: seen.append(args))
+
+        pipeline.submit(0, _tone(), datetime.now())
+        pipeline.submit(1, _tone(), datetime.now())
+        text = pipeline.close()
+
+        assert text == "later"
+        assert pipeline.errors == [(0, "decode failed")]
+        assert [index for index, _, _ in seen] == [1]
+
+
+class LiveAudio:
+    """Stands in for AudioRecorder.live_segment with a growing segment."""
+
+    def __init__(self):
+        self.index = 0
+        self.samples = np.zeros(0, dtype=np.float32)
+        self.started_at = datetime(2026, 1, 5, 9, 0, 0)
+
+    def __call__(self):
+        return self.index, self.samples.copy(), self.started_at
+
+
+class TestStreamingPipeline:
+    """Tests for partial captions of the segment being recorded"""
+
+    def _wait(self, condition, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return condition()
+
+    def test_partials_then_final(self):
+        live = LiveAudio()
+        transcriber = MagicMock()
+        transcriber.transcribe.side_effect = lambda samples: f"{len(samples)} samples"
+        partials, finals = [], []
+        pipeline = StreamingPipeline(
+            transcriber,
+            live,
+            on_text=lambda *args: finals.append(args),
+            on_partial=lambda *args: partials.append(args),
+            partial_interval=0.02,
+            trim_silence=False,
+        )
+
+        live.samples = _tone(0.5)
+        assert self._wait(lambda: len(partials) == 1)
+        live.samples = _tone(1.0)
+        assert self._wait(lambda: len(partials) == 2)
+
+        pipeline.submit(0, _tone(1.2), live.started_at)
+        live.index, live.samples = 1, np.zeros(0, dtype=np.float32)
+        text = pipeline.close()
+
+        assert [p[1] for p in partials] == ["8000 samples", "16000 samples"]
+        assert finals == [(0, "19200 samples", live.started_at)]
+        assert text == "19200 samples"
+
+    def test_no_decode_without_new_audio(self):
+        live = LiveAudio()
+        live.samples = _tone(0.5)
+        transcriber = MagicMock()
+        transcriber.transcribe.return_value = "hello"
+        pipeline = StreamingPipeline(
+            transcriber, live, partial_interval=0.01, trim_silence=False
+        )
+
+        assert self._wait(lambda: pipeline.partials == 1)
+        time.sleep(0.1)
+        pipeline.close()
+
+        assert transcriber.transcribe.call_count == 1
+
+    def test_nothing_recorded(self):
+        transcriber = MagicMock()
+        pipeline = StreamingPipeline(transcriber, lambda: None, partial_interval=0.01)
+
+        time.sleep(0.05)
+        pipeline.close()
+
+        transcriber.transcribe.assert_not_called()
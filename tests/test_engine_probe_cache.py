@@ -0,0 +1,134 @@
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from engine.utils import probe_cache
+from engine.utils.probe_cache import cached_probe, invalidate_probe
+
+# Every probe here writes its cache under ~/.tether.
+pytestmark = pytest.mark.usefixtures("tether_home")
+
+
+class TestCachedProbe:
+    """Tests for the probe cache"""
+
+    def test_second_call_is_cached(self):
+        probe = MagicMock(return_value={"ok": True, "error": None})
+
+        first = cached_probe("p", "fp", 60, probe)
+        second = cached_probe("p", "fp", 60, probe)
+
+        assert probe.call_count == 1
+        assert first["cached"] is False
+        assert second == {"ok": True, "error": None, "cached": True}
+
+    def test_fingerprint_change_reprobes(self):
+        probe = MagicMock(return_value={"error": None})
+
+        cached_probe("p", "fp-1", 60, probe)
+        cached_probe("p", "fp-2", 60, probe)
+
+        assert probe.call_count == 2
+
+    def test_expired_entry_reprobes(self):
+        probe = MagicMock(return_value={"error": None})
+
+        cached_probe("p", "fp", 60, probe)
+        with patch.object(probe_cache.time, "time", return_value=time.time() + 61):
+            cached_probe("p", "fp", 60, probe)
+
+        assert probe.call_count == 2
+
+    def test_refresh_forces_probe(self):
+        probe = MagicMock(return_value={"error": None})
+
+        cached_probe("p", "fp", 60, probe)
+        cached_probe("p", "fp", 60, probe, refresh=True)
+
+        assert probe.call_count == 2
+
+    def test_errors_are_not_cached(self):
+        probe = MagicMock(return_value={"error": "PortAudio not found"})
+
+        cached_probe("p", "fp", 60, probe)
+        cached_probe("p", "fp", 60, probe)
+
+        assert probe.call_count == 2
+
+    def test_unavailable_results_expire_sooner(self):
+        probe = MagicMock(return_value={"available": False, "error": None})
+
+        cached_probe("p", "fp", 300, probe, unavailable_ttl=10)
+        cached_probe("p", "fp", 300, probe, unavailable_ttl=10)
+        assert probe.call_count == 1
+
+        with patch.object(probe_cache.time, "time", return_value=time.time() + 11):
+            cached_probe("p", "fp", 300, probe, unavailable_ttl=10)
+        assert probe.call_count == 2
+
+    def test_available_results_keep_the_full_ttl(self):
+        probe = MagicMock(return_value={"available": True, "error": None})
+
+        cached_probe("p", "fp", 300, probe, unavailable_ttl=10)
+        with patch.object(probe_cache.time, "time", return_value=time.time() + 11):
+            cached_probe("p", "fp", 300, probe, unavailable_ttl=10)
+
+        assert probe.call_count == 1
+
+    def test_invalidate(self):
+        probe = MagicMock(return_value={"error": None})
+
+        cached_probe("p", "fp", 60, probe)
+        invalidate_probe("p")
+        cached_probe("p", "fp", 60, probe)
+
+        assert probe.call_count == 2
+
+
+class TestCheckCommands:
+    """Tests for cached --check-mic and --check-ollama"""
+
+    def test_check_mic_answers_from_cache_quickly(self, capsys):
+        from engine.main import cmd_check_mic
+
+        with patch("engine.main._probe_mic") as mock_probe:
+            mock_probe.return_value = {"available": True, "devices": [], "error": None}
+            cmd_check_mic()
+
+            started = time.perf_counter()
+            result = cmd_check_mic()
+            elapsed = time.perf_counter() - started
+
+        assert mock_probe.call_count == 1
+        assert result["cached"] is True
+        assert elapsed < 0.05
+
+    def test_check_ollama_cache_keyed_on_path(self, monkeypatch, capsys):
+        from engine.main import cmd_check_ollama
+
+        with patch("shutil.which", return_value=None) as mock_which:
+            monkeypatch.setenv("PATH", "/one")
+            cmd_check_ollama()
+            cmd_check_ollama()
+            monkeypatch.setenv("PATH", "/two")
+            result = cmd_check_ollama()
+
+        assert mock_which.call_count == 2
+        assert result["status"] == "not_installed"
+
+    def test_failed_stream_invalidates_mic_probe(self):
+        from engine.audio import AudioRecorder
+
+        probe = MagicMock(return_value={"error": None})
+        cached_probe("mic", "fp", 60, probe)
+
+        recorder = AudioRecorder()
+        with patch.object(recorder, "_get_sounddevice") as mock_get_sd:
+            mock_get_sd.return_value.InputStream.side_effect = OSError("no device")
+            with pytest.raises(OSError):
+                recorder.start()
+
+        assert not recorder.is_recording()
+        cached_probe("mic", "fp", 60, probe)
+        assert probe.call_count == 2
@@ -0,0 +1,430 @@
+import threading
+import wave
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from engine.audio import AudioRecorder
+from engine.audio.buffer import RingBuffer, SampleBuffer
+from engine.audio.vad import trim_silence
+from engine.audio.wav_writer import StreamingWavWriter, repair_wav
+
+
+def _blocks(count, frames=160, channels=1):
+    return [np.full((frames, channels), i, dtype=np.int16) for i in range(count)]
+
+
+def _fake_sounddevice(rate=16000, channels=1):
+    sd = MagicMock()
+    sd.query_devices.return_value = {
+        "default_samplerate": float(rate),
+        "max_input_channels": channels,
+    }
+    return sd
+
+
+class TestSampleBuffer:
+    """Tests for the growable capture buffer"""
+
+    def test_append_and_view(self):
+        buffer = SampleBuffer(initial_frames=1000)
+        for block in _blocks(3):
+            buffer.append(block)
+
+        view = buffer.view()
+        assert len(buffer) == 480
+        assert view.shape == (480, 1)
+        assert view[0, 0] == 0 and view[-1, 0] == 2
+
+    def test_grows_geometrically(self):
+        buffer = SampleBuffer(initial_frames=100)
+        buffer.append(np.zeros((150, 1), dtype=np.int16))
+        assert buffer.capacity == 200
+
+        buffer.append(np.zeros((500, 1), dtype=np.int16))
+        assert buffer.capacity == 650
+        assert len(buffer) == 650
+
+    def test_growth_keeps_samples(self):
+        buffer = SampleBuffer(initial_frames=160)
+        blocks = _blocks(10)
+        for block in blocks:
+            buffer.append(block)
+
+        np.testing.assert_array_equal(buffer.view(), np.concatenate(blocks))
+
+    def test_view_does_not_copy(self):
+        buffer = SampleBuffer(initial_frames=1000)
+        buffer.append(np.ones((10, 1), dtype=np.int16))
+
+        assert np.shares_memory(buffer.view(), buffer._data)
+
+
+class TestRingBuffer:
+    """Tests for the pre-roll ring"""
+
+    def test_parts_before_wrap(self):
+        ring = RingBuffer(1000)
+        for block in _blocks(2):
+            ring.write(block)
+
+        (part,) = ring.parts()
+        assert len(ring) == 320
+        assert part[0, 0] == 0 and part[-1, 0] == 1
+
+    def test_keeps_most_recent_frames_in_order(self):
+        ring = RingBuffer(400)
+        for block in _blocks(5):
+            ring.write(block)
+
+        frames = np.concatenate(ring.parts()).ravel()
+        assert len(ring) == ring.capacity == 400
+        np.testing.assert_array_equal(frames, np.concatenate(_blocks(5))[-400:].ravel())
+
+    def test_block_larger_than_ring(self):
+        ring = RingBuffer(100)
+        ring.write(np.arange(250, dtype=np.int16).reshape(-1, 1))
+
+        frames = np.concatenate(ring.parts()).ravel()
+        np.testing.assert_array_equal(frames, np.arange(150, 250))
+
+
+class TestStreamingWavWriter:
+    """Tests for the incremental WAV writer"""
+
+    def test_flushed_file_is_readable_before_close(self, tmp_path):
+        path = tmp_path / "partial.wav"
+        writer = StreamingWavWriter(path, 16000)
+        block = np.arange(320, dtype=np.int16).reshape(-1, 1)
+        writer.write(block)
+        writer.flush()
+
+        with wave.open(str(path), "rb") as wf:
+            assert wf.getnframes() == 320
+            data = np.frombuffer(wf.readframes(320), dtype=np.int16)
+        np.testing.assert_array_equal(data, block.ravel())
+        writer.close()
+
+    def test_repair_fixes_stale_header(self, tmp_path):
+        path = tmp_path / "killed.wav"
+        writer = StreamingWavWriter(path, 16000)
+        writer.flush()
+        # Frames written after the last flush, then the process dies.
+        writer._file.write(np.ones(100, dtype=np.int16).tobytes() + b"\x00")
+        writer._file.flush()
+
+        assert repair_wav(path) is True
+        with wave.open(str(path), "rb") as wf:
+            assert wf.getnframes() == 100
+        assert repair_wav(path) is False
+
+
+class TestAudioRecorder:
+    """Tests for the engine AudioRecorder"""
+
+    def _record(self, recorder, blocks, sd=None):
+        with patch.object(recorder, "_get_sounddevice") as mock_get_sd:
+            mock_get_sd.return_value = sd or _fake_sounddevice()
+            recorder.start()
+            for block in blocks:
+                recorder._audio_callback(block, len(block), None, None)
+                # Stand in for the drain thread keeping up with the device.
+                recorder._drain()
+            return recorder.stop()
+
+    def test_stop_without_start(self):
+        assert AudioRecorder().stop() is None
+
+    def test_stop_writes_wav(self, tether_home):
+        recorder = AudioRecorder()
+        blocks = _blocks(5)
+
+        path = self._record(recorder, blocks)
+
+        with wave.open(str(path), "rb") as wf:
+            assert wf.getframerate() == 16000
+            assert wf.getnchannels() == 1
+            data = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+        np.testing.assert_array_equal(data, np.concatenate(blocks).ravel())
+
+    def test_empty_recording_returns_none(self, tether_home):
+        assert self._record(AudioRecorder(), []) is None
+
+    def test_get_audio_is_a_view(self, tether_home):
+        recorder = AudioRecorder()
+        self._record(recorder, _blocks(2))
+
+        audio = recorder.get_audio()
+        assert audio.shape == (320, 1)
+        assert np.shares_memory(audio, recorder._buffer.view())
+
+    def test_streams_to_disk_while_recording(self, tether_home):
+        recorder = AudioRecorder()
+        with patch.object(recorder, "_get_sounddevice") as mock_get_sd:
+            mock_get_sd.return_value = _fake_sounddevice()
+            recorder.start()
+            for block in _blocks(3):
+                recorder._audio_callback(block, len(block), None, None)
+            recorder._drain(flush=True)
+
+            with wave.open(str(recorder.current_path), "rb") as wf:
+                assert wf.getnframes() == 480
+
+            path = recorder.stop()
+
+        assert path == recorder.current_path
+        assert path.parent == tether_home / ".tether" / "audio"
+
+    def test_trim_silence_only_trims_the_hand_off(self, tether_home):
+        recorder = AudioRecorder(trim_silence=True)
+        t = np.arange(16000) / 16000
+        tone = (8000 * np.sin(2 * np.pi * 220 * t)).astype(np.int16)
+        silence = np.zeros(32000, dtype=np.int16)
+        blocks = [silence.reshape(-1, 1), tone.reshape(-1, 1), silence.reshape(-1, 1)]
+
+        with patch("engine.audio.vad.trim_silence", wraps=trim_silence) as trim:
+            path = self._record(recorder, blocks)
+            # stop() leaves the trim to whoever takes the samples.
+            trim.assert_not_called()
+            audio = recorder.get_audio()
+            recorder.get_audio_float()
+            trim.assert_called_once()
+
+        assert 3.5 <= recorder.trimmed_seconds <= 4.0
+        assert len(audio) == 80000 - 16000 * recorder.trimmed_seconds
+        with wave.open(str(path), "rb") as wf:
+            assert wf.getnframes() == 80000
+
+    def test_armed_recording_starts_with_preroll(self, tether_home):
+        recorder = AudioRecorder()
+        blocks = _blocks(6)
+        with patch.object(recorder, "_get_sounddevice") as mock_get_sd:
+            mock_get_sd.return_value = _fake_sounddevice()
+            recorder.arm(preroll_seconds=0.02)
+            stream = recorder._stream
+
+            # 0.02 s at 16 kHz is 320 frames: only blocks 2 and 3 survive.
+            for block in blocks[:4]:
+                recorder._audio_callback(block, len(block), None, None)
+            recorder.start()
+            for block in blocks[4:]:
+                recorder._audio_callback(block, len(block), None, None)
+            path = recorder.stop()
+
+        assert recorder.preroll_seconds == 0.02
+        with wave.open(str(path), "rb") as wf:
+            data = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+        np.testing.assert_array_equal(data, np.concatenate(blocks[2:]).ravel())
+
+        # The stream stays open for the next recording until disarmed.
+        assert recorder._stream is stream
+        stream.close.assert_not_called()
+        recorder.disarm()
+        stream.close.assert_called_once()
+
+    def test_warm_stream_is_reused_without_preroll(self, tether_home):
+        recorder = AudioRecorder()
+        sd = _fake_sounddevice()
+        with patch.object(recorder, "_get_sounddevice", return_value=sd):
+            recorder.arm(preroll_seconds=0)
+            # Audio between recordings is dropped, not kept as pre-roll.
+            recorder._audio_callback(_blocks(1)[0], 160, None, None)
+            recorder._drain()
+            paths = [self._record(recorder, _blocks(2), sd) for _ in range(2)]
+
+        assert sd.InputStream.call_count == 1
+        assert recorder.preroll_seconds == 0.0
+        for path in paths:
+            with wave.open(str(path), "rb") as wf:
+                assert wf.getnframes() == 320
+        recorder.disarm()
+        assert not recorder.stream_open
+
+    def test_idle_release_closes_and_start_reopens(self, tether_home):
+        recorder = AudioRecorder()
+        sd = _fake_sounddevice()
+        with patch.object(recorder, "_get_sounddevice", return_value=sd):
+            recorder.arm(preroll_seconds=0, idle_release=0.05)
+            self._record(recorder, _blocks(2), sd)
+            stream = recorder._stream
+            recorder._release_timer.join(1)
+
+            assert not recorder.stream_open
+            stream.close.assert_called_once()
+
+            path = self._record(recorder, _blocks(2), sd)
+
+        assert sd.InputStream.call_count == 2
+        assert path.exists()
+        recorder.disarm()
+
+    def test_recording_cancels_idle_release(self, tether_home):
+        recorder = AudioRecorder()
+        with patch.object(
+            recorder, "_get_sounddevice", return_value=_fake_sounddevice()
+        ):
+            recorder.arm(preroll_seconds=0, idle_release=0.05)
+            timer = recorder._release_timer
+            recorder.start()
+            timer.join(1)
+
+            assert recorder.stream_open
+            recorder.stop()
+        recorder.disarm()
+
+    def test_auto_stop_after_silence(self, tether_home):
+        stopped = threading.Event()
+        recorder = AudioRecorder(auto_stop_seconds=0.05, on_auto_stop=stopped.set)
+        t = np.arange(160 * 4) / 16000
+        speech = (8000 * np.sin(2 * np.pi * 220 * t)).astype(np.int16)[:, None]
+        quiet = np.zeros((160 * 10, 1), dtype=np.int16)
+
+        path = self._record(recorder, np.split(np.concatenate([speech, quiet]), 14))
+
+        assert recorder.auto_stopped
+        assert stopped.wait(1)
+        # Audio after the 50 ms of silence that triggered it is not kept.
+        with wave.open(str(path), "rb") as wf:
+            assert wf.getnframes() == 160 * 4 + 800
+
+    def test_live_segment_covers_the_open_segment(self, tether_home):
+        segments = []
+        recorder = AudioRecorder(
+            segment_seconds=0.02, on_segment=lambda *args: segments.append(args)
+        )
+        assert recorder.live_segment() is None
+
+        with patch.object(
+            recorder, "_get_sounddevice", return_value=_fake_sounddevice()
+        ):
+            recorder.start()
+            for block in _blocks(3):
+                recorder._audio_callback(block, len(block), None, None)
+                recorder._drain()
+            index, samples, started_at = recorder.live_segment()
+            recorder.stop()
+
+        # The first 320 frames were cut as segment 0; block 2 is still open.
+        assert index == 1
+        assert samples.dtype == np.float32 and len(samples) == 160
+        np.testing.assert_array_equal(samples, segments[1][1])
+        assert started_at == segments[1][2]
+
+    def test_callback_never_takes_the_lock(self, tether_home):
+        recorder = AudioRecorder()
+        with patch.object(recorder, "_get_sounddevice") as mock_get_sd:
+            mock_get_sd.return_value = _fake_sounddevice()
+            recorder.start()
+            with recorder._lock:
+                # Would deadlock if the callback waited on stop()/the drain.
+                for block in _blocks(3):
+                    recorder._audio_callback(block, len(block), None, None)
+            path = recorder.stop()
+
+        with wave.open(str(path), "rb") as wf:
+            assert wf.getnframes() == 480
+
+    def test_overflow_drops_whole_blocks(self, tether_home):
+        recorder = AudioRecorder()
+        recorder.RING_SECONDS = 0.025
+        with patch.object(recorder, "_get_sounddevice") as mock_get_sd:
+            mock_get_sd.return_value = _fake_sounddevice()
+            recorder.start()
+            with recorder._lock:
+                # Ring holds 400 frames: the third 160-frame block is dropped.
+                for block in _blocks(3):
+                    recorder._audio_callback(block, len(block), None, None)
+            recorder.stop()
+
+        assert recorder.overflows == 160
+        assert len(recorder.get_audio()) == 320
+
+    def test_health_report_counts_xruns(self, tether_home):
+        recorder = AudioRecorder()
+        overflow = MagicMock(input_overflow=True, input_underflow=False)
+        with patch.object(recorder, "_get_sounddevice") as mock_get_sd:
+            mock_get_sd.return_value = _fake_sounddevice()
+            recorder.start()
+            for i, block in enumerate(_blocks(4)):
+                recorder._audio_callback(
+                    block, len(block), None, overflow if i else None
+                )
+                recorder._drain()
+            recorder.stop()
+
+        report = recorder.health_report()
+        assert report["callbacks"] == 4
+        assert report["input_overflows"] == 3
+        assert report["dropped_frames"] == 0
+        assert report["callback_us"]["count"] == 4
+        assert report["ring_high_water"] == 160
+        assert report["buffer_high_water_seconds"] == 0.04
+
+    def test_native_rate_device_is_resampled(self, tether_home):
+        recorder = AudioRecorder()
+        t = np.arange(48000) / 48000
+        tone = (8000 * np.sin(2 * np.pi * 440 * t)).astype(np.int16)
+        stereo = np.stack([tone, tone], axis=1)
+
+        with patch.object(recorder, "_get_sounddevice") as mock_get_sd:
+            sd = mock_get_sd.return_value = _fake_sounddevice(48000, 2)
+            recorder.start()
+            for start in range(0, len(stereo), 480):
+                block = stereo[start : start + 480]
+                recorder._audio_callback(block, len(block), None, None)
+                recorder._drain()
+            path = recorder.stop()
+
+        kwargs = sd.InputStream.call_args.kwargs
+        assert kwargs["samplerate"] == 48000 and kwargs["channels"] == 2
+        with wave.open(str(path), "rb") as wf:
+            assert wf.getframerate() == 16000
+            assert wf.getnchannels() == 1
+            assert wf.getnframes() == 16000
+
+    def test_audio_float_is_normalised_mono(self, tether_home):
+        recorder = AudioRecorder()
+        block = np.array([[-32768], [0], [16384]], dtype=np.int16)
+        self._record(recorder, [block])
+
+        samples = recorder.get_audio_float()
+
+        assert samples.dtype == np.float32 and samples.shape == (3,)
+        np.testing.assert_array_equal(samples, [-1.0, 0.0, 0.5])
+
+    def test_segments_cut_at_pauses_and_cover_the_session(self, tether_home):
+        segments = []
+        recorder = AudioRecorder(
+            segment_seconds=1.0,
+            on_segment=lambda *segment: segments.append(segment),
+        )
+        # 0.75 s of tone, 0.25 s of silence, repeated: every cut should land
+        # in a silent stretch.
+        t = np.arange(12000) / 16000
+        tone = (8000 * np.sin(2 * np.pi * 220 * t)).astype(np.int16)
+        period = np.concatenate([tone, np.zeros(4000, dtype=np.int16)])
+        session = np.tile(period, 5).reshape(-1, 1)
+
+        with patch.object(recorder, "_get_sounddevice") as mock_get_sd:
+            mock_get_sd.return_value = _fake_sounddevice()
+            recorder.start()
+            for start in range(0, len(session), 160):
+                block = session[start : start + 160]
+                recorder._audio_callback(block, len(block), None, None)
+                recorder._drain(flush=True)
+            path = recorder.stop()
+
+        assert recorder.segments == len(segments) >= 4
+        assert [index for index, _, _ in segments] == list(range(len(segments)))
+        assert sum(len(samples) for _, samples, _ in segments) == len(session)
+        for _, samples, _ in segments[:-1]:
+            assert np.abs(samples[-80:]).max() == 0
+
+        starts = [started_at for _, _, started_at in segments]
+        assert starts == sorted(starts)
+        assert starts[0] == recorder.started_at
+
+        # The file keeps the whole session; memory does not.
+        with wave.open(str(path), "rb") as wf:
+            assert wf.getnframes() == len(session)
+        assert recorder._base > 0
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from engine.audio.resample import PolyphaseResampler, design_filter
+
+
+def _tone(freq, rate, seconds=1.0, amplitude=10000):
+    t = np.arange(int(rate * seconds)) / rate
+    return (amplitude * np.sin(2 * np.pi * freq * t)).astype(np.int16).reshape(-1, 1)
+
+
+def _rms(samples):
+    return np.sqrt(np.mean(samples.astype(np.float64) ** 2))
+
+
+def _stream(resampler, samples, block):
+    return np.concatenate(
+        [
+            resampler.process(samples[i : i + block])
+            for i in range(0, len(samples), block)
+        ]
+    )
+
+
+class TestDesignFilter:
+    """Tests for the polyphase filter bank"""
+
+    def test_each_phase_has_unity_gain(self):
+        bank = design_filter(160, 441)
+        assert bank.shape[0] == 160
+        np.testing.assert_allclose(bank.sum(axis=1), 1.0, atol=0.02)
+
+
+class TestPolyphaseResampler:
+    """Tests for streaming resampling to 16 kHz"""
+
+    @pytest.mark.parametrize("rate", [48000, 44100, 22050, 8000])
+    def test_output_length_matches_ratio(self, rate):
+        resampler = PolyphaseResampler(rate, 16000)
+        out = _stream(resampler, _tone(440, rate), rate // 100)
+        assert out.shape == (16000, 1)
+        assert out.dtype == np.int16
+
+    @pytest.mark.parametrize("rate", [48000, 44100])
+    def test_passes_speech_band_and_rejects_aliases(self, rate):
+        speech = PolyphaseResampler(rate, 16000).process(_tone(1000, rate))
+        alias = PolyphaseResampler(rate, 16000).process(_tone(12000, rate))
+
+        assert _rms(speech[500:]) == pytest.approx(_rms(_tone(1000, 16000)), rel=0.01)
+        assert _rms(alias[500:]) < 0.01 * _rms(_tone(1000, 16000))
+
+    def test_block_size_does_not_change_output(self):
+        samples = _tone(440, 44100)
+        whole = PolyphaseResampler(44100, 16000).process(samples)
+        blocks = _stream(PolyphaseResampler(44100, 16000), samples, 441)
+        np.testing.assert_array_equal(whole, blocks)
+
+    def test_stereo_is_downmixed(self):
+        left = _tone(440, 48000)
+        stereo = np.hstack([left, np.zeros_like(left)])
+
+        out = PolyphaseResampler(48000, 16000, channels=2).process(stereo)
+
+        assert out.shape[1] == 1
+        assert _rms(out[500:]) == pytest.approx(_rms(left) / 2, rel=0.02)
+
+    def test_same_rate_is_passthrough(self):
+        samples = _tone(440, 16000)
+        resampler = PolyphaseResampler(16000, 16000)
+        assert resampler.passthrough
+        assert resampler.process(samples) is samples
@@ -0,0 +1,471 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from engine.server import EngineClient, EngineDaemon, RpcServer, WorkerPools
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+class TestEngineDaemon:
+    """Tests for EngineDaemon request dispatch"""
+
+    def test_ping(self):
+        daemon = EngineDaemon()
+        response = daemon.handle({"id": 1, "cmd": "ping"})
+
+        assert response["id"] == 1
+        assert response["ok"] is True
+        assert response["result"]["pid"] == os.getpid()
+
+    def test_unknown_command(self):
+        daemon = EngineDaemon()
+        response = daemon.handle({"id": 2, "cmd": "nope"})
+
+        assert response["ok"] is False
+        assert "Unknown command" in response["error"]
+
+    def test_bad_arguments_return_error(self):
+        daemon = EngineDaemon()
+        response = daemon.handle({"id": 3, "cmd": "ask", "args": {"wrong": 1}})
+
+        assert response["ok"] is False
+
+    def test_shutdown_stops_running(self):
+        daemon = EngineDaemon()
+        daemon.handle({"id": 4, "cmd": "shutdown"})
+
+        assert not daemon.running
+
+    def test_unload_model_drops_transcriber(self):
+        daemon = EngineDaemon()
+        transcriber = MagicMock()
+        daemon._transcriber = transcriber
+
+        response = daemon.handle({"id": 5, "cmd": "unload_model"})
+
+        assert response["ok"] is True
+        transcriber.unload.assert_called_once()
+        assert daemon._transcriber is None
+
+    def test_preroll_recorder_is_reused(self, tether_home):
+        with patch("engine.server.daemon.AudioRecorder") as mock_recorder:
+            daemon = EngineDaemon(preroll=2.0)
+            armed = mock_recorder.return_value
+            armed.arm.assert_called_once_with(2.0, idle_release=None)
+
+            armed.is_recording.return_value = False
+            daemon.handle({"id": 8, "cmd": "spool_start"})
+
+        assert daemon._recorder is armed
+        assert mock_recorder.call_count == 1
+        daemon.close()
+        armed.disarm.assert_called_once()
+
+    def test_warm_stream_without_preroll(self, tether_home):
+        with patch("engine.server.daemon.AudioRecorder") as mock_recorder:
+            armed = mock_recorder.return_value
+            armed.health_report.return_value = None
+            armed.stream_open = True
+            daemon = EngineDaemon(warm_stream=True, idle_release=30.0)
+
+        armed.arm.assert_called_once_with(0.0, idle_release=30.0)
+        status = daemon.handle({"id": 12, "cmd": "status"})["result"]
+        assert status["preroll_armed"] is False
+        assert status["stream_open"] is True
+        daemon.close()
+
+    def test_auto_stop_finishes_and_reports(self, tether_home):
+        events = []
+        daemon = EngineDaemon(emit=events.append)
+        with patch("engine.server.daemon.AudioRecorder") as mock_recorder:
+            recorder = mock_recorder.return_value
+            recorder.is_recording.return_value = False
+            recorder.stop.return_value = None
+            recorder.health_report.return_value = None
+            daemon.handle(
+                {"id": 13, "cmd": "spool_start", "args": {"auto_stop_seconds": 5}}
+            )
+
+        assert recorder.auto_stop_seconds == 5
+        recorder.is_recording.return_value = True
+        recorder.on_auto_stop()
+
+        recorder.stop.assert_called_once()
+        assert daemon._recorder is None
+        assert events[-1]["event"] == "recording-auto-stopped"
+        assert events[-1]["id"] == 13
+        # A second trigger, or one after a manual stop, does nothing.
+        recorder.on_auto_stop()
+        recorder.stop.assert_called_once()
+
+    def test_stream_uses_a_captioning_pipeline(self, tether_home):
+        from engine.stt.streaming import WINDOW_SECONDS, StreamingPipeline
+
+        daemon = EngineDaemon()
+        daemon._transcriber = MagicMock()
+        with patch("engine.server.daemon.AudioRecorder") as mock_recorder:
+            recorder = mock_recorder.return_value
+            recorder.is_recording.return_value = False
+            recorder.live_segment.return_value = None
+            daemon.handle({"id": 14, "cmd": "spool_start", "args": {"stream": True}})
+
+        assert isinstance(daemon._pipeline, StreamingPipeline)
+        assert recorder.segment_seconds == WINDOW_SECONDS
+        assert recorder.on_segment == daemon._pipeline.submit
+        daemon._pipeline.close()
+
+    def test_segmented_start_loads_transcriber_without_deadlock(self, tether_home):
+        from engine.stt.pipeline import SegmentPipeline
+
+        daemon = EngineDaemon()
+        responses = []
+        with patch("engine.server.daemon.AudioRecorder") as mock_recorder:
+            recorder = mock_recorder.return_value
+            recorder.is_recording.return_value = False
+            request = {"id": 15, "cmd": "spool_start", "args": {"segment_seconds": 30}}
+            # The transcriber is created on first use under the daemon lock.
+            handler = threading.Thread(
+                target=lambda: responses.append(daemon.handle(request)), daemon=True
+            )
+            handler.start()
+            handler.join(timeout=5)
+
+        assert not handler.is_alive(), "spool_start deadlocked"
+        assert responses[0]["ok"] is True
+        assert isinstance(daemon._pipeline, SegmentPipeline)
+        assert recorder.segment_seconds == 30
+        assert recorder.on_segment == daemon._pipeline.submit
+        daemon._pipeline.close()
+
+    def test_spool_stop_does_not_wait_behind_transcription(self, tether_home):
+        pools = WorkerPools()
+        daemon = EngineDaemon(pools=pools)
+        recorder = MagicMock()
+        recorder.is_recording.return_value = True
+        recorder.stop.return_value = tether_home / "take.wav"
+        recorder.health_report.return_value = None
+        daemon._recorder = recorder
+
+        busy = threading.Event()
+        pools.submit("spool_transcribe", busy.wait, 10)
+        responses = []
+        with patch("engine.server.daemon.cmd_spool_transcribe", return_value="hi"):
+            future = daemon.submit(
+                {"id": 16, "cmd": "spool_stop", "args": {"transcribe": True}},
+                responses.append,
+            )
+            # The microphone stops while the STT pool is still busy ...
+            for _ in range(100):
+                if recorder.stop.called:
+                    break
+                threading.Event().wait(0.02)
+            recorder.stop.assert_called_once()
+            assert [r.get("event") for r in responses] == ["recording-stopped"]
+
+            # ... and the transcription runs once it is free.
+            busy.set()
+            future.result(timeout=5)
+
+        assert responses[-1]["result"]["text"] == "hi"
+        pools.shutdown()
+
+    def test_preroll_without_mic_falls_back(self):
+        with patch("engine.server.daemon.AudioRecorder") as mock_recorder:
+            mock_recorder.return_value.arm.side_effect = OSError("no device")
+            daemon = EngineDaemon(preroll=2.0)
+
+        status = daemon.handle({"id": 9, "cmd": "status"})["result"]
+        assert status["preroll_armed"] is False
+
+    def test_spool_stop_transcribes_from_memory(self, tether_home):
+        daemon = EngineDaemon()
+        recorder = daemon._recorder = MagicMock()
+        recorder.stop.return_value = tether_home / "clip.wav"
+        recorder.health_report.return_value = {"input_overflows": 0}
+        samples = recorder.get_audio_float.return_value
+
+        with patch("engine.server.daemon.cmd_spool_transcribe") as mock_cmd:
+            mock_cmd.return_value = "hi"
+            response = daemon.handle(
+                {"id": 10, "cmd": "spool_stop", "args": {"transcribe": True}}
+            )
+
+        assert response["result"]["text"] == "hi"
+        assert mock_cmd.call_args.args[0] == str(tether_home / "clip.wav")
+        assert mock_cmd.call_args.kwargs["audio"] is samples
+        metrics = daemon.handle({"id": 11, "cmd": "status"})["result"]["metrics"]
+        assert metrics["recorder"] == {"input_overflows": 0}
+
+    def test_transcriber_is_reused(self):
+        daemon = EngineDaemon()
+        with patch("engine.server.daemon.cmd_spool_transcribe") as mock_cmd:
+            mock_cmd.return_value = "hello"
+            daemon.handle(
+                {"id": 5, "cmd": "spool_transcribe", "args": {"audio_path": "a.wav"}}
+            )
+            daemon.handle(
+                {"id": 6, "cmd": "spool_transcribe", "args": {"audio_path": "b.wav"}}
+            )
+
+        first = mock_cmd.call_args_list[0].kwargs["transcriber"]
+        second = mock_cmd.call_args_list[1].kwargs["transcriber"]
+        assert first is second
+
+    def test_stt_workers_share_one_model(self):
+        daemon = EngineDaemon(stt_workers=3)
+        with patch("engine.server.daemon.create_transcriber") as create:
+            daemon.transcriber()
+        create.assert_called_once_with(None, None, 3)
+
+        stats = daemon.handle({"id": 9, "cmd": "pool_stats"})["result"]
+        assert stats["stt_model"]["workers"] == 3
+        assert stats["stt_model"]["process"]["pid"] == os.getpid()
+
+    def test_transcription_emits_event(self):
+        events = []
+        daemon = EngineDaemon(emit=events.append)
+        with patch("engine.server.daemon.cmd_spool_transcribe", return_value="hi"):
+            daemon.handle(
+                {"id": 7, "cmd": "spool_transcribe", "args": {"audio_path": "a.wav"}}
+            )
+
+        assert events == [{"event": "transcription", "id": 7, "data": {"text": "hi"}}]
+
+
+class TestServeStdio:
+    """Tests for python -m engine --serve"""
+
+    def test_serve_round_trip(self, tmp_path):
+        env = {**os.environ, "HOME": str(tmp_path), "USERPROFILE": str(tmp_path)}
+        requests = "\n".join(
+            [
+                json.dumps({"id": 1, "cmd": "ping"}),
+                "not json",
+                json.dumps({"id": 2, "cmd": "shutdown"}),
+            ]
+        )
+        result = subprocess.run(
+            [sys.executable, "-m", "engine", "--serve"],
+            input=requests + "\n",
+            capture_output=True,
+            text=True,
+            cwd=PROJECT_ROOT,
+            env=env,
+            timeout=30,
+        )
+
+        assert result.returncode == 0, result.stderr
+        messages = [json.loads(line) for line in result.stdout.splitlines()]
+        ready = messages[0]
+        responses = {m["id"]: m for m in messages[1:]}
+
+        assert ready["event"] == "ready"
+        assert responses[1] == {
+            "id": 1,
+            "ok": True,
+            "result": {"pid": ready["data"]["pid"]},
+        }
+        assert responses[None]["ok"] is False
+        assert responses[2]["result"] == {"shutdown": True}
+
+
+class TestWorkerPools:
+    """Tests for per-workload worker pools"""
+
+    def test_commands_map_to_workloads(self):
+        pools = WorkerPools()
+        try:
+            assert pools.workload("spool_transcribe") == "stt"
+            assert pools.workload("spool_stop") == "io"
+            assert pools.workload("ask") == "llm"
+            assert pools.workload("check_mic") == "io"
+        finally:
+            pools.shutdown()
+
+    def test_stats_report_sizes(self):
+        pools = WorkerPools({"stt": 3})
+        try:
+            stats = pools.stats()
+            assert stats["stt"] == {"workers": 3, "pending": 0}
+            assert stats["llm"]["workers"] == 2
+        finally:
+            pools.shutdown()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets only")
+class TestRpcServer:
+    """Tests for the local socket server and client shim"""
+
+    @pytest.fixture
+    def server(self, tether_home):
+        server = RpcServer(address="unix:" + str(tether_home / "engine.sock"))
+        server.start()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.stop()
+        thread.join(timeout=5)
+
+    def test_client_round_trip(self, server):
+        with EngineClient(server.address) as client:
+            assert client.request("ping")["pid"] == os.getpid()
+
+    def test_address_is_advertised(self, server):
+        with EngineClient() as client:
+            assert "pid" in client.request("ping")
+
+    def test_error_raises(self, server):
+        with EngineClient(server.address) as client:
+            with pytest.raises(RuntimeError):
+                client.request("nope")
+
+    def test_ask_runs_while_weave_in_flight(self, server):
+        ask_done = threading.Event()
+
+        def slow_weave(llm=None):
+            assert ask_done.wait(timeout=5), "ask was blocked behind weave"
+            return {"projects": [], "people": [], "ideas": []}
+
+        def quick_ask(query, llm=None, vault_cache=None):
+            ask_done.set()
+            return "answer"
+
+        results = {}
+
+        def run_weave():
+            with EngineClient(server.address) as client:
+                results["weave"] = client.request("weave")
+
+        with (
+            patch("engine.server.daemon.cmd_weave", slow_weave),
+            patch("engine.server.daemon.cmd_ask", quick_ask),
+        ):
+            weave_thread = threading.Thread(target=run_weave)
+            weave_thread.start()
+            with EngineClient(server.address) as client:
+                results["ask"] = client.request("ask", query="status")
+            weave_thread.join(timeout=10)
+
+        assert results["ask"] == "answer"
+        assert results["weave"]["projects"] == []
+
+    def test_client_flag_uses_server(self, server, tmp_path):
+        env = {**os.environ, "HOME": str(tmp_path)}
+        result = subprocess.run(
+            [sys.executable, "-m", "engine", "--client", "--check-ollama"],
+            capture_output=True,
+            text=True,
+            cwd=PROJECT_ROOT,
+            env=env,
+            timeout=30,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert "running locally" not in result.stderr
+        assert json.loads(result.stdout)["model"] == "granite4:3b"
+
+
+class TestTcpToken:
+    """Tests for the token a loopback TCP server requires"""
+
+    @pytest.fixture
+    def server(self, tether_home):
+        server = RpcServer(address="tcp:127.0.0.1:0")
+        server.start()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.stop()
+        thread.join(timeout=5)
+
+    def test_advertised_token_is_accepted(self, server):
+        with EngineClient() as client:
+            assert client.request("ping")["pid"] == os.getpid()
+
+    def test_missing_or_wrong_token_is_rejected(self, server):
+        from engine.server.rpc import open_connection
+
+        requests = [
+            {"id": 1, "cmd": "ping"},
+            {"id": 2, "cmd": "ping", "token": "0"},
+            # Valid JSON that is not a request at all.
+            [1, 2],
+            "ping",
+        ]
+        with open_connection(server.address, timeout=5) as sock:
+            reader = sock.makefile("r", encoding="utf-8")
+            for request in requests:
+                sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+                response = json.loads(reader.readline())
+                assert response == {
+                    "id": request["id"] if isinstance(request, dict) else None,
+                    "ok": False,
+                    "error": "Unauthorized",
+                }
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+    def test_address_file_is_private(self, server):
+        from engine.server.rpc import get_address_file_path, read_server_token
+
+        assert get_address_file_path().stat().st_mode & 0o777 == 0o600
+        assert read_server_token() == server.token
+
+
+class TestConcurrentStatus:
+    """Tests for tracking several in-flight tasks in engine_status.json"""
+
+    def test_finishing_one_task_keeps_the_other(self, tether_home):
+        from engine.utils import status
+
+        status.write_status("busy", "weave", 1)
+        status.write_status("busy", "ask", 1)
+        status.mark_idle("ask")
+
+        data = status.read_status()
+        assert data["status"] == "busy"
+        assert data["task"] == "weave"
+        assert [t["task"] for t in data["tasks"]] == ["weave"]
+
+        status.mark_idle("weave")
+        data = status.read_status()
+        assert data["status"] == "idle"
+        assert data["task"] is None
+        assert data["tasks"] == []
+
+    def test_same_command_twice_stays_busy(self, tether_home):
+        from engine.utils import status
+
+        started = threading.Barrier(3)
+
+        def ask(finish):
+            status.write_status("busy", "ask", 1)
+            started.wait()
+            finish.wait()
+            status.mark_idle()
+
+        finishes = [threading.Event(), threading.Event()]
+        threads = [threading.Thread(target=ask, args=(f,)) for f in finishes]
+        for thread in threads:
+            thread.start()
+        started.wait()
+        assert len(status.read_status()["tasks"]) == 2
+
+        # The first to finish must not take the other's entry with it.
+        finishes[0].set()
+        threads[0].join()
+        data = status.read_status()
+        assert data["status"] == "busy"
+        assert data["task"] == "ask"
+        assert len(data["tasks"]) == 1
+
+        finishes[1].set()
+        threads[1].join()
+        assert status.read_status()["status"] == "idle"
@@ -0,0 +1,185 @@
+import subprocess
+import sys
+import textwrap
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from engine.audio.shm import MAX_MARKERS, RingPublisher, SharedAudioRing
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def ring():
+    ring = SharedAudioRing.create(name=f"tether-test-{id(object())}", seconds=1)
+    yield ring
+    ring.close()
+
+
+class TestSharedAudioRing:
+    """Tests for the shared-memory segment transport"""
+
+    def test_reader_sees_segments_as_views(self, ring):
+        reader = SharedAudioRing.attach(ring.name)
+        started = datetime(2026, 1, 5, 9, 0, 0)
+        samples = np.linspace(-1, 1, 4000, dtype=np.float32)
+
+        assert ring.publish(0, samples, started)
+        view, started_at = reader.next_segment()
+
+        np.testing.assert_array_equal(view, samples)
+        assert view.base is not None and not view.flags.owndata
+        assert started_at == started
+        reader.ack()
+        assert reader.pending() == 0
+        reader.close()
+
+    def test_segments_never_wrap(self, ring):
+        reader = SharedAudioRing.attach(ring.name)
+        now = datetime.now()
+
+        for index in range(3):
+            # 6000 + 6000 fills most of 16000; the third would straddle the end.
+            assert ring.publish(index, np.full(6000, index, np.float32), now)
+            view, _ = reader.next_segment()
+            assert len(view) == 6000 and view[0] == index
+            reader.ack()
+        reader.close()
+
+    def test_full_ring_drops_instead_of_overwriting(self, ring):
+        now = datetime.now()
+        assert ring.publish(0, np.zeros(10000, np.float32), now)
+        assert not ring.publish(1, np.zeros(10000, np.float32), now)
+        assert ring.pending() == 1
+
+    def test_marker_table_limit(self, ring):
+        now = datetime.now()
+        for index in range(MAX_MARKERS):
+            assert ring.publish(index, np.zeros(10, np.float32), now)
+        assert not ring.publish(MAX_MARKERS, np.zeros(10, np.float32), now)
+
+    def test_segments_end_when_stream_closes(self, ring):
+        reader = SharedAudioRing.attach(ring.name)
+        now = datetime.now()
+        ring.publish(0, np.ones(100, np.float32), now)
+        ring.publish(1, np.ones(200, np.float32), now + timedelta(seconds=5))
+        ring.close_stream()
+
+        lengths = [len(samples) for samples, _ in reader.segments()]
+
+        assert lengths == [100, 200]
+        assert ring.wait_drained(timeout=1)
+        reader.close()
+
+    def test_other_process_reads_without_freeing(self, ring):
+        ring.publish(0, np.arange(50, dtype=np.float32), datetime.now())
+        ring.close_stream()
+        script = textwrap.dedent(f"""
+            from engine.audio.shm import SharedAudioRing
+            reader = SharedAudioRing.attach({ring.name!r})
+            print(sum(float(s.sum()) for s, _ in reader.segments()))
+            reader.close()
+            """)
+
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+
+        assert result.stdout.strip() == str(float(sum(range(50))))
+        # Still attached after the reader exited.
+        assert SharedAudioRing.attach(ring.name).pending() == 0
+
+
+class TestRingPublisher:
+    """Tests for publishing without dropping audio"""
+
+    def test_long_take_is_cut_into_pieces(self, ring):
+        reader = SharedAudioRing.attach(ring.name)
+        publisher = RingPublisher(ring)
+        started = datetime(2026, 1, 5, 9, 0, 0)
+        take = np.arange(40000, dtype=np.float32)
+
+        # 2.5 s into a 1 s ring: 0.5 s pieces, the reader making room.
+        publisher.publish(0, take, started)
+        pieces = []
+        while publisher.backlog or reader.pending():
+            samples, started_at = reader.next_segment()
+            pieces.append((samples.copy(), started_at))
+            reader.ack()
+            publisher.flush(timeout=0)
+
+        np.testing.assert_array_equal(np.concatenate([p for p, _ in pieces]), take)
+        assert [len(p) for p, _ in pieces] == [8000] * 5
+        assert pieces[1][1] == started + timedelta(seconds=0.5)
+        reader.close()
+
+    def test_segments_wait_for_a_slow_reader(self, ring):
+        reader = SharedAudioRing.attach(ring.name)
+        publisher = RingPublisher(ring)
+        now = datetime.now()
+
+        assert publisher.publish(0, np.zeros(6000, np.float32), now)
+        assert publisher.publish(1, np.ones(6000, np.float32), now)
+        # No room until the reader acknowledges: kept back, not dropped.
+        assert not publisher.publish(2, np.full(6000, 2, np.float32), now)
+        assert publisher.backlog == 1
+
+        reader.ack()
+        assert publisher.flush(timeout=1)
+        values = []
+        while reader.pending():
+            values.append(reader.next_segment()[0][0])
+            reader.ack()
+        assert values == [1, 2]
+        reader.close()
+
+    def test_flush_times_out_without_a_reader(self, ring):
+        publisher = RingPublisher(ring)
+        now = datetime.now()
+        for index in range(3):
+            publisher.publish(index, np.zeros(6000, np.float32), now)
+
+        assert not publisher.flush(timeout=0.1)
+        assert publisher.backlog == 1
+
+
+class TestSpoolTranscribeShm:
+    """Tests for --spool-transcribe-shm"""
+
+    def test_transcribes_each_segment_into_the_spool(self, ring, tether_home, capsys):
+        from engine.main import cmd_spool_transcribe_shm
+
+        tone = 0.3 * np.sin(np.linspace(0, 2000 * np.pi, 8000, dtype=np.float32))
+        started = datetime(2026, 1, 5, 9, 0, 0)
+        ring.publish(0, tone, started)
+        ring.publish(1, tone, started + timedelta(seconds=30))
+        ring.close_stream()
+
+        transcriber = MagicMock()
+        transcriber.transcribe.side_effect = ["first", "second"]
+
+        text = cmd_spool_transcribe_shm(ring.name, transcriber)
+
+        assert text == "first second"
+        assert all(
+            isinstance(call.args[0], np.ndarray)
+            for call in transcriber.transcribe.call_args_list
+        )
+        spooled = (tether_home / ".tether" / "spools").glob("*.md")
+        content = "".join(path.read_text() for path in spooled)
+        assert "first" in content and "second" in content
+        assert "TRANSCRIPTION:first second" in capsys.readouterr().out
+
+    def test_missing_ring(self, capsys):
+        from engine.main import cmd_spool_transcribe_shm
+
+        assert cmd_spool_transcribe_shm("tether-no-such-ring") is None
+        assert "Cannot open shared audio" in capsys.readouterr().out
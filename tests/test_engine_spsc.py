@@ -0,0 +1,63 @@
+import threading
+
+import numpy as np
+
+from engine.audio.spsc import SpscRing
+
+
+def _drain(ring):
+    parts = ring.peek()
+    frames = np.concatenate(parts) if parts else np.zeros((0, 1), dtype=np.int16)
+    ring.advance(len(frames))
+    return frames
+
+
+class TestSpscRing:
+    """Tests for the callback's lock-free ring"""
+
+    def test_push_and_peek_in_order(self):
+        ring = SpscRing(1000)
+        ring.push(np.full((100, 1), 1, dtype=np.int16))
+        ring.push(np.full((50, 1), 2, dtype=np.int16))
+
+        frames = _drain(ring).ravel()
+        assert len(frames) == 150
+        assert frames[0] == 1 and frames[-1] == 2
+        assert len(ring) == 0
+
+    def test_wraps_around(self):
+        ring = SpscRing(100)
+        ring.push(np.zeros((80, 1), dtype=np.int16))
+        _drain(ring)
+        block = np.arange(50, dtype=np.int16).reshape(-1, 1)
+        ring.push(block)
+
+        parts = ring.peek()
+        assert len(parts) == 2
+        np.testing.assert_array_equal(np.concatenate(parts), block)
+
+    def test_full_ring_drops_block(self):
+        ring = SpscRing(100)
+        assert ring.push(np.zeros((80, 1), dtype=np.int16))
+        assert not ring.push(np.zeros((40, 1), dtype=np.int16))
+        assert ring.dropped == 40
+        assert len(ring) == 80
+
+    def test_concurrent_producer_and_consumer(self):
+        ring = SpscRing(1024)
+        blocks = [np.full((64, 1), i, dtype=np.int16) for i in range(500)]
+        received = []
+
+        def produce():
+            for block in blocks:
+                while not ring.push(block):
+                    pass
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        while producer.is_alive() or len(ring):
+            received.append(_drain(ring))
+        producer.join()
+
+        data = np.concatenate(received).ravel()
+        np.testing.assert_array_equal(data, np.concatenate(blocks).ravel())
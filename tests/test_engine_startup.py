@@ -0,0 +1,126 @@
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from engine.utils.import_profile import parse_importtime, summarize_imports
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Import time attributable to engine.main and everything it imports eagerly.
+# Commands that need heavy dependencies import them when they run.
+CHECK_MIC_IMPORT_BUDGET_MS = 100
+
+# Wall time for the whole --check-mic process, interpreter start included.
+# About 0.1 s without a microphone; the ceiling leaves room for slow CI
+# machines and a real device probe.
+CHECK_MIC_WALL_BUDGET_S = 2.0
+
+
+def _importtime(*args):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "engine", *args],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+        timeout=60,
+    )
+    return parse_importtime(result.stderr)
+
+
+class TestImportProfileParsing:
+    """Tests for parsing -X importtime output"""
+
+    def test_parse_entries_and_depth(self):
+        output = "\n".join(
+            [
+                "import time: self [us] | cumulative | imported package",
+                "import time:       100 |        100 |     engine.utils.status",
+                "import time:        50 |        150 |   engine.utils",
+                "import time:       300 |        450 | engine.main",
+            ]
+        )
+
+        entries = parse_importtime(output)
+
+        assert [e["module"] for e in entries] == [
+            "engine.utils.status",
+            "engine.utils",
+            "engine.main",
+        ]
+        assert [e["depth"] for e in entries] == [2, 1, 0]
+
+        summary = summarize_imports(entries)
+        assert summary["total_ms"] == 0.45
+        assert summary["top"] == [{"module": "engine.main", "cumulative_ms": 0.45}]
+
+
+class TestStartupBudget:
+    """Tests that short commands stay cheap to start"""
+
+    def test_check_mic_skips_heavy_imports(self):
+        imported = {e["module"] for e in _importtime("--check-mic")}
+
+        assert "httpx" not in imported
+        assert "faster_whisper" not in imported
+        assert "engine.server" not in imported
+        assert "engine.ai.ollama_client" not in imported
+
+    def test_check_mic_import_budget(self):
+        entries = _importtime("--check-mic")
+        engine_main = next(e for e in entries if e["module"] == "engine.main")
+
+        assert engine_main["cumulative_us"] / 1000 < CHECK_MIC_IMPORT_BUDGET_MS
+
+    def test_check_mic_wall_time(self, tmp_path):
+        env = {**os.environ, "HOME": str(tmp_path), "USERPROFILE": str(tmp_path)}
+        started = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-m", "engine", "--check-mic"],
+            capture_output=True,
+            text=True,
+            cwd=PROJECT_ROOT,
+            env=env,
+            timeout=60,
+        )
+        elapsed = time.perf_counter() - started
+
+        assert result.returncode == 0, result.stderr
+        assert "available" in json.loads(result.stdout)
+        assert elapsed < CHECK_MIC_WALL_BUDGET_S
+
+    def test_client_skips_the_daemon(self):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import engine.server.client"],
+            capture_output=True,
+            text=True,
+            cwd=PROJECT_ROOT,
+            timeout=60,
+        )
+        imported = {e["module"] for e in parse_importtime(result.stderr)}
+
+        assert "engine.server.client" in imported
+        assert "engine.server.daemon" not in imported
+        assert "engine.main" not in imported
+
+    def test_help_skips_heavy_imports(self):
+        imported = {e["module"] for e in _importtime("--help")}
+
+        assert "httpx" not in imported
+        assert "engine.audio" not in imported
+
+    def test_import_profile_flag(self):
+        result = subprocess.run(
+            [sys.executable, "-m", "engine", "--import-profile", "--check-mic"],
+            capture_output=True,
+            text=True,
+            cwd=PROJECT_ROOT,
+            timeout=60,
+        )
+
+        report = json.loads(result.stdout)
+        assert report["command"] == ["--check-mic"]
+        assert report["returncode"] == 0
+        assert report["modules"] > 0
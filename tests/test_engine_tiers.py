@@ -0,0 +1,184 @@
+import json
+import wave
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from engine.stt.tiers import (
+    MIN_BUDGET_SECONDS,
+    TieredTranscriber,
+    audio_seconds,
+    create_transcriber,
+)
+from engine.stt.transcriber import Transcriber
+
+TIERS = ("tiny.en", "base.en", "small.en")
+
+
+def _tiered(load=0.0, loaded=TIERS, target_rtf=0.5):
+    tiered = TieredTranscriber(TIERS, target_rtf=target_rtf, load=lambda: load)
+    for tier, transcriber in tiered._transcribers.items():
+        if tier in loaded:
+            # Loaded models skip the load-time estimate.
+            transcriber._model = MagicMock()
+        transcriber.transcribe_segments = MagicMock(
+            return_value={"text": f"from {tier}", "segments": []}
+        )
+    return tiered
+
+
+class TestChooseTier:
+    """Tests for picking a model tier"""
+
+    def test_long_clip_on_idle_cpu_gets_largest_tier(self):
+        choice = _tiered().choose(600.0)
+
+        assert choice["model"] == "small.en"
+        assert choice["budget_seconds"] == 300.0
+        assert "within the 300.0s budget" in choice["reason"]
+
+    def test_cpu_load_steps_down_a_tier(self):
+        # small.en: 600 s x 0.25 x (1 + 1.5) = 375 s, over the 300 s budget.
+        choice = _tiered(load=1.5).choose(600.0)
+
+        assert choice["model"] == "base.en"
+        assert choice["reason"].startswith("small.en would take 375.0s")
+        assert "CPU load 1.50" in choice["reason"]
+
+    def test_tight_target_uses_smaller_tier(self):
+        assert _tiered(target_rtf=0.1).choose(600.0)["model"] == "base.en"
+        assert _tiered(target_rtf=0.05).choose(600.0)["model"] == "tiny.en"
+
+    def test_short_note_counts_model_load(self):
+        # 3 s of audio gets the 2 s floor; loading small.en alone takes 1.5 s.
+        choice = _tiered(loaded=("tiny.en",)).choose(3.0)
+
+        assert choice["budget_seconds"] == MIN_BUDGET_SECONDS
+        assert choice["model"] == "base.en"
+        assert choice["predicted_seconds"]["small.en"] > MIN_BUDGET_SECONDS
+
+    def test_nothing_fits_uses_fastest(self):
+        choice = _tiered(load=20.0).choose(600.0)
+
+        assert choice["model"] == "tiny.en"
+        assert choice["reason"].startswith("no tier fits")
+
+    def test_unknown_duration_uses_largest(self):
+        choice = _tiered().choose(None)
+
+        assert choice["model"] == "small.en"
+        assert "duration unknown" in choice["reason"]
+
+
+class TestTieredTranscriber:
+    """Tests for transcribing with the chosen tier"""
+
+    def test_transcribes_with_chosen_tier_and_records_it(self, tether_home):
+        tiered = _tiered(target_rtf=0.05)
+        audio = np.zeros(16000 * 600, dtype=np.float32)
+
+        assert tiered.transcribe(audio) == "from tiny.en"
+        assert tiered.last_choice["model"] == "tiny.en"
+        assert "elapsed_seconds" in tiered.last_choice
+
+        status = json.loads(
+            (tether_home / ".tether" / "engine_status.json").read_text()
+        )
+        assert status["metrics"]["stt_tier"]["model"] == "tiny.en"
+
+    def test_segments_name_the_model(self, tether_home):
+        result = _tiered().transcribe_segments(np.zeros(16000, dtype=np.float32))
+
+        assert result["model"] == "small.en"
+
+    def test_timings_update_the_estimate(self, tether_home):
+        tiered = _tiered()
+        before = tiered.rtf["small.en"]
+        with patch("engine.stt.tiers.time.perf_counter", side_effect=[0.0, 60.0]):
+            tiered.transcribe(np.zeros(16000 * 100, dtype=np.float32))
+
+        # 60 s for 100 s of audio is an RTF of 0.6, pulling the estimate up.
+        assert before < tiered.rtf["small.en"] < 0.6
+
+    def test_metrics_only_on_tier_change(self, tether_home):
+        tiered = _tiered()
+        audio = np.zeros(16000, dtype=np.float32)
+        with patch("engine.utils.status.write_metrics") as write_metrics:
+            tiered.transcribe(audio)
+            tiered.transcribe(audio)
+            tiered.target_rtf = 0.0
+            tiered._cpu_load = lambda: 20.0
+            tiered.transcribe(np.zeros(16000 * 600, dtype=np.float32))
+
+        assert [c.args[1]["model"] for c in write_metrics.call_args_list] == [
+            "small.en",
+            "tiny.en",
+        ]
+
+    def test_cache_settings_per_tier(self):
+        models = [settings["model"] for settings in _tiered().cache_settings]
+        assert models == ["small.en", "base.en", "tiny.en"]
+
+    def test_pickles_for_spawned_workers(self):
+        import pickle
+
+        from engine.stt.tiers import cpu_load
+
+        tiered = TieredTranscriber(TIERS, target_rtf=0.3, load=lambda: 1.0)
+        copy = pickle.loads(pickle.dumps(tiered))
+
+        assert copy.tiers == TIERS and copy.target_rtf == 0.3
+        assert copy._cpu_load is cpu_load
+        with copy._lock:
+            pass
+        assert tiered._cpu_load() == 1.0
+
+    def test_tiers_share_the_model_registry(self):
+        tiered = TieredTranscriber(TIERS)
+
+        assert all(
+            type(t) is Transcriber and t.model_size == tier
+            for tier, t in tiered._transcribers.items()
+        )
+        assert not tiered.is_loaded
+
+
+class TestHelpers:
+    """Tests for the tier helpers"""
+
+    def test_create_transcriber(self):
+        assert type(create_transcriber()) is Transcriber
+        tiered = create_transcriber(["tiny.en", "small.en"], 0.3)
+        assert tiered.tiers == ("tiny.en", "small.en")
+        assert tiered.target_rtf == 0.3
+
+    def test_audio_seconds(self, tmp_path):
+        path = tmp_path / "clip.wav"
+        with wave.open(str(path), "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(16000)
+            wf.writeframes(bytes(2 * 8000))
+
+        assert audio_seconds(path) == 0.5
+        assert audio_seconds(np.zeros(32000)) == 2.0
+        assert audio_seconds(tmp_path / "missing.flac") is None
+
+    def test_cpu_load_on_windows(self, monkeypatch):
+        from engine.stt import tiers
+
+        monkeypatch.delattr(tiers.os, "getloadavg", raising=False)
+        monkeypatch.setattr(tiers.sys, "platform", "win32")
+        monkeypatch.setattr(tiers, "_windows_cpu_busy", lambda: 0.75)
+
+        assert tiers.cpu_load() == 0.75
+
+    def test_model_tiers_flag(self):
+        from engine.main import build_parser
+
+        args = build_parser().parse_args(
+            ["--serve", "--model-tiers", "tiny.en,small.en", "--target-rtf", "0.3"]
+        )
+
+        assert args.model_tiers == ["tiny.en", "small.en"]
+        assert args.target_rtf == 0.3
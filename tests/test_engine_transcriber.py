@@ -0,0 +1,113 @@
+import gc
+import sys
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from engine.stt import transcriber as stt
+from engine.stt.transcriber import (
+    Transcriber,
+    acquire_model,
+    loaded_models,
+    release_model,
+    unload_models,
+)
+
+
+@pytest.fixture
+def whisper():
+    """A stand-in faster_whisper whose WhisperModel counts loads."""
+    module = MagicMock()
+    module.WhisperModel.side_effect = lambda *args, **kwargs: MagicMock()
+    with patch.dict(sys.modules, {"faster_whisper": module}):
+        yield module.WhisperModel
+    unload_models(force=True)
+
+
+class TestModelRegistry:
+    """Tests for the process-wide Whisper model registry"""
+
+    def test_transcribers_share_one_model(self, whisper):
+        first, second = Transcriber("tiny.en"), Transcriber("tiny.en")
+
+        assert first._get_model() is second._get_model()
+        whisper.assert_called_once_with(
+            "tiny.en", device="cpu", compute_type="int8", num_workers=1
+        )
+        assert loaded_models() == [
+            {"model": "tiny.en", "compute_type": "int8", "workers": 1, "refs": 2}
+        ]
+
+    def test_model_outlives_its_transcriber(self, whisper):
+        Transcriber("tiny.en").load()
+        gc.collect()
+
+        assert loaded_models()[0]["refs"] == 0
+        Transcriber("tiny.en").load()
+        assert whisper.call_count == 1
+
+    def test_unload_frees_idle_models_only(self, whisper):
+        kept = Transcriber("small.en")
+        kept.load()
+        Transcriber("tiny.en").load()
+        gc.collect()
+
+        assert unload_models() == 1
+        assert [entry["model"] for entry in loaded_models()] == ["small.en"]
+
+    def test_transcriber_unload(self, whisper):
+        first, second = Transcriber("tiny.en"), Transcriber("tiny.en")
+        first.load()
+        second.load()
+
+        first.unload()
+        assert not first.is_loaded
+        assert loaded_models()[0]["refs"] == 1
+
+        second.unload()
+        assert loaded_models() == []
+        # Unloading twice, or garbage collection afterwards, is harmless.
+        second.unload()
+        del first, second
+        gc.collect()
+
+    def test_concurrent_first_use_loads_once(self, whisper):
+        def slow_load(*args, **kwargs):
+            time.sleep(0.05)
+            return MagicMock()
+
+        whisper.side_effect = slow_load
+        models = []
+        threads = [
+            threading.Thread(target=lambda: models.append(acquire_model("tiny.en")[1]))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert whisper.call_count == 1
+        assert len({id(model) for model in models}) == 1
+        assert loaded_models()[0]["refs"] == 4
+
+    def test_workers_share_the_weights(self, whisper):
+        Transcriber("tiny.en", num_workers=3).load()
+        Transcriber("tiny.en").load()
+
+        # One copy serves three concurrent decodes; a different worker
+        # count is a different CTranslate2 model.
+        assert whisper.call_args_list[0].kwargs["num_workers"] == 3
+        assert [m["workers"] for m in loaded_models()] == [3, 1]
+
+    def test_failed_load_leaves_no_entry(self, whisper):
+        whisper.side_effect = RuntimeError("no such model")
+
+        with pytest.raises(RuntimeError):
+            Transcriber("missing").load()
+        assert stt._models == {}
+
+    def test_release_unknown_key(self):
+        release_model(("gone", "cpu", "int8"))
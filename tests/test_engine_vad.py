@@ -0,0 +1,135 @@
+from unittest.mock import patch
+
+import numpy as np
+
+from engine.audio.vad import (
+    SilenceDetector,
+    frame_features,
+    speech_mask,
+    trim_silence,
+)
+
+RATE = 16000
+
+
+def _noise(seconds, rng):
+    return rng.normal(0, 30, int(RATE * seconds)).astype(np.int16)
+
+
+def _tone(seconds):
+    t = np.arange(int(RATE * seconds)) / RATE
+    return (8000 * np.sin(2 * np.pi * 220 * t)).astype(np.int16)
+
+
+class TestFrameFeatures:
+    """Tests for per-frame energy and zero-crossing rate"""
+
+    def test_one_value_per_frame(self):
+        rms, zcr, frame_len = frame_features(_tone(1.0), RATE, frame_ms=30)
+        assert frame_len == 480
+        assert len(rms) == len(zcr) == RATE // 480
+
+    def test_tone_is_speech_noise_is_not(self):
+        rng = np.random.default_rng(0)
+        samples = np.concatenate([_noise(1.0, rng), _tone(1.0)])
+        rms, zcr, _ = frame_features(samples, RATE)
+
+        mask = speech_mask(rms, zcr)
+        half = len(mask) // 2
+        assert not mask[: half - 1].any()
+        assert mask[half + 1 :].all()
+
+    def test_chunks_match_one_pass(self):
+        rng = np.random.default_rng(4)
+        samples = np.concatenate([_noise(1.0, rng), _tone(1.0), _noise(0.5, rng)])
+        whole = frame_features(samples, RATE)
+
+        # A chunk of 3.5 frames rounds down to 3 frames per pass.
+        with patch("engine.audio.vad.CHUNK_SAMPLES", 1680):
+            chunked = frame_features(samples, RATE)
+
+        np.testing.assert_allclose(chunked[0], whole[0])
+        np.testing.assert_array_equal(chunked[1], whole[1])
+
+
+class TestTrimSilence:
+    """Tests for silence trimming"""
+
+    def test_trims_edges_and_collapses_pauses(self):
+        rng = np.random.default_rng(1)
+        samples = np.concatenate(
+            [_noise(2, rng), _tone(1), _noise(3, rng), _tone(1), _noise(2, rng)]
+        ).reshape(-1, 1)
+
+        trimmed, removed = trim_silence(samples, RATE, padding=0.2, max_pause=0.6)
+
+        assert trimmed.shape[1] == 1 and trimmed.dtype == np.int16
+        assert removed == (len(samples) - len(trimmed)) / RATE
+        # Both tones, their padding and a 0.6 s pause survive.
+        assert 3.0 <= len(trimmed) / RATE <= 3.6
+
+    def test_short_pauses_are_kept(self):
+        rng = np.random.default_rng(2)
+        samples = np.concatenate([_tone(1), _noise(0.3, rng), _tone(1)])
+
+        trimmed, removed = trim_silence(samples, RATE, max_pause=0.6)
+
+        assert removed == 0.0
+        assert trimmed is samples
+
+    def test_speech_throughout_is_kept(self):
+        samples = _tone(2)
+        trimmed, removed = trim_silence(samples, RATE)
+        assert removed == 0.0 and len(trimmed) == len(samples)
+
+    def test_clip_shorter_than_padding(self):
+        rng = np.random.default_rng(5)
+        samples = np.concatenate([_noise(0.1, rng), _tone(0.1), _noise(0.1, rng)])
+
+        trimmed, _ = trim_silence(samples, RATE, padding=0.2)
+
+        assert 0 < len(trimmed) <= len(samples)
+
+    def test_silence_only_comes_back_empty(self):
+        trimmed, removed = trim_silence(_noise(2, np.random.default_rng(3)), RATE)
+        assert len(trimmed) == 0
+        assert removed == 2.0
+
+    def test_empty_input(self):
+        trimmed, removed = trim_silence(np.zeros(0, dtype=np.int16), RATE)
+        assert len(trimmed) == 0 and removed == 0.0
+
+
+class TestSilenceDetector:
+    """Tests for the live silence detector behind auto-stop"""
+
+    def _blocks(self, samples, frames=320):
+        return [samples[i : i + frames, None] for i in range(0, len(samples), frames)]
+
+    def test_fires_after_enough_silence(self):
+        detector = SilenceDetector(RATE, silence_seconds=0.5)
+        rng = np.random.default_rng(4)
+
+        assert not any(detector.update(b) for b in self._blocks(_tone(1)))
+        results = [detector.update(b) for b in self._blocks(_noise(1, rng))]
+
+        # 0.5 s of 20 ms blocks: the 25th quiet block is the first to fire.
+        assert results.index(True) == 24
+        assert all(results[24:])
+
+    def test_speech_resets_the_count(self):
+        detector = SilenceDetector(RATE, silence_seconds=0.5)
+        rng = np.random.default_rng(5)
+        for block in self._blocks(_noise(0.4, rng)):
+            detector.update(block)
+        detector.update(_tone(0.02)[:, None])
+
+        assert detector.silent_frames == 0
+        assert not any(detector.update(b) for b in self._blocks(_noise(0.4, rng)))
+
+    def test_reuses_its_scratch_buffer(self):
+        detector = SilenceDetector(RATE, silence_seconds=1)
+        scratch = detector._scratch
+        for block in self._blocks(_tone(0.5)):
+            detector.update(block)
+        assert detector._scratch is scratch
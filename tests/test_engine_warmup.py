@@ -0,0 +1,88 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from engine.ai import LLMClient
+from engine.main import cmd_warmup
+from engine.stt.transcriber import prefetch_model_files
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+class TestLLMWarmup:
+    """Tests for preloading the Ollama model"""
+
+    def test_warmup_sends_empty_prompt_with_keep_alive(self):
+        llm = LLMClient()
+        with patch.object(llm, "_get_client") as mock_get_client:
+            mock_client = MagicMock()
+            mock_get_client.return_value = mock_client
+            llm.warmup(keep_alive="10m")
+
+        url = mock_client.post.call_args.args[0]
+        payload = mock_client.post.call_args.kwargs["json"]
+        assert url.endswith("/api/generate")
+        assert payload["prompt"] == ""
+        assert payload["keep_alive"] == "10m"
+        assert payload["model"] == "granite4:3b"
+
+
+class TestPrefetch:
+    """Tests for reading model files into the page cache"""
+
+    def test_prefetch_reads_every_file(self, tmp_path):
+        (tmp_path / "model.bin").write_bytes(b"x" * 3000)
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "vocab.json").write_bytes(b"{}")
+
+        assert prefetch_model_files(str(tmp_path), chunk_size=1024) == 3002
+
+
+class TestCmdWarmup:
+    """Tests for the --warmup command"""
+
+    def test_daemon_warmup_loads_transcriber(self):
+        transcriber = MagicMock()
+        llm = MagicMock(model="granite4:3b")
+
+        result = cmd_warmup(transcriber=transcriber, llm=llm, quiet=True)
+
+        transcriber.load.assert_called_once()
+        llm.warmup.assert_called_once()
+        assert result["stt"]["ok"] and result["stt"]["mode"] == "daemon"
+        assert result["llm"]["ok"]
+        assert result["stt"]["seconds"] >= 0
+
+    def test_failures_are_reported_not_raised(self):
+        transcriber = MagicMock()
+        transcriber.load.side_effect = RuntimeError("no model")
+        llm = MagicMock(model="granite4:3b")
+        llm.warmup.side_effect = ConnectionError("refused")
+
+        result = cmd_warmup(transcriber=transcriber, llm=llm, quiet=True)
+
+        assert result["stt"] == {
+            "ok": False,
+            "seconds": result["stt"]["seconds"],
+            "error": "no model",
+        }
+        assert result["llm"]["error"] == "refused"
+
+    def test_cli_prints_report(self, tmp_path):
+        env = {**os.environ, "HOME": str(tmp_path), "USERPROFILE": str(tmp_path)}
+        result = subprocess.run(
+            [sys.executable, "-m", "engine", "--warmup"],
+            capture_output=True,
+            text=True,
+            cwd=PROJECT_ROOT,
+            env=env,
+            timeout=60,
+        )
+
+        assert result.returncode == 0, result.stderr
+        report = json.loads(result.stdout)
+        assert set(report) == {"stt", "llm"}
+        assert "seconds" in report["stt"]
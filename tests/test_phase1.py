@@ -32,6 +32,36 @@ class TestAudioRecorder:
             assert result is True
             assert recorder.is_recording()
 
+    def test_warm_stream_is_reused(self):
+        recorder = AudioRecorder(idle_release=None)
+        with (
+            patch.object(recorder, "_get_sounddevice") as mock_get_sd,
+            patch("app.audio.recorder.ensure_directories"),
+        ):
+            mock_sd = mock_get_sd.return_value
+            for _ in range(2):
+                recorder.start()
+                recorder.stop()
+
+            assert mock_sd.InputStream.call_count == 1
+            mock_sd.InputStream.return_value.close.assert_not_called()
+            recorder.close()
+            mock_sd.InputStream.return_value.close.assert_called_once()
+
+    def test_idle_release_closes_stream(self):
+        recorder = AudioRecorder(idle_release=0.05)
+        with (
+            patch.object(recorder, "_get_sounddevice") as mock_get_sd,
+            patch("app.audio.recorder.ensure_directories"),
+        ):
+            stream = mock_get_sd.return_value.InputStream.return_value
+            recorder.start()
+            recorder.stop()
+            recorder._release_timer.join(1)
+
+        stream.close.assert_called_once()
+        assert recorder._stream is None
+
 
 class TestHotkeyManager:
     """Test hotkey manager functionality."""
@@ -30,6 +30,37 @@ class TestTranscriber:
         assert hasattr(transcriber, "transcribe_async")
         assert callable(transcriber.transcribe_async)
 
+    def test_recordings_reuse_loaded_model(self):
+        import sys
+        from app.stt.transcriber import unload_models
+
+        whisper = MagicMock()
+        whisper.WhisperModel.side_effect = lambda *args, **kwargs: MagicMock()
+        with patch.dict(sys.modules, {"faster_whisper": whisper}):
+            # One Transcriber per recording, as main.on_audio_ready does.
+            first = Transcriber("tiny.en")._get_model()
+            second = Transcriber("tiny.en")._get_model()
+
+            assert first is second
+            assert whisper.WhisperModel.call_count == 1
+            assert unload_models() == 1
+            Transcriber("tiny.en")._get_model()
+            assert whisper.WhisperModel.call_count == 2
+        unload_models()
+
+    def test_unload_releases_model(self):
+        import sys
+        from app.stt import transcriber as module
+
+        whisper = MagicMock()
+        with patch.dict(sys.modules, {"faster_whisper": whisper}):
+            transcriber = Transcriber("tiny.en")
+            transcriber._get_model()
+            transcriber.unload()
+
+        assert transcriber._model is None
+        assert module._models == {}
+
 
 class TestSpool:
     """Test spool functionality."""